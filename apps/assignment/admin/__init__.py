@@ -1,2 +1,3 @@
 from .assignment import AssignmentAdmin
+from .reminders import DeadlineReminderAdmin
 from .task import TaskAdmin
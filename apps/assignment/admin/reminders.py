@@ -0,0 +1,44 @@
+from django.contrib import admin
+
+from apps.core.admin import BaseAdmin
+
+from .. import models
+
+
+@admin.register(models.DeadlineReminder)
+class DeadlineReminderAdmin(BaseAdmin):
+    """Admin UI for DeadlineReminder model."""
+
+    ordering = (
+        "-id",
+    )
+    list_display = (
+        "id",
+        "user",
+        "task",
+        "assignment",
+        "window",
+        "created",
+    )
+    list_select_related = (
+        "user",
+        "task",
+        "assignment",
+    )
+    raw_id_fields = (
+        "user",
+        "task",
+        "assignment",
+    )
+    fieldsets = (
+        (
+            None, {
+                "fields": (
+                    "user",
+                    "task",
+                    "assignment",
+                    "window",
+                ),
+            },
+        ),
+    )
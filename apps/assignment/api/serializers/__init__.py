@@ -1,2 +1,33 @@
+from .analytics import (
+    BurndownDaySerializer,
+    BurndownSerializer,
+    StatusAnalyticsQuerySerializer,
+    StatusAnalyticsSerializer,
+    TimeInStatusSerializer,
+    WorkloadAssigneeSerializer,
+    WorkloadSerializer,
+)
 from .assignment import AssignmentSerializer
-from .task import TaskCompletedPercentSerializer, TaskSerializer
+from .calendar import (
+    CalendarAssignmentSerializer,
+    CalendarQuerySerializer,
+    CalendarSerializer,
+    CalendarTaskSerializer,
+)
+from .dashboard import DashboardSerializer, DashboardTasksSerializer
+from .task import (
+    TaskBulkUpdateSerializer,
+    TaskCompletedPercentGroupSerializer,
+    TaskCompletedPercentQuerySerializer,
+    TaskCompletedPercentSerializer,
+    TaskListSerializer,
+    TaskSerializer,
+    TaskTransitionResultSerializer,
+    TaskTransitionSerializer,
+)
+from .task_counters import (
+    TaskCountersField,
+    TaskStatsField,
+    TaskStatsSerializer,
+    TaskStatusCountsSerializer,
+)
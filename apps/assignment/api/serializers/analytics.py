@@ -0,0 +1,164 @@
+from django.conf import settings
+from django.utils import timezone
+
+from rest_framework import serializers
+
+from ... import constants
+from .task_counters import TaskStatusCountsSerializer
+
+
+class StatusAnalyticsQuerySerializer(serializers.Serializer):
+    """Serializer for query params of status analytics of assignment."""
+
+    to = serializers.DateTimeField(
+        required=False,
+        help_text="End of time window (inclusive), now by default.",
+    )
+
+    def get_fields(self) -> dict[str, serializers.Field]:
+        """Add `from` field, which can't be declared as attribute."""
+        return {
+            "from": serializers.DateTimeField(
+                required=False,
+                help_text="Start of time window (inclusive), "
+                f"{settings.STATUS_ANALYTICS_DEFAULT_WINDOW.days} days "
+                "before its end by default.",
+            ),
+            **super().get_fields(),
+        }
+
+    def validate(self, attrs: dict) -> dict:
+        """Fill in default time window and check it's not reversed."""
+        attrs.setdefault("to", timezone.now())
+        attrs.setdefault(
+            "from",
+            attrs["to"] - settings.STATUS_ANALYTICS_DEFAULT_WINDOW,
+        )
+        if attrs["to"] < attrs["from"]:
+            raise serializers.ValidationError(
+                {"to": "End of time window must not be before its start."},
+            )
+        return attrs
+
+
+class TimeInStatusSerializer(serializers.Serializer):
+    """Serializer for representing time tasks spend in status."""
+
+    status = serializers.ChoiceField(
+        choices=constants.TaskStatus.choices,
+        read_only=True,
+    )
+    count = serializers.IntegerField(
+        read_only=True,
+        help_text="Number of times tasks got status within time window.",
+    )
+    average_time_in_status = serializers.FloatField(
+        read_only=True,
+        allow_null=True,
+        help_text="Average seconds tasks stay in status, tasks which are "
+        "still in status are counted up to now. Null for finished statuses "
+        "tasks never left.",
+    )
+
+
+class StatusAnalyticsSerializer(serializers.Serializer):
+    """Serializer for representing status analytics of assignment."""
+
+    to = serializers.DateTimeField(
+        read_only=True,
+    )
+    statuses = TimeInStatusSerializer(
+        many=True,
+        read_only=True,
+    )
+    cycle_time = serializers.FloatField(
+        read_only=True,
+        allow_null=True,
+        help_text="Average seconds between start of tasks (moving to in "
+        "progress) and their completion within time window.",
+    )
+    throughput = serializers.IntegerField(
+        read_only=True,
+        help_text="Number of tasks completed within time window.",
+    )
+
+    def get_fields(self) -> dict[str, serializers.Field]:
+        """Add `from` field, which can't be declared as attribute."""
+        return {
+            "from": serializers.DateTimeField(read_only=True),
+            **super().get_fields(),
+        }
+
+
+class BurndownDaySerializer(serializers.Serializer):
+    """Serializer for representing day of burndown of assignment."""
+
+    day = serializers.DateField(
+        read_only=True,
+    )
+    remaining = serializers.IntegerField(
+        read_only=True,
+        help_text="Number of unfinished tasks at the end of day.",
+    )
+    completed = serializers.IntegerField(
+        read_only=True,
+        help_text="Number of completed tasks at the end of day.",
+    )
+
+
+class BurndownSerializer(serializers.Serializer):
+    """Serializer for representing burndown of assignment."""
+
+    start = serializers.DateField(
+        read_only=True,
+        help_text="Start of assignment or its creation if start is not set.",
+    )
+    deadline = serializers.DateField(
+        read_only=True,
+        allow_null=True,
+    )
+    days = BurndownDaySerializer(
+        many=True,
+        read_only=True,
+        help_text="Days from start till deadline or today, whichever is "
+        "earlier.",
+    )
+
+
+class WorkloadAssigneeSerializer(serializers.Serializer):
+    """Serializer for representing assignee in workload."""
+
+    id = serializers.IntegerField(read_only=True)
+    first_name = serializers.CharField(read_only=True)
+    last_name = serializers.CharField(read_only=True)
+    email = serializers.EmailField(read_only=True)
+
+
+class WorkloadSerializer(serializers.Serializer):
+    """Serializer for representing workload of assignee."""
+
+    assignee = serializers.IntegerField(
+        read_only=True,
+        allow_null=True,
+        help_text="Id of assignee, null for tasks without assignee.",
+    )
+    assignee_data = WorkloadAssigneeSerializer(
+        read_only=True,
+        allow_null=True,
+    )
+    counts = TaskStatusCountsSerializer(
+        read_only=True,
+        help_text="Number of tasks per status.",
+    )
+    total = serializers.IntegerField(
+        read_only=True,
+    )
+    overdue = serializers.IntegerField(
+        read_only=True,
+        help_text="Number of unfinished tasks which end is in the past.",
+    )
+    next_due = serializers.DateTimeField(
+        read_only=True,
+        allow_null=True,
+        help_text="Nearest end of unfinished task in the future.",
+    )
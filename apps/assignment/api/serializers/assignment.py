@@ -2,6 +2,7 @@ from apps.core.api.serializers import ModelBaseSerializer
 from apps.users.api.serializers import UserSerializer
 
 from ... import models
+from .task_counters import TaskCountersField, TaskStatsField
 
 
 class AssignmentSerializer(ModelBaseSerializer):
@@ -11,6 +12,14 @@ class AssignmentSerializer(ModelBaseSerializer):
         source="creator",
         read_only=True,
     )
+    task_counters = TaskCountersField(
+        help_text="Count of tasks per status. Included only when requested "
+        "with `expand=task_counters`.",
+    )
+    task_stats = TaskStatsField(
+        help_text="Count of tasks and nearest due date of unfinished task. "
+        "Included only when requested with `expand=task_stats`.",
+    )
 
     class Meta:
         model = models.Assignment
@@ -23,4 +32,10 @@ class AssignmentSerializer(ModelBaseSerializer):
             "deadline",
             "created",
             "modified",
+            "task_counters",
+            "task_stats",
+        )
+        expandable_fields = (
+            "task_counters",
+            "task_stats",
         )
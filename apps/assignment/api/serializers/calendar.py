@@ -0,0 +1,85 @@
+from django.conf import settings
+
+from rest_framework import serializers
+
+from apps.core.api.serializers import ModelBaseSerializer
+
+from ... import models
+
+
+class CalendarQuerySerializer(serializers.Serializer):
+    """Serializer for query params of calendar."""
+
+    to = serializers.DateTimeField(
+        help_text="End of time window (inclusive).",
+    )
+
+    def get_fields(self) -> dict[str, serializers.Field]:
+        """Add `from` field, which can't be declared as attribute."""
+        return {
+            "from": serializers.DateTimeField(
+                help_text="Start of time window (inclusive).",
+            ),
+            **super().get_fields(),
+        }
+
+    def validate(self, attrs: dict) -> dict:
+        """Check that time window is not reversed and not too long."""
+        if attrs["to"] < attrs["from"]:
+            raise serializers.ValidationError(
+                {"to": "End of time window must not be before its start."},
+            )
+        if attrs["to"] - attrs["from"] > settings.CALENDAR_MAX_WINDOW:
+            raise serializers.ValidationError(
+                {
+                    "to": "Time window must not be longer than "
+                    f"{settings.CALENDAR_MAX_WINDOW.days} days.",
+                },
+            )
+        return attrs
+
+
+class CalendarTaskSerializer(ModelBaseSerializer):
+    """Serializer for representing task in calendar."""
+
+    class Meta:
+        model = models.Task
+        fields = (
+            "id",
+            "assignment",
+            "title",
+            "status",
+            "start",
+            "end",
+        )
+        read_only_fields = fields
+
+
+class CalendarAssignmentSerializer(ModelBaseSerializer):
+    """Serializer for representing assignment in calendar."""
+
+    class Meta:
+        model = models.Assignment
+        fields = (
+            "id",
+            "title",
+            "start",
+            "deadline",
+        )
+        read_only_fields = fields
+
+
+class CalendarSerializer(serializers.Serializer):
+    """Serializer for representing calendar of user."""
+
+    tasks = CalendarTaskSerializer(
+        many=True,
+        read_only=True,
+        help_text="Tasks assigned to or created by user, ordered by start.",
+    )
+    assignments = CalendarAssignmentSerializer(
+        many=True,
+        read_only=True,
+        help_text="Assignments created by user or with tasks assigned to "
+        "user, ordered by start.",
+    )
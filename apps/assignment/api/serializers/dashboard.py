@@ -0,0 +1,40 @@
+from rest_framework import serializers
+
+from apps.users.api.serializers import UserSerializer
+
+from .calendar import CalendarAssignmentSerializer, CalendarTaskSerializer
+from .task_counters import TaskStatusCountsSerializer
+
+
+class DashboardTasksSerializer(serializers.Serializer):
+    """Serializer for representing open tasks of user per status."""
+
+    backlog = CalendarTaskSerializer(many=True, read_only=True)
+    ready = CalendarTaskSerializer(many=True, read_only=True)
+    in_progress = CalendarTaskSerializer(many=True, read_only=True)
+    ready_for_review = CalendarTaskSerializer(many=True, read_only=True)
+
+
+class DashboardSerializer(serializers.Serializer):
+    """Serializer for representing dashboard of user."""
+
+    profile = UserSerializer(
+        read_only=True,
+    )
+    assignments = CalendarAssignmentSerializer(
+        many=True,
+        read_only=True,
+        help_text="Upcoming assignments created by user or with tasks "
+        "assigned to user, ordered by deadline.",
+    )
+    tasks = DashboardTasksSerializer(
+        read_only=True,
+        help_text="Open tasks assigned to user per status, ordered by end.",
+    )
+    task_counts = TaskStatusCountsSerializer(
+        read_only=True,
+        help_text="Number of tasks assigned to user per status.",
+    )
+    percent_completed = serializers.IntegerField(
+        read_only=True,
+    )
@@ -1,12 +1,38 @@
+from django.conf import settings
+
 from rest_framework import serializers
 
-from apps.core.api.serializers import ModelBaseSerializer
+from apps.core.api.serializers import BulkListSerializer, ModelBaseSerializer
 from apps.users.api.serializers import UserSerializer
 
-from ... import models
+from ... import constants, models, services
 from .assignment import AssignmentSerializer
 
 
+class TaskListSerializer(BulkListSerializer):
+    """Serializer for creating and updating tasks in bulk."""
+
+    def perform_bulk_create(
+        self,
+        instances: list[models.Task],
+    ) -> list[models.Task]:
+        """Create tasks and update assignment task counters."""
+        return services.bulk_create_tasks(instances)
+
+    def perform_bulk_update(
+        self,
+        instances: list[models.Task],
+        fields: list[str],
+    ) -> list[models.Task]:
+        """Update tasks and update assignment task counters."""
+        request = self.context.get("request")
+        return services.bulk_update_tasks(
+            instances,
+            fields,
+            actor=getattr(request, "user", None),
+        )
+
+
 class TaskSerializer(ModelBaseSerializer):
     """Serializer for Task model."""
 
@@ -40,6 +66,91 @@ class TaskSerializer(ModelBaseSerializer):
             "created",
             "modified",
         )
+        extra_kwargs = {
+            "assignment": {
+                "queryset": models.Assignment.objects.filter(
+                    is_deleting=False,
+                ),
+            },
+        }
+        list_serializer_class = TaskListSerializer
+
+    def update(
+        self,
+        instance: models.Task,
+        validated_data: dict,
+    ) -> models.Task:
+        """Update task and remember who changes its status."""
+        if self._request:
+            instance.status_changed_by = self._request.user
+        return super().update(instance, validated_data)
+
+
+class TaskBulkUpdateSerializer(TaskSerializer):
+    """Serializer for documenting items of tasks bulk update."""
+
+    id = serializers.IntegerField(
+        help_text="Id of task to update.",
+    )
+
+
+class TaskTransitionSerializer(serializers.Serializer):
+    """Serializer for moving tasks to new status."""
+
+    status = serializers.ChoiceField(
+        choices=constants.TaskStatus.choices,
+    )
+    ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        allow_empty=False,
+        max_length=settings.TASK_TRANSITION_MAX_IDS,
+        help_text="Ids of tasks to move, at most "
+        f"{settings.TASK_TRANSITION_MAX_IDS}. All filtered tasks are moved "
+        "by default, so either ids or filters (or search) are required.",
+    )
+
+
+class TaskTransitionResultSerializer(serializers.Serializer):
+    """Serializer for representing tasks moved to new status."""
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        read_only=True,
+        help_text="Ids of tasks which were moved. Tasks which can't be moved "
+        "from their status to the new one are skipped.",
+    )
+
+
+class TaskCompletedPercentQuerySerializer(serializers.Serializer):
+    """Serializer for query params of percent completed for Task model."""
+
+    group_by = serializers.ChoiceField(
+        choices=constants.TaskProgressGroupBy.choices,
+        required=False,
+        help_text="Calculate percent completed per assignment, assignee or "
+        "status in addition to overall percent.",
+    )
+
+
+class TaskCompletedPercentGroupSerializer(serializers.Serializer):
+    """Serializer for representing percent completed of group of tasks."""
+
+    key = serializers.CharField(
+        read_only=True,
+        allow_null=True,
+        help_text="Id of assignment, id of assignee or status of tasks, "
+        "depending on `group_by`.",
+    )
+    completed = serializers.IntegerField(
+        read_only=True,
+    )
+    total = serializers.IntegerField(
+        read_only=True,
+    )
+    percent_completed = serializers.IntegerField(
+        read_only=True,
+    )
 
 
 class TaskCompletedPercentSerializer(serializers.Serializer):
@@ -48,3 +159,8 @@ class TaskCompletedPercentSerializer(serializers.Serializer):
     percent_completed = serializers.IntegerField(
         read_only=True,
     )
+    groups = TaskCompletedPercentGroupSerializer(
+        many=True,
+        read_only=True,
+        help_text="Present only when `group_by` is provided.",
+    )
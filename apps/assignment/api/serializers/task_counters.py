@@ -0,0 +1,103 @@
+import collections.abc
+
+from rest_framework import serializers
+from rest_framework.fields import SkipField
+
+from drf_spectacular.utils import extend_schema_field
+
+from ... import constants, models, services
+
+
+class TaskStatusCountsSerializer(serializers.Serializer):
+    """Serializer for representing count of tasks per status."""
+
+    backlog = serializers.IntegerField()
+    ready = serializers.IntegerField()
+    in_progress = serializers.IntegerField()
+    ready_for_review = serializers.IntegerField()
+    completed = serializers.IntegerField()
+    canceled = serializers.IntegerField()
+
+
+class TaskStatsSerializer(serializers.Serializer):
+    """Serializer for representing stats of tasks of assignment."""
+
+    total = serializers.IntegerField(
+        help_text="Count of all tasks.",
+    )
+    counts = TaskStatusCountsSerializer()
+    next_due = serializers.DateTimeField(
+        allow_null=True,
+        help_text="Nearest end of unfinished task in the future.",
+    )
+
+
+def get_task_counts(
+    counters: collections.abc.Iterable[models.AssignmentTaskCounter],
+) -> dict[str, int]:
+    """Get count of tasks per each status from counters."""
+    counts = dict.fromkeys(constants.TaskStatus.values, 0)
+    counts.update((counter.status, counter.count) for counter in counters)
+    return counts
+
+
+@extend_schema_field(TaskStatusCountsSerializer)
+class TaskCountersField(serializers.Field):
+    """Represent assignment task counters as count of tasks per status.
+
+    Field is skipped if counters were not prefetched, so it never makes a
+    query per assignment.
+
+    """
+
+    def __init__(self, **kwargs) -> None:
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def get_attribute(self, instance: models.Assignment):
+        """Get prefetched counters or skip field."""
+        prefetched_objects = getattr(instance, "_prefetched_objects_cache", {})
+        if self.source not in prefetched_objects:
+            raise SkipField
+        return super().get_attribute(instance).all()
+
+    def to_representation(self, value):
+        """Represent counters as count per each status."""
+        return get_task_counts(value)
+
+
+@extend_schema_field(TaskStatsSerializer)
+class TaskStatsField(serializers.Field):
+    """Represent stats of assignment's tasks from prefetched counters.
+
+    Field is skipped if assignment wasn't annotated with
+    `services.annotate_task_stats`, so it never makes a query per
+    assignment.
+
+    """
+
+    def __init__(self, **kwargs) -> None:
+        kwargs["read_only"] = True
+        kwargs["source"] = "*"
+        super().__init__(**kwargs)
+
+    def get_attribute(self, instance: models.Assignment):
+        """Get annotated assignment or skip field."""
+        next_due = services.get_task_stats_annotation("next_due")
+        if not hasattr(instance, next_due):
+            raise SkipField
+        return instance
+
+    def to_representation(self, value: models.Assignment):
+        """Represent prefetched counters and annotated next due date."""
+        counts = get_task_counts(value.task_counters.all())
+        return TaskStatsSerializer(
+            {
+                "total": sum(counts.values()),
+                "counts": counts,
+                "next_due": getattr(
+                    value,
+                    services.get_task_stats_annotation("next_due"),
+                ),
+            },
+        ).data
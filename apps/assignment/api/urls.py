@@ -5,4 +5,6 @@ from . import views
 router = DefaultRouter()
 router.register(r"assignments", views.AssignmentViewSet)
 router.register(r"tasks", views.TaskViewSet)
+router.register(r"calendar", views.CalendarViewSet, basename="calendar")
+router.register(r"dashboard", views.DashboardViewSet, basename="dashboard")
 urlpatterns = router.urls
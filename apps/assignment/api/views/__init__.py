@@ -1,2 +1,4 @@
 from .assignment import AssignmentViewSet
+from .calendar import CalendarViewSet
+from .dashboard import DashboardViewSet
 from .task import TaskViewSet
@@ -1,17 +1,32 @@
 from django.utils.translation import gettext_lazy as _
 
-from rest_framework import mixins, response, status
+from rest_framework import decorators, mixins, response, status
 from rest_framework.permissions import IsAuthenticated
 
-from apps.core.api.mixins import UpdateModelWithoutPatchMixin
+from drf_spectacular.utils import OpenApiResponse, extend_schema
+
+from apps.core.api.mixins import (
+    BatchRetrieveMixin,
+    ConditionalGetMixin,
+    ExportMixin,
+    ResponseCacheMixin,
+    UpdateModelWithoutPatchMixin,
+    ValuesListMixin,
+)
 from apps.core.api.views import BaseViewSet
+from apps.users import models as users_models
 from apps.users.permissions import IsAdmin, IsLecturer
 
-from ... import filters, models
+from ... import filters, models, services
 from .. import serializers
 
 
 class AssignmentViewSet(
+    ResponseCacheMixin,
+    ConditionalGetMixin,
+    ExportMixin,
+    BatchRetrieveMixin,
+    ValuesListMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
@@ -21,7 +36,9 @@ class AssignmentViewSet(
 ):
     """Api viewset for Assignment model."""
 
-    queryset = models.Assignment.objects.all().select_related(
+    queryset = models.Assignment.objects.filter(
+        is_deleting=False,
+    ).select_related(
         "creator",
     )
     serializer_class = serializers.AssignmentSerializer
@@ -35,14 +52,36 @@ class AssignmentViewSet(
     }
     search_fields = (
         "title",
+        "description",
         "creator__email",
     )
+    search_vector_field = "search_vector"
     ordering_fields = (
         "start",
         "deadline",
         "created",
     )
     filterset_class = filters.AssignmentFilter
+    conditional_get_modified_fields = (
+        "modified",
+        "creator__modified",
+        "creator__last_login",
+    )
+    response_cache_models = (
+        models.Assignment,
+        models.AssignmentTaskCounter,
+        models.Task,
+        users_models.User,
+    )
+
+    def filter_queryset(self, queryset):
+        """Annotate stats of tasks if they're requested."""
+        queryset = super().filter_queryset(queryset)
+        if self.action in self.sparse_fieldsets_actions and (
+            "task_stats" in self.get_serializer().fields
+        ):
+            queryset = services.annotate_task_stats(queryset)
+        return queryset
 
     def create(self, request, *args, **kwargs):
         """Create a new assignment."""
@@ -57,8 +96,21 @@ class AssignmentViewSet(
             headers=headers,
         )
 
+    @extend_schema(
+        responses={
+            202: OpenApiResponse(
+                description="Assignment has many tasks, it will be deleted "
+                "in background.",
+            ),
+            204: None,
+        },
+    )
     def destroy(self, request, *args, **kwargs):
-        """Delete an assignment."""
+        """Delete an assignment.
+
+        Assignments with many tasks are deleted in background.
+
+        """
         instance: models.Assignment = self.get_object()
         if instance.creator != request.user:
             return response.Response(
@@ -70,5 +122,63 @@ class AssignmentViewSet(
                 },
                 status=status.HTTP_403_FORBIDDEN,
             )
-        self.perform_destroy(instance)
+        if services.delete_assignment(instance):
+            return response.Response(status=status.HTTP_202_ACCEPTED)
         return response.Response(status=status.HTTP_204_NO_CONTENT)
+
+    @extend_schema(
+        parameters=[
+            serializers.StatusAnalyticsQuerySerializer,
+        ],
+        responses={
+            200: serializers.StatusAnalyticsSerializer(),
+        },
+    )
+    @decorators.action(
+        detail=True,
+        methods=["GET"],
+        url_path="status-analytics",
+        url_name="status_analytics",
+    )
+    def status_analytics(self, request, *args, **kwargs):
+        """Get time-in-status, cycle time and throughput of tasks.
+
+        Analytics are calculated from status history of assignment's tasks
+        within time window with a single query.
+
+        """
+        query_serializer = serializers.StatusAnalyticsQuerySerializer(
+            data=request.query_params,
+        )
+        query_serializer.is_valid(raise_exception=True)
+        serializer = serializers.StatusAnalyticsSerializer(
+            services.get_status_analytics(
+                assignment=self.get_object(),
+                start=query_serializer.validated_data["from"],
+                end=query_serializer.validated_data["to"],
+            ),
+        )
+        return response.Response(serializer.data)
+
+    @extend_schema(
+        responses={
+            200: serializers.BurndownSerializer(),
+        },
+    )
+    @decorators.action(
+        detail=True,
+        methods=["GET"],
+        url_path="burndown",
+        url_name="burndown",
+    )
+    def burndown(self, request, *args, **kwargs):
+        """Get daily series of remaining and completed tasks.
+
+        Series is counted by a single query, past days are cached, so
+        usually only today is counted.
+
+        """
+        serializer = serializers.BurndownSerializer(
+            services.get_burndown(self.get_object()),
+        )
+        return response.Response(serializer.data)
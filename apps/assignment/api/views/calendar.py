@@ -0,0 +1,49 @@
+from rest_framework import response
+from rest_framework.permissions import IsAuthenticated
+
+from drf_spectacular.utils import extend_schema
+
+from apps.core.api.views import BaseViewSet
+
+from ... import services
+from .. import serializers
+
+
+class CalendarViewSet(BaseViewSet):
+    """Api viewset for calendar of current user."""
+
+    base_permission_classes = (
+        IsAuthenticated,
+    )
+    serializer_class = serializers.CalendarSerializer
+    pagination_class = None
+    filter_backends = ()
+
+    @extend_schema(
+        parameters=[
+            serializers.CalendarQuerySerializer,
+        ],
+        responses={
+            200: serializers.CalendarSerializer(),
+        },
+    )
+    def list(self, request, *args, **kwargs) -> response.Response:
+        """Get tasks and assignments overlapping time window.
+
+        Replaces loading of all tasks to filter them by dates on client:
+        both tasks and assignments of current user are returned at once,
+        they're found by GiST indexes of their periods.
+
+        """
+        query_serializer = serializers.CalendarQuerySerializer(
+            data=request.query_params,
+        )
+        query_serializer.is_valid(raise_exception=True)
+        serializer = self.get_serializer(
+            services.get_calendar(
+                user=request.user,
+                start=query_serializer.validated_data["from"],
+                end=query_serializer.validated_data["to"],
+            ),
+        )
+        return response.Response(serializer.data)
@@ -0,0 +1,64 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from rest_framework import response
+from rest_framework.permissions import IsAuthenticated
+
+from drf_spectacular.utils import extend_schema
+
+from apps.core.api.views import BaseViewSet
+from apps.users import models as users_models
+from libs.api import response_cache
+
+from ... import models, services
+from .. import serializers
+
+
+class DashboardViewSet(BaseViewSet):
+    """Api viewset for dashboard of current user."""
+
+    base_permission_classes = (
+        IsAuthenticated,
+    )
+    serializer_class = serializers.DashboardSerializer
+    pagination_class = None
+    filter_backends = ()
+    # Models which invalidate cached dashboards on change, check
+    # `libs.api.response_cache`
+    dashboard_cache_models = (
+        models.Task,
+        models.Assignment,
+        users_models.User,
+    )
+
+    @extend_schema(
+        responses={
+            200: serializers.DashboardSerializer(),
+        },
+    )
+    def list(self, request, *args, **kwargs) -> response.Response:
+        """Get profile, upcoming assignments, open tasks and progress.
+
+        Replaces separate requests of landing page: everything is loaded
+        with a fixed number of queries and cached per user for a short time.
+
+        """
+        key = ":".join(
+            (
+                "dashboard",
+                str(request.user.pk),
+                *map(
+                    str,
+                    response_cache.get_generations(
+                        self.dashboard_cache_models,
+                    ),
+                ),
+            ),
+        )
+        data = cache.get(key)
+        if data is None:
+            data = self.get_serializer(
+                services.get_dashboard(request.user),
+            ).data
+            cache.set(key, data, settings.DASHBOARD_CACHE_TIMEOUT)
+        return response.Response(data)
@@ -1,20 +1,31 @@
-
-from django.db import models
-
 from rest_framework import decorators, mixins, response, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 
 from drf_spectacular.utils import extend_schema
 
-from apps.core.api.mixins import UpdateModelWithoutPatchMixin
+from apps.core.api.mixins import (
+    BatchRetrieveMixin,
+    ConditionalGetMixin,
+    ExportMixin,
+    ResponseCacheMixin,
+    UpdateModelWithoutPatchMixin,
+    ValuesListMixin,
+)
 from apps.core.api.views import BaseViewSet
+from apps.users import models as users_models
 
-from ... import constants, filters
+from ... import filters, services
 from ... import models as assignment_model
 from .. import serializers
 
 
 class TaskViewSet(
+    ResponseCacheMixin,
+    ConditionalGetMixin,
+    ExportMixin,
+    BatchRetrieveMixin,
+    ValuesListMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
@@ -26,6 +37,7 @@ class TaskViewSet(
 
     queryset = assignment_model.Task.objects.all().select_related(
         "assignment",
+        "assignment__creator",
         "creator",
         "assignee",
     )
@@ -35,15 +47,32 @@ class TaskViewSet(
     )
     search_fields = (
         "title",
+        "description",
         "assignment__title",
         "assignee__email",
     )
+    search_vector_field = "search_vector"
     ordering_fields = (
         "start",
         "end",
         "created",
     )
     filterset_class = filters.TaskFilter
+    conditional_get_modified_fields = (
+        "modified",
+        "assignment__modified",
+        "assignment__creator__modified",
+        "assignment__creator__last_login",
+        "creator__modified",
+        "creator__last_login",
+        "assignee__modified",
+        "assignee__last_login",
+    )
+    response_cache_models = (
+        assignment_model.Task,
+        assignment_model.Assignment,
+        users_models.User,
+    )
 
     def create(self, request, *args, **kwargs) -> response.Response:
         """Create a new task."""
@@ -58,6 +87,101 @@ class TaskViewSet(
             headers=headers,
         )
 
+    @extend_schema(
+        request=serializers.TaskSerializer(many=True),
+        responses={
+            201: serializers.TaskSerializer(many=True),
+        },
+    )
+    @decorators.action(
+        detail=False,
+        methods=["POST"],
+        url_path="bulk",
+        url_name="bulk",
+    )
+    def bulk_create(self, request, *args, **kwargs) -> response.Response:
+        """Create tasks in bulk.
+
+        All tasks are validated together and created with a single query.
+        If any task is invalid, nothing is created and errors are returned
+        per each task in the same order.
+
+        """
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save(creator=request.user)
+        return response.Response(
+            serializer.data,
+            status=status.HTTP_201_CREATED,
+        )
+
+    @extend_schema(
+        request=serializers.TaskBulkUpdateSerializer(many=True),
+        responses={
+            200: serializers.TaskSerializer(many=True),
+        },
+    )
+    @bulk_create.mapping.put
+    def bulk_update(self, request, *args, **kwargs) -> response.Response:
+        """Update tasks in bulk.
+
+        Each task must contain `id` of task to update. Tasks are locked until
+        all of them are updated with a single query. If any task is invalid,
+        nothing is updated and errors are returned per each task.
+
+        """
+        serializer = self.get_serializer(
+            self.get_queryset().select_for_update(of=("self",)),
+            data=request.data,
+            many=True,
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return response.Response(serializer.data)
+
+    @extend_schema(
+        request=serializers.TaskTransitionSerializer(),
+        responses={
+            200: serializers.TaskTransitionResultSerializer(),
+        },
+    )
+    @decorators.action(
+        detail=False,
+        methods=["POST"],
+        url_path="transition",
+        url_name="transition",
+    )
+    def transition(self, request, *args, **kwargs) -> response.Response:
+        """Move tasks to new status.
+
+        Tasks are given by `ids` or by filters and search, request without
+        both of them is rejected. Tasks are moved with a single query, which
+        skips tasks which can't be moved to the new status according to
+        allowed status transitions.
+
+        """
+        serializer = serializers.TaskTransitionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        queryset = self.filter_queryset(self.get_queryset())
+        if "ids" in serializer.validated_data:
+            queryset = queryset.filter(pk__in=serializer.validated_data["ids"])
+        elif not queryset.query.has_filters():
+            # Neither filters nor search were applied, so all tasks would
+            # be moved
+            raise ValidationError(
+                {"ids": "Ids are required if tasks are not filtered."},
+            )
+        result_serializer = serializers.TaskTransitionResultSerializer(
+            {
+                "ids": services.transition_tasks(
+                    queryset=queryset,
+                    status=serializer.validated_data["status"],
+                    actor=request.user,
+                ),
+            },
+        )
+        return response.Response(result_serializer.data)
+
     def destroy(self, request, *args, **kwargs) -> response.Response:
         """Delete a task."""
         instance: assignment_model.Task = self.get_object()
@@ -69,8 +193,10 @@ class TaskViewSet(
         self.perform_destroy(instance)
         return response.Response(status=status.HTTP_204_NO_CONTENT)
 
-
     @extend_schema(
+        parameters=[
+            serializers.TaskCompletedPercentQuerySerializer,
+        ],
         responses={
             200: serializers.TaskCompletedPercentSerializer(),
         },
@@ -87,28 +213,47 @@ class TaskViewSet(
         *args,
         **kwargs,
     ) -> response.Response:
-        """Get percent completed for all tasks."""
-        queryset: models.BaseManager[assignment_model.Task] = (
-            self.get_queryset()
+        """Get percent completed for filtered tasks.
+
+        Percent is calculated with a single query, which respects filters and
+        search. Optionally it can be grouped by assignment, assignee or status.
+
+        """
+        query_serializer = serializers.TaskCompletedPercentQuerySerializer(
+            data=request.query_params,
         )
+        query_serializer.is_valid(raise_exception=True)
         serializer = serializers.TaskCompletedPercentSerializer(
-            {
-                "percent_completed": round(
-                    sum(
-                        1 for task in queryset
-                        if task.status == constants.TaskStatus.COMPLETED
-                    )
-                    / (
-                        sum(
-                            1 for task in queryset
-                            if task.status in (
-                                constants.TaskStatus.COMPLETED,
-                                constants.TaskStatus.IN_PROGRESS,
-                                constants.TaskStatus.READY_FOR_REVIEW,
-                            )
-                        ) or 1
-                    ) * 100,
-                ),
-            },
+            services.get_tasks_progress(
+                queryset=self.filter_queryset(self.get_queryset()),
+                group_by=query_serializer.validated_data.get("group_by"),
+            ),
+        )
+        return response.Response(serializer.data)
+
+    @extend_schema(
+        responses={
+            200: serializers.WorkloadSerializer(many=True),
+        },
+    )
+    @decorators.action(
+        detail=False,
+        methods=["GET"],
+        url_path="workload",
+        url_name="workload",
+        pagination_class=None,
+    )
+    def workload(self, request, *args, **kwargs) -> response.Response:
+        """Get workload of each assignee of filtered tasks.
+
+        Tasks are counted per assignee and status, overdue tasks and next
+        due date are calculated too, all with a single grouped query which
+        respects filters and search. Assignees are ordered by number of
+        completed tasks.
+
+        """
+        serializer = serializers.WorkloadSerializer(
+            services.get_workload(self.filter_queryset(self.get_queryset())),
+            many=True,
         )
         return response.Response(serializer.data)
@@ -7,3 +7,6 @@ class AssignmentAppConfig(AppConfig):
 
     name = "apps.assignment"
     verbose_name = _("Assignment")
+
+    def ready(self) -> None:
+        from . import signals  # noqa: F401
@@ -10,3 +10,52 @@ class TaskStatus(models.TextChoices):
     READY_FOR_REVIEW = "ready_for_review", "Ready for Review"
     COMPLETED = "completed", "Completed"
     CANCELED = "canceled", "Canceled"
+
+
+# Statuses to which task can be moved from each status
+TASK_STATUS_TRANSITIONS: dict[str, tuple[str, ...]] = {
+    TaskStatus.BACKLOG: (
+        TaskStatus.READY,
+        TaskStatus.CANCELED,
+    ),
+    TaskStatus.READY: (
+        TaskStatus.BACKLOG,
+        TaskStatus.IN_PROGRESS,
+        TaskStatus.CANCELED,
+    ),
+    TaskStatus.IN_PROGRESS: (
+        TaskStatus.READY,
+        TaskStatus.READY_FOR_REVIEW,
+        TaskStatus.CANCELED,
+    ),
+    TaskStatus.READY_FOR_REVIEW: (
+        TaskStatus.IN_PROGRESS,
+        TaskStatus.COMPLETED,
+        TaskStatus.CANCELED,
+    ),
+    TaskStatus.COMPLETED: (TaskStatus.IN_PROGRESS,),
+    TaskStatus.CANCELED: (TaskStatus.BACKLOG,),
+}
+
+# Statuses of tasks which are taken into account when calculating progress,
+# tasks in backlog, ready or canceled tasks are not counted
+PROGRESS_STATUSES = (
+    TaskStatus.IN_PROGRESS,
+    TaskStatus.READY_FOR_REVIEW,
+    TaskStatus.COMPLETED,
+)
+
+
+class TaskProgressGroupBy(models.TextChoices):
+    """Fields by which tasks progress can be grouped."""
+
+    ASSIGNMENT = "assignment", "Assignment"
+    ASSIGNEE = "assignee", "Assignee"
+    STATUS = "status", "Status"
+
+
+# Statuses of tasks which are done, no reminders are sent about such tasks
+FINISHED_TASK_STATUSES = (
+    TaskStatus.COMPLETED,
+    TaskStatus.CANCELED,
+)
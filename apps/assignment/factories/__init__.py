@@ -1,2 +1,2 @@
 from .assignment import AssignmentFactory
-from .tasks import TaskFactory
+from .task import TaskFactory
@@ -15,12 +15,12 @@ class TaskFactory(factory.django.DjangoModelFactory):
     assignee = factory.SubFactory("apps.users.factories.UserFactory")
     title = factory.Faker("sentence", nb_words=4)
     description = factory.Faker("text", max_nb_chars=200)
-    start = factory.Faker("date_time_this_month")
+    start = factory.Faker("date_time_this_month", tzinfo=dt.UTC)
 
     @factory.lazy_attribute
     def end(self) -> dt.datetime:
         """Return a deadline that is 7 days after the start date."""
-        return self.start + factory.Faker("timedelta", days=7)
+        return self.start + dt.timedelta(days=7)
 
     class Meta:
         model = models.Task
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandParser
+
+from ... import services
+
+
+class Command(BaseCommand):
+    """Rebuild assignment task counters from tasks."""
+
+    help = (
+        "Recount tasks per assignment and status and fix counters which "
+        "don't match actual tasks."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add optional list of assignments to rebuild counters for."""
+        parser.add_argument(
+            "--assignment",
+            dest="assignment_ids",
+            type=int,
+            nargs="+",
+            help="Ids of assignments to rebuild counters for (all by default)",
+        )
+
+    def handle(
+        self,
+        *args,
+        assignment_ids: list[int] | None,
+        **options,
+    ) -> None:
+        """Rebuild counters and report number of fixed counters."""
+        fixed_count = services.rebuild_task_counters(assignment_ids)
+        self.stdout.write(
+            self.style.SUCCESS(f"Fixed {fixed_count} task counter(s)"),
+        )
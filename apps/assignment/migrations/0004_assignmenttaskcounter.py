@@ -0,0 +1,90 @@
+# Generated by Django 5.2 on 2026-10-18 13:42
+
+import django.db.models.deletion
+from django.apps.registry import Apps
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+
+
+def fill_task_counters(
+    apps: Apps,
+    schema_editor: BaseDatabaseSchemaEditor,
+) -> None:
+    """Fill assignment task counters for existing tasks."""
+    task_model = apps.get_model("assignment", "Task")
+    counter_model = apps.get_model("assignment", "AssignmentTaskCounter")
+    counter_model.objects.bulk_create(
+        counter_model(
+            assignment_id=row["assignment_id"],
+            status=row["status"],
+            count=row["count"],
+        )
+        for row in task_model.objects.order_by()
+        .values("assignment_id", "status")
+        .annotate(count=models.Count("id"))
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("assignment", "0003_task_creator"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AssignmentTaskCounter",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("backlog", "In Backlog"),
+                            ("ready", "Ready"),
+                            ("in_progress", "In Progress"),
+                            ("ready_for_review", "Ready for Review"),
+                            ("completed", "Completed"),
+                            ("canceled", "Canceled"),
+                        ],
+                        max_length=20,
+                        verbose_name="Status",
+                    ),
+                ),
+                (
+                    "count",
+                    models.IntegerField(default=0, verbose_name="Count"),
+                ),
+                (
+                    "assignment",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="task_counters",
+                        to="assignment.assignment",
+                        verbose_name="Assignment",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Assignment task counter",
+                "verbose_name_plural": "Assignment task counters",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("assignment", "status"),
+                        name="unique_assignment_task_counter",
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(
+            code=fill_task_counters,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
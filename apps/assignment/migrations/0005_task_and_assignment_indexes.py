@@ -0,0 +1,87 @@
+# Generated by Django 5.2 on 2026-10-18 13:57
+
+import django.db.models.deletion
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Indexes are created concurrently to not block writes to tables
+    atomic = False
+
+    dependencies = [
+        ("assignment", "0004_assignmenttaskcounter"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="assignment",
+            index=models.Index(
+                fields=["created"],
+                name="assignment_created_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="assignment",
+            index=models.Index(fields=["start"], name="assignment_start_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="assignment",
+            index=models.Index(
+                fields=["deadline"],
+                name="assignment_deadline_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="task",
+            index=models.Index(
+                fields=["assignment", "status"],
+                name="task_assignment_status_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="task",
+            index=models.Index(
+                fields=["assignee", "status", "end"],
+                name="task_assignee_status_end_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="task",
+            index=models.Index(fields=["created"], name="task_created_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="task",
+            index=models.Index(fields=["start"], name="task_start_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="task",
+            index=models.Index(fields=["end"], name="task_end_idx"),
+        ),
+        # Drop FK indexes covered by new composite indexes
+        migrations.AlterField(
+            model_name="task",
+            name="assignee",
+            field=models.ForeignKey(
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="tasks",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="Assignee",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="task",
+            name="assignment",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="tasks",
+                to="assignment.assignment",
+                verbose_name="Assignment",
+            ),
+        ),
+    ]
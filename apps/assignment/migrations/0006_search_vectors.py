@@ -0,0 +1,85 @@
+# Generated by Django 5.2 on 2026-10-18 13:59
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Adding of stored generated columns rewrites `assignment` and `task`
+    # tables under ACCESS EXCLUSIVE lock, which blocks reads and writes until
+    # each table is rewritten, so migration should be applied when traffic
+    # is low. Migration isn't atomic, so each table is locked only while
+    # it's rewritten and indexes are created concurrently without blocking
+    # writes.
+    atomic = False
+
+    dependencies = [
+        ("assignment", "0005_task_and_assignment_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="assignment",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.CombinedSearchVector(
+                    django.contrib.postgres.search.SearchVector(
+                        "title",
+                        config="simple",
+                        weight="A",
+                    ),
+                    "||",
+                    django.contrib.postgres.search.SearchVector(
+                        "description",
+                        config="simple",
+                        weight="B",
+                    ),
+                    django.contrib.postgres.search.SearchConfig("simple"),
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+                verbose_name="Search vector",
+            ),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.CombinedSearchVector(
+                    django.contrib.postgres.search.SearchVector(
+                        "title",
+                        config="simple",
+                        weight="A",
+                    ),
+                    "||",
+                    django.contrib.postgres.search.SearchVector(
+                        "description",
+                        config="simple",
+                        weight="B",
+                    ),
+                    django.contrib.postgres.search.SearchConfig("simple"),
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+                verbose_name="Search vector",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="assignment",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"],
+                name="assignment_search_vector_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="task",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"],
+                name="task_search_vector_idx",
+            ),
+        ),
+    ]
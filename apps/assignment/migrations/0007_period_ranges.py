@@ -0,0 +1,96 @@
+# Generated by Django 5.2 on 2026-10-18 14:37
+
+import django.contrib.postgres.fields.ranges
+import django.contrib.postgres.indexes
+import django.db.models.functions.comparison
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Tables are rewritten under ACCESS EXCLUSIVE lock as in
+    # `0006_search_vectors`, GiST indexes are created concurrently
+    atomic = False
+
+    dependencies = [
+        ("assignment", "0006_search_vectors"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="assignment",
+            name="period",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(
+                    models.When(
+                        deadline__isnull=True,
+                        start__isnull=True,
+                        then=None,
+                    ),
+                    default=models.Func(
+                        django.db.models.functions.comparison.Least(
+                            "start",
+                            "deadline",
+                        ),
+                        django.db.models.functions.comparison.Greatest(
+                            "start",
+                            "deadline",
+                        ),
+                        models.Value("[]"),
+                        function="TSTZRANGE",
+                        output_field=django.contrib.postgres.fields.ranges.DateTimeRangeField(),
+                    ),
+                    output_field=django.contrib.postgres.fields.ranges.DateTimeRangeField(),
+                ),
+                output_field=django.contrib.postgres.fields.ranges.DateTimeRangeField(),
+                verbose_name="Period",
+            ),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="period",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(
+                    models.When(
+                        end__isnull=True,
+                        start__isnull=True,
+                        then=None,
+                    ),
+                    default=models.Func(
+                        django.db.models.functions.comparison.Least(
+                            "start",
+                            "end",
+                        ),
+                        django.db.models.functions.comparison.Greatest(
+                            "start",
+                            "end",
+                        ),
+                        models.Value("[]"),
+                        function="TSTZRANGE",
+                        output_field=django.contrib.postgres.fields.ranges.DateTimeRangeField(),
+                    ),
+                    output_field=django.contrib.postgres.fields.ranges.DateTimeRangeField(),
+                ),
+                output_field=django.contrib.postgres.fields.ranges.DateTimeRangeField(),
+                verbose_name="Period",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="assignment",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["period"],
+                name="assignment_period_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="task",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["period"],
+                name="task_period_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,103 @@
+# Generated by Django 5.2 on 2026-10-18 14:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+import django_extensions.db.fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("assignment", "0007_period_ranges"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DeadlineReminder",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created",
+                    django_extensions.db.fields.CreationDateTimeField(
+                        auto_now_add=True,
+                        verbose_name="created",
+                    ),
+                ),
+                (
+                    "modified",
+                    django_extensions.db.fields.ModificationDateTimeField(
+                        auto_now=True,
+                        verbose_name="modified",
+                    ),
+                ),
+                ("window", models.DurationField(verbose_name="Window")),
+                (
+                    "assignment",
+                    models.ForeignKey(
+                        blank=True,
+                        db_index=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="deadline_reminders",
+                        to="assignment.assignment",
+                        verbose_name="Assignment",
+                    ),
+                ),
+                (
+                    "task",
+                    models.ForeignKey(
+                        blank=True,
+                        db_index=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="deadline_reminders",
+                        to="assignment.task",
+                        verbose_name="Task",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="deadline_reminders",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="User",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Deadline reminder",
+                "verbose_name_plural": "Deadline reminders",
+                "constraints": [
+                    models.CheckConstraint(
+                        condition=models.Q(
+                            ("task__isnull", True),
+                            ("assignment__isnull", True),
+                            _connector="XOR",
+                        ),
+                        name="deadline_reminder_task_xor_assignment",
+                    ),
+                    models.UniqueConstraint(
+                        condition=models.Q(("task__isnull", False)),
+                        fields=("task", "user", "window"),
+                        name="unique_task_deadline_reminder",
+                    ),
+                    models.UniqueConstraint(
+                        condition=models.Q(("assignment__isnull", False)),
+                        fields=("assignment", "user", "window"),
+                        name="unique_assignment_deadline_reminder",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,133 @@
+# Generated by Django 5.2 on 2026-10-18 14:51
+
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+import django.utils.timezone
+from django.apps.registry import Apps
+from django.conf import settings
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+
+
+def fill_task_status_history(
+    apps: Apps,
+    schema_editor: BaseDatabaseSchemaEditor,
+) -> None:
+    """Record current status of existing tasks as set on their creation.
+
+    Otherwise status history of existing tasks would start on their first
+    change and past days of burndowns would be counted with their current
+    status. Rows are inserted by a single `INSERT ... SELECT`.
+
+    """
+    task_model = apps.get_model("assignment", "Task")
+    change_model = apps.get_model("assignment", "TaskStatusChange")
+    quote_name = schema_editor.quote_name
+    schema_editor.execute(
+        f"INSERT INTO {quote_name(change_model._meta.db_table)} "  # noqa: S608
+        "(task_id, from_status, to_status, actor_id, changed) "
+        "SELECT id, '', status, creator_id, created "
+        f"FROM {quote_name(task_model._meta.db_table)}",
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("assignment", "0008_deadline_reminders"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TaskStatusChange",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "from_status",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            ("backlog", "In Backlog"),
+                            ("ready", "Ready"),
+                            ("in_progress", "In Progress"),
+                            ("ready_for_review", "Ready for Review"),
+                            ("completed", "Completed"),
+                            ("canceled", "Canceled"),
+                        ],
+                        default="",
+                        max_length=20,
+                        verbose_name="From status",
+                    ),
+                ),
+                (
+                    "to_status",
+                    models.CharField(
+                        choices=[
+                            ("backlog", "In Backlog"),
+                            ("ready", "Ready"),
+                            ("in_progress", "In Progress"),
+                            ("ready_for_review", "Ready for Review"),
+                            ("completed", "Completed"),
+                            ("canceled", "Canceled"),
+                        ],
+                        max_length=20,
+                        verbose_name="To status",
+                    ),
+                ),
+                (
+                    "changed",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        verbose_name="Changed",
+                    ),
+                ),
+                (
+                    "actor",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="task_status_changes",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Actor",
+                    ),
+                ),
+                (
+                    "task",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="status_changes",
+                        to="assignment.task",
+                        verbose_name="Task",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Task status change",
+                "verbose_name_plural": "Task status changes",
+                "indexes": [
+                    django.contrib.postgres.indexes.BrinIndex(
+                        fields=["changed"],
+                        name="task_status_change_changed_idx",
+                    ),
+                    models.Index(
+                        fields=["task", "changed"],
+                        name="task_status_change_task_idx",
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(
+            code=fill_task_status_history,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,151 @@
+# Generated by Django 5.2 on 2026-10-18 15:17
+
+import django.db.models.deletion
+from django.apps.registry import Apps
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+
+# Foreign keys (model and field) which are cascaded by DB. Models keep
+# `DO_NOTHING`, so ORM doesn't load these rows when assignment or task is
+# deleted (check `services.delete_assignment`).
+CASCADE_FOREIGN_KEYS = (
+    ("Task", "assignment"),
+    ("AssignmentTaskCounter", "assignment"),
+    ("TaskStatusChange", "task"),
+    ("DeadlineReminder", "task"),
+    ("DeadlineReminder", "assignment"),
+)
+
+
+def set_foreign_keys_on_delete(
+    apps: Apps,
+    schema_editor: BaseDatabaseSchemaEditor,
+    on_delete: str,
+) -> None:
+    """Recreate foreign key constraints with `on_delete` action.
+
+    Constraint is added as `NOT VALID`, so only a short lock is needed to
+    swap it. Existing rows are checked afterwards by `VALIDATE CONSTRAINT`,
+    which doesn't block writes to table.
+
+    """
+    connection = schema_editor.connection
+    quote_name = schema_editor.quote_name
+    for model_name, field_name in CASCADE_FOREIGN_KEYS:
+        model = apps.get_model("assignment", model_name)
+        field = model._meta.get_field(field_name)
+        table = model._meta.db_table
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor,
+                table,
+            )
+        for name, constraint in constraints.items():
+            if not constraint["foreign_key"] or constraint["columns"] != [
+                field.column,
+            ]:
+                continue
+            schema_editor.execute(
+                f"ALTER TABLE {quote_name(table)} "
+                f"DROP CONSTRAINT {quote_name(name)}, "
+                f"ADD CONSTRAINT {quote_name(name)} "
+                f"FOREIGN KEY ({quote_name(field.column)}) "
+                f"REFERENCES {quote_name(field.related_model._meta.db_table)} "
+                f"({quote_name(field.target_field.column)}) "
+                f"{on_delete} DEFERRABLE INITIALLY DEFERRED NOT VALID",
+            )
+            schema_editor.execute(
+                f"ALTER TABLE {quote_name(table)} "
+                f"VALIDATE CONSTRAINT {quote_name(name)}",
+            )
+
+
+def add_on_delete_cascade(
+    apps: Apps,
+    schema_editor: BaseDatabaseSchemaEditor,
+) -> None:
+    """Make DB delete rows of deleted assignments and tasks."""
+    set_foreign_keys_on_delete(apps, schema_editor, "ON DELETE CASCADE")
+
+
+def remove_on_delete_cascade(
+    apps: Apps,
+    schema_editor: BaseDatabaseSchemaEditor,
+) -> None:
+    """Restore foreign keys without actions, as Django creates them."""
+    set_foreign_keys_on_delete(apps, schema_editor, "")
+
+
+class Migration(migrations.Migration):
+    # Each statement is committed on its own, so locks taken to swap
+    # constraints are released before they are validated
+    atomic = False
+
+    dependencies = [
+        ("assignment", "0009_task_status_history"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="assignmenttaskcounter",
+            name="assignment",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="task_counters",
+                to="assignment.assignment",
+                verbose_name="Assignment",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="deadlinereminder",
+            name="assignment",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="deadline_reminders",
+                to="assignment.assignment",
+                verbose_name="Assignment",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="deadlinereminder",
+            name="task",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="deadline_reminders",
+                to="assignment.task",
+                verbose_name="Task",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="task",
+            name="assignment",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="tasks",
+                to="assignment.assignment",
+                verbose_name="Assignment",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="taskstatuschange",
+            name="task",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="status_changes",
+                to="assignment.task",
+                verbose_name="Task",
+            ),
+        ),
+        migrations.RunPython(
+            code=add_on_delete_cascade,
+            reverse_code=remove_on_delete_cascade,
+        ),
+    ]
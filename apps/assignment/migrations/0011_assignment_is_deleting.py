@@ -0,0 +1,20 @@
+# Generated by Django 5.2 on 2026-10-18 16:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("assignment", "0010_db_cascade_deletion"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="assignment",
+            name="is_deleting",
+            field=models.BooleanField(
+                default=False,
+                verbose_name="Is being deleted",
+            ),
+        ),
+    ]
@@ -1,2 +1,5 @@
 from .assignment import Assignment
+from .reminders import DeadlineReminder
+from .task_counters import AssignmentTaskCounter
+from .task_history import TaskStatusChange
 from .tasks import Task
@@ -1,4 +1,9 @@
+from django.conf import settings
+from django.contrib.postgres.fields import DateTimeRangeField
+from django.contrib.postgres.indexes import GinIndex, GistIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from django.db.models.functions import Greatest, Least
 from django.utils.translation import gettext_lazy as _
 
 from apps.core.models import BaseModel
@@ -31,10 +36,74 @@ class Assignment(BaseModel):
         null=True,
         blank=True,
     )
+    # Assignment with many tasks which is being deleted in background, it's
+    # hidden from API and tasks can't be added to it (check
+    # `services.delete_assignment`)
+    is_deleting = models.BooleanField(
+        default=False,
+        verbose_name=_("Is being deleted"),
+    )
+    search_vector = models.GeneratedField(
+        expression=SearchVector(
+            "title",
+            weight="A",
+            config=settings.FULL_TEXT_SEARCH_CONFIG,
+        )
+        + SearchVector(
+            "description",
+            weight="B",
+            config=settings.FULL_TEXT_SEARCH_CONFIG,
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+        verbose_name=_("Search vector"),
+    )
+    # Range between start and deadline (bounds are swapped if deadline is
+    # before start), NULL if assignment has no dates
+    period = models.GeneratedField(
+        expression=models.Case(
+            models.When(start__isnull=True, deadline__isnull=True, then=None),
+            default=models.Func(
+                Least("start", "deadline"),
+                Greatest("start", "deadline"),
+                models.Value("[]"),
+                function="TSTZRANGE",
+                output_field=DateTimeRangeField(),
+            ),
+            output_field=DateTimeRangeField(),
+        ),
+        output_field=DateTimeRangeField(),
+        db_persist=True,
+        verbose_name=_("Period"),
+    )
 
     class Meta:
         verbose_name = _("Assignment")
         verbose_name_plural = _("Assignments")
+        indexes = (
+            GinIndex(
+                fields=("search_vector",),
+                name="assignment_search_vector_idx",
+            ),
+            # Assignments overlapping time window (calendar)
+            GistIndex(
+                fields=("period",),
+                name="assignment_period_idx",
+            ),
+            # Ordering of lists
+            models.Index(
+                fields=("created",),
+                name="assignment_created_idx",
+            ),
+            models.Index(
+                fields=("start",),
+                name="assignment_start_idx",
+            ),
+            models.Index(
+                fields=("deadline",),
+                name="assignment_deadline_idx",
+            ),
+        )
 
     def __str__(self) -> str:
         return self.title
@@ -0,0 +1,69 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from apps.core.models import BaseModel
+
+
+class DeadlineReminder(BaseModel):
+    """Reminder about deadline of task or assignment sent to user.
+
+    Reminders are recorded before they are sent, so each of them is sent at
+    most once. Reminder is given either for task (about its end) or for
+    assignment (about its deadline) and `window` - how long before deadline
+    reminder is sent (check `DEADLINE_REMINDER_WINDOWS` setting).
+
+    """
+
+    user = models.ForeignKey(
+        "users.User",
+        on_delete=models.CASCADE,
+        related_name="deadline_reminders",
+        verbose_name=_("User"),
+    )
+    task = models.ForeignKey(
+        "assignment.Task",
+        on_delete=models.DO_NOTHING,
+        related_name="deadline_reminders",
+        verbose_name=_("Task"),
+        null=True,
+        blank=True,
+        # Covered by `unique_task_deadline_reminder`
+        db_index=False,
+    )
+    assignment = models.ForeignKey(
+        "assignment.Assignment",
+        on_delete=models.DO_NOTHING,
+        related_name="deadline_reminders",
+        verbose_name=_("Assignment"),
+        null=True,
+        blank=True,
+        # Covered by `unique_assignment_deadline_reminder`
+        db_index=False,
+    )
+    window = models.DurationField(
+        verbose_name=_("Window"),
+    )
+
+    class Meta:
+        verbose_name = _("Deadline reminder")
+        verbose_name_plural = _("Deadline reminders")
+        constraints = (
+            models.CheckConstraint(
+                condition=models.Q(task__isnull=True)
+                ^ models.Q(assignment__isnull=True),
+                name="deadline_reminder_task_xor_assignment",
+            ),
+            models.UniqueConstraint(
+                fields=("task", "user", "window"),
+                condition=models.Q(task__isnull=False),
+                name="unique_task_deadline_reminder",
+            ),
+            models.UniqueConstraint(
+                fields=("assignment", "user", "window"),
+                condition=models.Q(assignment__isnull=False),
+                name="unique_assignment_deadline_reminder",
+            ),
+        )
+
+    def __str__(self) -> str:
+        return f"{self.user_id}: {self.task_id or self.assignment_id}"
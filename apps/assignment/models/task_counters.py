@@ -0,0 +1,45 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from ..constants import TaskStatus
+
+
+class AssignmentTaskCounter(models.Model):
+    """Denormalized count of assignment's tasks with specific status.
+
+    There is at most one counter per assignment and status. Counters are kept
+    in sync with tasks on create, delete, changing of status or assignment
+    (check `apps.assignment.signals`), so progress of assignment can be read
+    without scanning tasks. Counters can be rebuilt from scratch with
+    `rebuild_task_counters` management command.
+
+    """
+
+    assignment = models.ForeignKey(
+        "assignment.Assignment",
+        on_delete=models.DO_NOTHING,
+        related_name="task_counters",
+        verbose_name=_("Assignment"),
+    )
+    status = models.CharField(
+        max_length=20,
+        verbose_name=_("Status"),
+        choices=TaskStatus.choices,
+    )
+    count = models.IntegerField(
+        verbose_name=_("Count"),
+        default=0,
+    )
+
+    class Meta:
+        verbose_name = _("Assignment task counter")
+        verbose_name_plural = _("Assignment task counters")
+        constraints = (
+            models.UniqueConstraint(
+                fields=("assignment", "status"),
+                name="unique_assignment_task_counter",
+            ),
+        )
+
+    def __str__(self) -> str:
+        return f"{self.assignment_id} {self.status}: {self.count}"
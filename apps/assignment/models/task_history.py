@@ -0,0 +1,70 @@
+from django.contrib.postgres.indexes import BrinIndex
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from ..constants import TaskStatus
+
+
+class TaskStatusChange(models.Model):
+    """Append-only history of changes of task status.
+
+    Change is recorded whenever task gets its status: on create (with empty
+    `from_status`), on update and on transition of tasks (check
+    `apps.assignment.services.record_status_changes`). History is used to
+    find out how long tasks stay in each status.
+
+    """
+
+    task = models.ForeignKey(
+        "assignment.Task",
+        on_delete=models.DO_NOTHING,
+        related_name="status_changes",
+        verbose_name=_("Task"),
+        # Covered by `task_status_change_task_idx`
+        db_index=False,
+    )
+    from_status = models.CharField(
+        max_length=20,
+        verbose_name=_("From status"),
+        choices=TaskStatus.choices,
+        blank=True,
+        default="",
+    )
+    to_status = models.CharField(
+        max_length=20,
+        verbose_name=_("To status"),
+        choices=TaskStatus.choices,
+    )
+    actor = models.ForeignKey(
+        "users.User",
+        on_delete=models.SET_NULL,
+        related_name="task_status_changes",
+        verbose_name=_("Actor"),
+        null=True,
+        blank=True,
+    )
+    changed = models.DateTimeField(
+        verbose_name=_("Changed"),
+        default=timezone.now,
+    )
+
+    class Meta:
+        verbose_name = _("Task status change")
+        verbose_name_plural = _("Task status changes")
+        indexes = (
+            # History is appended in order of time, so BRIN index is tiny
+            # and good enough for range scans of time windows
+            BrinIndex(
+                fields=("changed",),
+                name="task_status_change_changed_idx",
+            ),
+            # Window functions partition history by task ordered by time
+            models.Index(
+                fields=("task", "changed"),
+                name="task_status_change_task_idx",
+            ),
+        )
+
+    def __str__(self) -> str:
+        return f"{self.task_id}: {self.from_status} -> {self.to_status}"
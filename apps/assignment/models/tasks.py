@@ -1,19 +1,31 @@
-from django.db import models
+import typing
+
+from django.conf import settings
+from django.contrib.postgres.fields import DateTimeRangeField
+from django.contrib.postgres.indexes import GinIndex, GistIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
+from django.db import models, transaction
+from django.db.models.functions import Greatest, Least
 from django.utils.translation import gettext_lazy as _
 
 from apps.core.models import BaseModel
 
 from ..constants import TaskStatus
 
+if typing.TYPE_CHECKING:
+    from apps.users.models import User
+
 
 class Task(BaseModel):
     """Implement your model here."""
 
     assignment = models.ForeignKey(
         "assignment.Assignment",
-        on_delete=models.CASCADE,
+        on_delete=models.DO_NOTHING,
         related_name="tasks",
         verbose_name=_("Assignment"),
+        # Covered by `task_assignment_status_idx`
+        db_index=False,
     )
     creator = models.ForeignKey(
         "users.User",
@@ -28,6 +40,8 @@ class Task(BaseModel):
         related_name="tasks",
         verbose_name=_("Assignee"),
         null=True,
+        # Covered by `task_assignee_status_end_idx`
+        db_index=False,
     )
     title = models.CharField(
         max_length=255,
@@ -53,9 +67,111 @@ class Task(BaseModel):
         blank=True,
     )
 
+    search_vector = models.GeneratedField(
+        expression=SearchVector(
+            "title",
+            weight="A",
+            config=settings.FULL_TEXT_SEARCH_CONFIG,
+        )
+        + SearchVector(
+            "description",
+            weight="B",
+            config=settings.FULL_TEXT_SEARCH_CONFIG,
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+        verbose_name=_("Search vector"),
+    )
+    # Range between start and end (bounds are swapped if end is before
+    # start), NULL if task has no dates
+    period = models.GeneratedField(
+        expression=models.Case(
+            models.When(start__isnull=True, end__isnull=True, then=None),
+            default=models.Func(
+                Least("start", "end"),
+                Greatest("start", "end"),
+                models.Value("[]"),
+                function="TSTZRANGE",
+                output_field=DateTimeRangeField(),
+            ),
+            output_field=DateTimeRangeField(),
+        ),
+        output_field=DateTimeRangeField(),
+        db_persist=True,
+        verbose_name=_("Period"),
+    )
+
+    # Assignment and status loaded from DB, check `from_db`
+    loaded_counter_key: tuple[int, str] | None = None
+    # User who changes status of task, it's recorded in status history
+    status_changed_by: typing.Optional["User"] = None
+
     class Meta:
         verbose_name = _("Task")
         verbose_name_plural = _("Tasks")
+        indexes = (
+            GinIndex(
+                fields=("search_vector",),
+                name="task_search_vector_idx",
+            ),
+            # Tasks overlapping time window (calendar)
+            GistIndex(
+                fields=("period",),
+                name="task_period_idx",
+            ),
+            # Tasks of assignment by status (filters, progress, counters)
+            models.Index(
+                fields=("assignment", "status"),
+                name="task_assignment_status_idx",
+            ),
+            # Tasks of assignee by status ordered by deadline
+            models.Index(
+                fields=("assignee", "status", "end"),
+                name="task_assignee_status_end_idx",
+            ),
+            # Ordering of lists
+            models.Index(
+                fields=("created",),
+                name="task_created_idx",
+            ),
+            models.Index(
+                fields=("start",),
+                name="task_start_idx",
+            ),
+            models.Index(
+                fields=("end",),
+                name="task_end_idx",
+            ),
+        )
 
     def __str__(self) -> str:
         return f"{self.title} ({self.assignment.title})"
+
+    @classmethod
+    def from_db(cls, db, field_names, values) -> "Task":  # noqa: ANN001
+        """Remember loaded assignment and status.
+
+        They are used to update assignment task counters, when task is moved
+        to another assignment or its status is changed.
+
+        """
+        instance = super().from_db(db, field_names, values)
+        instance.loaded_counter_key = instance.counter_key
+        return instance
+
+    @property
+    def counter_key(self) -> tuple[int, str] | None:
+        """Return key of assignment task counter which includes the task.
+
+        Returns None if assignment or status were not loaded from DB.
+
+        """
+        deferred_fields = self.get_deferred_fields()
+        if {"assignment_id", "status"} & deferred_fields:
+            return None
+        return self.assignment_id, self.status
+
+    def save(self, *args, **kwargs) -> None:
+        """Save task and update task counters in the same transaction."""
+        with transaction.atomic(using=kwargs.get("using")):
+            super().save(*args, **kwargs)
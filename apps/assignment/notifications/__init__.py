@@ -0,0 +1 @@
+from .deadline_reminder import DeadlineReminderEmailNotification
@@ -0,0 +1,45 @@
+import datetime as dt
+import typing
+
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+
+from libs.notifications.email import DefaultEmailNotification
+
+
+class DeadlineReminderEmailNotification(DefaultEmailNotification):
+    """Used to remind user about approaching deadline of task or assignment.
+
+    Reminders are sent in large batches, so notification is built from plain
+    values instead of model instances.
+
+    """
+
+    subject = _("Deadline is approaching")
+    template = "assignment/emails/deadline_reminder.html"
+
+    def __init__(
+        self,
+        email: str,
+        title: str,
+        deadline: dt.datetime,
+        **template_context,
+    ) -> None:
+        super().__init__(**template_context)
+        self.email = email
+        self.title = title
+        self.deadline = deadline
+
+    def get_recipient_list(self) -> list[str]:
+        """Get email's recipients."""
+        return [self.email]
+
+    def get_template_context(self) -> dict[str, typing.Any]:
+        """Get email's template context."""
+        self.template_context.update(
+            title=self.title,
+            deadline=self.deadline,
+            app_url=settings.FRONTEND_URL,
+            app_label=settings.APP_LABEL,
+        )
+        return self.template_context
@@ -0,0 +1,20 @@
+from .burndown import get_burndown, invalidate_burndown
+from .calendar import get_calendar
+from .dashboard import get_dashboard
+from .deletion import delete_assignment, purge_assignment
+from .progress import get_percent_completed, get_tasks_progress
+from .reminders import send_deadline_reminders
+from .task_counters import (
+    count_tasks,
+    rebuild_task_counters,
+    update_task_counters,
+)
+from .task_history import get_status_analytics, record_status_changes
+from .task_stats import annotate_task_stats, get_task_stats_annotation
+from .tasks import (
+    bulk_create_tasks,
+    bulk_update_tasks,
+    get_transition_sources,
+    transition_tasks,
+)
+from .workload import get_workload
@@ -0,0 +1,143 @@
+import collections.abc
+import datetime as dt
+import typing
+
+from django.core.cache import cache
+from django.db import connection
+from django.utils import timezone
+
+from .. import constants
+from .. import models as assignment_models
+
+BURNDOWN_KEY_PREFIX = "burndown"
+
+# Remaining and completed tasks at the end of day
+BurndownBucket = tuple[int, int]
+
+
+def get_burndown_key(assignment_id: int) -> str:
+    """Get cache key of past days of burndown of assignment."""
+    return f"{BURNDOWN_KEY_PREFIX}:{assignment_id}"
+
+
+def invalidate_burndown(assignment_ids: collections.abc.Iterable[int]) -> None:
+    """Drop cached days of burndowns of assignments.
+
+    Past days depend only on tasks of assignment and their status history,
+    so they are invalidated only when task leaves assignment (is deleted or
+    moved to another one).
+
+    """
+    cache.delete_many(
+        [get_burndown_key(assignment_id) for assignment_id in assignment_ids],
+    )
+
+
+def count_burndown_buckets(
+    assignment_id: int,
+    first_day: dt.date,
+    last_day: dt.date,
+) -> dict[dt.date, BurndownBucket]:
+    """Count remaining and completed tasks at the end of each day.
+
+    Days are generated by `generate_series` and counted with a single
+    aggregate query. Status of task at the end of day is the last status
+    from its history, tasks without history (created before history was
+    recorded) are counted with their current status.
+
+    """
+    tz = timezone.get_current_timezone()
+    task_table = connection.ops.quote_name(
+        assignment_models.Task._meta.db_table,
+    )
+    history_table = connection.ops.quote_name(
+        assignment_models.TaskStatusChange._meta.db_table,
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT days.day, "  # noqa: S608
+            "COUNT(tasks.id) FILTER (WHERE NOT statuses.status = ANY(%s)), "
+            "COUNT(tasks.id) FILTER (WHERE statuses.status = %s) "
+            "FROM generate_series(%s, %s, INTERVAL '1 day') AS days(day) "
+            f"LEFT JOIN {task_table} AS tasks "
+            "ON tasks.assignment_id = %s "
+            "AND tasks.created < days.day + INTERVAL '1 day' "
+            "LEFT JOIN LATERAL (SELECT COALESCE(("
+            "SELECT history.to_status "
+            f"FROM {history_table} AS history "
+            "WHERE history.task_id = tasks.id "
+            "AND history.changed < days.day + INTERVAL '1 day' "
+            "ORDER BY history.changed DESC, history.id DESC LIMIT 1"
+            "), tasks.status) AS status) AS statuses ON TRUE "
+            "GROUP BY days.day ORDER BY days.day",
+            (
+                list(constants.FINISHED_TASK_STATUSES),
+                constants.TaskStatus.COMPLETED,
+                dt.datetime.combine(first_day, dt.time.min, tzinfo=tz),
+                dt.datetime.combine(last_day, dt.time.min, tzinfo=tz),
+                assignment_id,
+            ),
+        )
+        return {
+            timezone.localdate(day, tz): (remaining, completed)
+            for day, remaining, completed in cursor.fetchall()
+        }
+
+
+def get_burndown(
+    assignment: assignment_models.Assignment,
+) -> dict[str, typing.Any]:
+    """Get daily series of remaining and completed tasks of assignment.
+
+    Series starts on start of assignment (or its creation) and ends on its
+    deadline or today, whichever is earlier. Past days can't change, so they
+    are cached without timeout and only missing days and today are counted.
+
+    """
+    today = timezone.localdate()
+    first_day = timezone.localdate(assignment.start or assignment.created)
+    last_day = today
+    if assignment.deadline:
+        last_day = min(last_day, timezone.localdate(assignment.deadline))
+    days = [
+        first_day + dt.timedelta(days=offset)
+        for offset in range((last_day - first_day).days + 1)
+    ]
+
+    key = get_burndown_key(assignment.pk)
+    buckets: dict[dt.date, BurndownBucket] = cache.get(key) or {}
+    if missing_days := [
+        day for day in days if day == today or day not in buckets
+    ]:
+        counted_buckets = count_burndown_buckets(
+            assignment_id=assignment.pk,
+            first_day=missing_days[0],
+            last_day=missing_days[-1],
+        )
+        buckets = {**buckets, **counted_buckets}
+        if any(day < today for day in counted_buckets):
+            cache.set(
+                key,
+                {
+                    day: bucket
+                    for day, bucket in buckets.items()
+                    if day < today
+                },
+                timeout=None,
+            )
+    return {
+        "start": first_day,
+        "deadline": (
+            timezone.localdate(assignment.deadline)
+            if assignment.deadline
+            else None
+        ),
+        "days": [
+            {
+                "day": day,
+                "remaining": buckets[day][0],
+                "completed": buckets[day][1],
+            }
+            for day in days
+        ],
+    }
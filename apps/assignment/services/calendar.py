@@ -0,0 +1,61 @@
+import datetime as dt
+import typing
+
+from django.db import models
+from django.db.backends.postgresql.psycopg_any import DateTimeTZRange
+
+from apps.users import models as users_models
+
+from .. import models as assignment_models
+
+
+def get_calendar(
+    user: users_models.User,
+    start: dt.datetime,
+    end: dt.datetime,
+) -> dict[str, typing.Any]:
+    """Get tasks and assignments of user overlapping time window.
+
+    Tasks are ones assigned to or created by user, assignments are ones
+    created by user or having tasks assigned to user. Objects are matched by
+    `period` ranges, so overlap is checked with GiST indexes. Objects without
+    dates are not included.
+
+    """
+    window = DateTimeTZRange(start, end, bounds="[]")
+    tasks = (
+        assignment_models.Task.objects.filter(
+            models.Q(assignee=user) | models.Q(creator=user),
+            period__overlap=window,
+        )
+        .only(
+            "assignment_id",
+            "title",
+            "status",
+            "start",
+            "end",
+        )
+        .order_by("start", "end", "pk")
+    )
+    assignments = (
+        assignment_models.Assignment.objects.filter(
+            models.Q(creator=user)
+            | models.Exists(
+                assignment_models.Task.objects.filter(
+                    assignment=models.OuterRef("pk"),
+                    assignee=user,
+                ),
+            ),
+            period__overlap=window,
+        )
+        .only(
+            "title",
+            "start",
+            "deadline",
+        )
+        .order_by("start", "deadline", "pk")
+    )
+    return {
+        "tasks": tasks,
+        "assignments": assignments,
+    }
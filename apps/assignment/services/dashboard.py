@@ -0,0 +1,96 @@
+import typing
+
+from django.conf import settings
+from django.db import models
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+
+from apps.users import models as users_models
+
+from .. import constants
+from .. import models as assignment_models
+from .progress import get_percent_completed
+
+OPEN_TASK_STATUSES = [
+    status
+    for status in constants.TaskStatus.values
+    if status not in constants.FINISHED_TASK_STATUSES
+]
+
+
+def get_dashboard(user: users_models.User) -> dict[str, typing.Any]:
+    """Get everything landing page shows to user with 3 queries.
+
+    Dashboard contains profile of user, upcoming assignments (created by
+    user or with tasks assigned to user), nearest open tasks of user grouped
+    by status and overall progress of user's tasks. Lists are limited to
+    `DASHBOARD_ITEMS_LIMIT` items (per status for tasks), tasks of each
+    status are limited by window function in the same query.
+
+    """
+    limit = settings.DASHBOARD_ITEMS_LIMIT
+    assignments = (
+        assignment_models.Assignment.objects.filter(
+            models.Q(creator=user)
+            | models.Exists(
+                assignment_models.Task.objects.filter(
+                    assignment=models.OuterRef("pk"),
+                    assignee=user,
+                ),
+            ),
+            deadline__gte=timezone.now(),
+        )
+        .only(
+            "title",
+            "start",
+            "deadline",
+        )
+        .order_by("deadline", "pk")[:limit]
+    )
+
+    user_tasks = assignment_models.Task.objects.filter(assignee=user)
+    order_by = (models.F("end").asc(nulls_last=True), models.F("pk").asc())
+    tasks = (
+        user_tasks.filter(status__in=OPEN_TASK_STATUSES)
+        .annotate(
+            status_position=models.Window(
+                RowNumber(),
+                partition_by=models.F("status"),
+                order_by=order_by,
+            ),
+        )
+        .filter(status_position__lte=limit)
+        .only(
+            "assignment_id",
+            "title",
+            "status",
+            "start",
+            "end",
+        )
+        .order_by(*order_by)
+    )
+    tasks_by_status = {status: [] for status in OPEN_TASK_STATUSES}
+    for task in tasks:
+        tasks_by_status[task.status].append(task)
+
+    counts = user_tasks.order_by().aggregate(
+        **{
+            status: models.Count("id", filter=models.Q(status=status))
+            for status in constants.TaskStatus.values
+        },
+        total=models.Count(
+            "id",
+            filter=models.Q(status__in=constants.PROGRESS_STATUSES),
+        ),
+    )
+    total = counts.pop("total")
+    return {
+        "profile": user,
+        "assignments": assignments,
+        "tasks": tasks_by_status,
+        "task_counts": counts,
+        "percent_completed": get_percent_completed(
+            completed=counts[constants.TaskStatus.COMPLETED],
+            total=total,
+        ),
+    }
@@ -0,0 +1,83 @@
+import collections
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from libs.api.response_cache import invalidate_responses
+
+from .. import models
+from .task_counters import update_task_counters
+
+
+def delete_assignment(assignment: models.Assignment) -> bool:
+    """Delete assignment or enqueue deletion of assignment with many tasks.
+
+    Tasks, their status history, reminders and task counters are deleted by
+    `ON DELETE CASCADE` of DB, so they are never loaded into Python.
+    Assignments with more than `ASSIGNMENT_ASYNC_DELETE_THRESHOLD` tasks
+    are marked as being deleted (which hides them from API and prevents
+    adding tasks to them) and purged in batches by celery task after
+    commit. Purge is enqueued only by request which marked assignment.
+    Return `True` if assignment is deleted in background.
+
+    """
+    threshold = settings.ASSIGNMENT_ASYNC_DELETE_THRESHOLD
+    if assignment.tasks.order_by()[: threshold + 1].count() <= threshold:
+        assignment.delete()
+        return False
+
+    marked = models.Assignment.objects.filter(
+        pk=assignment.pk,
+        is_deleting=False,
+    ).update(is_deleting=True, modified=timezone.now())
+    if not marked:
+        return True
+    invalidate_responses(models.Assignment)
+    invalidate_responses(models.Task)
+
+    from .. import tasks
+
+    transaction.on_commit(
+        lambda: tasks.purge_assignment.delay(assignment.pk),
+    )
+    return True
+
+
+def purge_assignment(assignment_id: int) -> int:
+    """Delete tasks of assignment in batches and then assignment itself.
+
+    Each batch of `ASSIGNMENT_DELETE_BATCH_SIZE` tasks is deleted by a
+    single statement in its own transaction, so locks are held only
+    shortly. Tasks locked by concurrent purge are skipped, batches are
+    deleted until none is left. Assignment is deleted only if it has no
+    tasks left, otherwise it's deleted by purge which still holds the
+    remaining tasks. Task counters are kept in sync after each batch.
+    Return number of deleted tasks.
+
+    """
+    batch_size = settings.ASSIGNMENT_DELETE_BATCH_SIZE
+    table = connection.ops.quote_name(models.Task._meta.db_table)
+    deleted = 0
+    while True:
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {table} WHERE id IN ("  # noqa: S608
+                f"SELECT id FROM {table} WHERE assignment_id = %s LIMIT %s "
+                "FOR UPDATE SKIP LOCKED"
+                ") RETURNING status",
+                [assignment_id, batch_size],
+            )
+            statuses = [status for (status,) in cursor.fetchall()]
+            if not statuses:
+                break
+            deltas = collections.Counter()
+            deltas.subtract((assignment_id, status) for status in statuses)
+            update_task_counters(deltas)
+            invalidate_responses(models.Task)
+        deleted += len(statuses)
+    models.Assignment.objects.filter(pk=assignment_id).exclude(
+        Exists(models.Task.objects.filter(assignment=OuterRef("pk"))),
+    ).delete()
+    return deleted
@@ -0,0 +1,71 @@
+import typing
+
+from django.db import models
+
+from .. import constants
+from .. import models as assignment_models
+
+GROUP_BY_FIELDS = {
+    constants.TaskProgressGroupBy.ASSIGNMENT: "assignment_id",
+    constants.TaskProgressGroupBy.ASSIGNEE: "assignee_id",
+    constants.TaskProgressGroupBy.STATUS: "status",
+}
+
+
+def get_percent_completed(completed: int, total: int) -> int:
+    """Return percent of completed tasks among `total` tasks."""
+    return round(completed / (total or 1) * 100)
+
+
+def get_tasks_progress(
+    queryset: models.QuerySet[assignment_models.Task],
+    group_by: str | None = None,
+) -> dict[str, typing.Any]:
+    """Calculate progress of tasks from queryset with a single query.
+
+    Tasks are counted with conditional aggregates on database side, so no
+    task instances are loaded. If `group_by` is provided, progress is
+    calculated per group and overall progress is summed up from groups, so it
+    still takes a single query.
+
+    """
+    aggregates = {
+        "completed": models.Count(
+            "id",
+            filter=models.Q(status=constants.TaskStatus.COMPLETED),
+        ),
+        "total": models.Count(
+            "id",
+            filter=models.Q(status__in=constants.PROGRESS_STATUSES),
+        ),
+    }
+    # Reset ordering, otherwise ordering fields would be added to GROUP BY
+    queryset = queryset.order_by()
+    if not group_by:
+        counts = queryset.aggregate(**aggregates)
+        return {
+            "percent_completed": get_percent_completed(**counts),
+        }
+
+    group_field = GROUP_BY_FIELDS[group_by]
+    groups = [
+        {
+            "key": group[group_field],
+            "completed": group["completed"],
+            "total": group["total"],
+            "percent_completed": get_percent_completed(
+                completed=group["completed"],
+                total=group["total"],
+            ),
+        }
+        for group in queryset.values(group_field)
+        .annotate(**aggregates)
+        .order_by(group_field)
+    ]
+    return {
+        "percent_completed": get_percent_completed(
+            completed=sum(group["completed"] for group in groups),
+            total=sum(group["total"] for group in groups),
+        ),
+        "groups": groups,
+    }
@@ -0,0 +1,175 @@
+import collections.abc
+import contextlib
+import datetime as dt
+import itertools
+import zlib
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+from django.db import connection, models
+from django.utils import timezone
+
+from libs.notifications.email import send_notifications
+
+from .. import constants, notifications
+from .. import models as assignment_models
+
+# Key of advisory lock, which is held while reminders are sent
+DEADLINE_REMINDERS_LOCK = zlib.crc32(b"assignment.deadline_reminders")
+
+# Rows of reminders: id of task or assignment, id and email of user, title
+# and deadline of task or assignment
+ReminderRow = tuple[int, int, str, str, dt.datetime]
+
+
+@contextlib.contextmanager
+def try_advisory_lock(key: int) -> collections.abc.Iterator[bool]:
+    """Try to acquire session-level advisory lock without waiting for it."""
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_try_advisory_lock(%s)", [key])
+        (acquired,) = cursor.fetchone()
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_unlock(%s)", [key])
+
+
+def get_task_reminder_rows(
+    window: dt.timedelta,
+    now: dt.datetime,
+) -> models.QuerySet:
+    """Get rows of unfinished tasks which end within window.
+
+    Tasks are found with range scan of `task_end_idx`. Reminders are sent to
+    assignees, unless they got reminder for the same or smaller window.
+
+    """
+    return (
+        assignment_models.Task.objects.filter(
+            end__gt=now,
+            end__lte=now + window,
+            assignee__isnull=False,
+        )
+        .exclude(status__in=constants.FINISHED_TASK_STATUSES)
+        .exclude(
+            models.Exists(
+                assignment_models.DeadlineReminder.objects.filter(
+                    task=models.OuterRef("pk"),
+                    user=models.OuterRef("assignee"),
+                    window__lte=window,
+                ),
+            ),
+        )
+        .order_by()
+        .values_list("pk", "assignee", "assignee__email", "title", "end")
+    )
+
+
+def get_assignment_reminder_rows(
+    window: dt.timedelta,
+    now: dt.datetime,
+) -> models.QuerySet:
+    """Get rows of assignments, which deadline is within window.
+
+    Assignments are found with range scan of `assignment_deadline_idx`.
+    Reminders are sent to assignees of unfinished tasks of assignment, unless
+    they got reminder for the same or smaller window.
+
+    """
+    return (
+        assignment_models.Task.objects.filter(
+            assignment__deadline__gt=now,
+            assignment__deadline__lte=now + window,
+            assignee__isnull=False,
+        )
+        .exclude(status__in=constants.FINISHED_TASK_STATUSES)
+        .exclude(
+            models.Exists(
+                assignment_models.DeadlineReminder.objects.filter(
+                    assignment=models.OuterRef("assignment"),
+                    user=models.OuterRef("assignee"),
+                    window__lte=window,
+                ),
+            ),
+        )
+        .order_by()
+        .values_list(
+            "assignment",
+            "assignee",
+            "assignee__email",
+            "assignment__title",
+            "assignment__deadline",
+        )
+        .distinct()
+    )
+
+
+def send_reminders_batch(
+    rows: collections.abc.Sequence[ReminderRow],
+    field: str,
+    window: dt.timedelta,
+    email_connection: BaseEmailBackend,
+) -> int:
+    """Record and send reminders of batch.
+
+    Reminders are recorded before sending, so they are never sent twice.
+    Records of reminders which failed to be sent are removed to retry them
+    on next run.
+
+    """
+    reminders = {
+        notifications.DeadlineReminderEmailNotification(
+            email=email,
+            title=title,
+            deadline=deadline,
+        ): assignment_models.DeadlineReminder(
+            user_id=user_id,
+            window=window,
+            **{f"{field}_id": object_id},
+        )
+        for object_id, user_id, email, title, deadline in rows
+    }
+    assignment_models.DeadlineReminder.objects.bulk_create(reminders.values())
+    failed = send_notifications(reminders, connection=email_connection)
+    if failed:
+        assignment_models.DeadlineReminder.objects.filter(
+            pk__in=[reminders[notification].pk for notification in failed],
+        ).delete()
+    return len(reminders) - len(failed)
+
+
+def send_deadline_reminders(now: dt.datetime | None = None) -> int:
+    """Send reminders about approaching deadlines of tasks and assignments.
+
+    Windows are processed from the smallest one, so user gets only the
+    closest reminder. Run is skipped if reminders are already being sent
+    (e.g. by another worker of duplicated beat), emails are sent in batches
+    over a single connection.
+
+    Returns number of sent reminders.
+
+    """
+    now = now or timezone.now()
+    batch_size = settings.DEADLINE_REMINDER_BATCH_SIZE
+    sent = 0
+    with try_advisory_lock(DEADLINE_REMINDERS_LOCK) as acquired:
+        if not acquired:
+            return sent
+        with get_connection() as email_connection:
+            for window in sorted(settings.DEADLINE_REMINDER_WINDOWS):
+                for field, rows in (
+                    ("task", get_task_reminder_rows(window, now)),
+                    ("assignment", get_assignment_reminder_rows(window, now)),
+                ):
+                    rows = rows.iterator(chunk_size=batch_size)
+                    while batch := list(itertools.islice(rows, batch_size)):
+                        sent += send_reminders_batch(
+                            rows=batch,
+                            field=field,
+                            window=window,
+                            email_connection=email_connection,
+                        )
+    return sent
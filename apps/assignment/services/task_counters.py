@@ -0,0 +1,119 @@
+import collections
+import collections.abc
+import functools
+import operator
+
+from django.db import connection, models, transaction
+
+from libs.api.response_cache import invalidate_responses
+
+from .. import models as assignment_models
+
+CounterKey = tuple[int, str]
+CounterDeltas = collections.Counter[CounterKey]
+
+
+def update_task_counters(deltas: CounterDeltas) -> None:
+    """Apply changes to assignment task counters.
+
+    `deltas` maps `(assignment_id, status)` to the number of tasks which were
+    added to (positive) or removed from (negative) the counter.
+
+    Missing counters are created only for increments. Decrement of a missing
+    counter is skipped, since counters of assignment may be already removed
+    during cascade deletion of its tasks.
+
+    All changes are applied with a single `UPDATE` statement using
+    `count = count + delta`, so concurrent updates don't override each other.
+
+    """
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    counter_model = assignment_models.AssignmentTaskCounter
+    counter_model.objects.bulk_create(
+        [
+            counter_model(assignment_id=assignment_id, status=status)
+            for (assignment_id, status), delta in deltas.items()
+            if delta > 0
+        ],
+        ignore_conflicts=True,
+    )
+    conditions = {
+        key: models.Q(assignment_id=key[0], status=key[1]) for key in deltas
+    }
+    counter_model.objects.filter(
+        functools.reduce(operator.or_, conditions.values()),
+    ).update(
+        count=models.F("count")
+        + models.Case(
+            *(
+                models.When(condition, then=models.Value(deltas[key]))
+                for key, condition in conditions.items()
+            ),
+            output_field=models.IntegerField(),
+        ),
+    )
+    invalidate_responses(counter_model)
+
+
+def count_tasks(
+    assignment_ids: collections.abc.Collection[int] | None = None,
+) -> CounterDeltas:
+    """Count tasks per assignment and status."""
+    tasks = assignment_models.Task.objects.order_by()
+    if assignment_ids is not None:
+        tasks = tasks.filter(assignment_id__in=assignment_ids)
+    return collections.Counter(
+        {
+            (row["assignment_id"], row["status"]): row["count"]
+            for row in tasks.values("assignment_id", "status").annotate(
+                count=models.Count("id"),
+            )
+        },
+    )
+
+
+@transaction.atomic
+def rebuild_task_counters(
+    assignment_ids: collections.abc.Collection[int] | None = None,
+) -> int:
+    """Rebuild assignment task counters from tasks.
+
+    Counters table is locked during rebuilding, so tasks changed concurrently
+    update counters only after the rebuild is committed.
+
+    Returns number of counters which were fixed.
+
+    """
+    counter_model = assignment_models.AssignmentTaskCounter
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"LOCK TABLE {counter_model._meta.db_table} "
+            "IN SHARE ROW EXCLUSIVE MODE",
+        )
+    counters = counter_model.objects.all()
+    if assignment_ids is not None:
+        counters = counters.filter(assignment_id__in=assignment_ids)
+
+    actual_counts = count_tasks(assignment_ids)
+    stored_counters = {
+        (counter.assignment_id, counter.status): counter
+        for counter in counters
+    }
+    outdated_counters = []
+    for key, counter in stored_counters.items():
+        if counter.count != actual_counts[key]:
+            counter.count = actual_counts[key]
+            outdated_counters.append(counter)
+    missing_counters = [
+        counter_model(assignment_id=key[0], status=key[1], count=count)
+        for key, count in actual_counts.items()
+        if key not in stored_counters
+    ]
+    counter_model.objects.bulk_update(outdated_counters, fields=["count"])
+    counter_model.objects.bulk_create(missing_counters)
+    if outdated_counters or missing_counters:
+        invalidate_responses(counter_model)
+    return len(outdated_counters) + len(missing_counters)
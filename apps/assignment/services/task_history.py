@@ -0,0 +1,106 @@
+import collections.abc
+import datetime as dt
+import typing
+
+from django.db import connection, models
+from django.db.models.functions import Lead
+from django.utils import timezone
+
+from .. import constants
+from .. import models as assignment_models
+
+
+def record_status_changes(
+    changes: collections.abc.Iterable[assignment_models.TaskStatusChange],
+) -> None:
+    """Append changes of task statuses to history with a single query."""
+    assignment_models.TaskStatusChange.objects.bulk_create(changes)
+
+
+def get_status_analytics(
+    assignment: assignment_models.Assignment,
+    start: dt.datetime,
+    end: dt.datetime,
+) -> dict[str, typing.Any]:
+    """Calculate time-in-status, cycle time and throughput of assignment.
+
+    Everything is calculated by database with a single query. Window
+    functions over status history of each task find when task left each
+    status and when it was started (first moved to in progress). Then
+    changes made within time window are aggregated:
+
+    * time in status - average time between getting status and leaving it,
+      tasks which are still in unfinished status are counted up to now
+    * cycle time - average time between start and completion of tasks
+    * throughput - number of tasks completed within window
+
+    """
+    task_window = {
+        "partition_by": models.F("task_id"),
+        "order_by": (models.F("changed").asc(), models.F("id").asc()),
+    }
+    changes = (
+        assignment_models.TaskStatusChange.objects.filter(
+            task__assignment=assignment,
+        )
+        .annotate(
+            left_at=models.Window(Lead("changed"), **task_window),
+            started_at=models.Window(
+                models.Min(
+                    "changed",
+                    filter=models.Q(
+                        to_status=constants.TaskStatus.IN_PROGRESS,
+                    ),
+                ),
+                **task_window,
+            ),
+        )
+        .order_by()
+        .values("task_id", "to_status", "changed", "left_at", "started_at")
+    )
+    changes_sql, changes_params = changes.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT to_status, COUNT(*), "  # noqa: S608
+            "EXTRACT(EPOCH FROM AVG(COALESCE(left_at, %s) - changed) "
+            "FILTER (WHERE left_at IS NOT NULL "
+            "OR NOT to_status = ANY(%s))), "
+            "EXTRACT(EPOCH FROM AVG(changed - started_at) "
+            "FILTER (WHERE to_status = %s)), "
+            "COUNT(DISTINCT task_id) FILTER (WHERE to_status = %s) "
+            f"FROM ({changes_sql}) AS changes "
+            "WHERE changed BETWEEN %s AND %s "
+            "GROUP BY to_status ORDER BY to_status",
+            (
+                timezone.now(),
+                list(constants.FINISHED_TASK_STATUSES),
+                constants.TaskStatus.COMPLETED,
+                constants.TaskStatus.COMPLETED,
+                *changes_params,
+                start,
+                end,
+            ),
+        )
+        rows = cursor.fetchall()
+
+    statuses = []
+    cycle_time = None
+    throughput = 0
+    for status, count, time_in_status, status_cycle_time, completed in rows:
+        statuses.append(
+            {
+                "status": status,
+                "count": count,
+                "average_time_in_status": time_in_status,
+            },
+        )
+        if status == constants.TaskStatus.COMPLETED:
+            cycle_time = status_cycle_time
+            throughput = completed
+    return {
+        "from": start,
+        "to": end,
+        "statuses": statuses,
+        "cycle_time": cycle_time,
+        "throughput": throughput,
+    }
@@ -0,0 +1,42 @@
+from django.db import models
+from django.utils import timezone
+
+from .. import constants
+from .. import models as assignment_models
+
+TASK_STATS_PREFIX = "task_stats"
+
+
+def get_task_stats_annotation(name: str) -> str:
+    """Get name of annotation with task stat of assignment."""
+    return f"{TASK_STATS_PREFIX}_{name}"
+
+
+def annotate_task_stats(
+    queryset: models.QuerySet[assignment_models.Assignment],
+) -> models.QuerySet[assignment_models.Assignment]:
+    """Annotate assignments with next due date and prefetch task counters.
+
+    Counts of tasks are taken from counters of assignment (check
+    `AssignmentTaskCounter`), prefetched the same way as for
+    `expand=task_counters`, so both expands share one query. Next due date
+    (the nearest end of unfinished task in the future) is taken by
+    correlated subquery in the same query as assignments.
+
+    """
+    next_due = (
+        assignment_models.Task.objects.filter(
+            assignment=models.OuterRef("pk"),
+            end__gte=timezone.now(),
+        )
+        .exclude(status__in=constants.FINISHED_TASK_STATUSES)
+        .order_by()
+        .values("assignment")
+        .annotate(value=models.Min("end"))
+        .values("value")
+    )
+    return queryset.annotate(
+        **{
+            get_task_stats_annotation("next_due"): models.Subquery(next_due),
+        },
+    ).prefetch_related("task_counters")
@@ -0,0 +1,163 @@
+import collections
+import collections.abc
+
+from django.db import connection, transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from apps.users import models as users_models
+from libs.api.response_cache import invalidate_responses
+
+from .. import constants, models
+from .burndown import invalidate_burndown
+from .task_counters import update_task_counters
+from .task_history import record_status_changes
+
+
+@transaction.atomic
+def bulk_create_tasks(tasks: list[models.Task]) -> list[models.Task]:
+    """Create tasks and add them to assignment task counters."""
+    tasks = models.Task.objects.bulk_create(tasks)
+    invalidate_responses(models.Task)
+    update_task_counters(
+        collections.Counter(task.counter_key for task in tasks),
+    )
+    record_status_changes(
+        models.TaskStatusChange(
+            task=task,
+            to_status=task.status,
+            actor_id=task.creator_id,
+        )
+        for task in tasks
+    )
+    for task in tasks:
+        task.loaded_counter_key = task.counter_key
+    return tasks
+
+
+@transaction.atomic
+def bulk_update_tasks(
+    tasks: list[models.Task],
+    fields: collections.abc.Collection[str],
+    actor: users_models.User | None = None,
+) -> list[models.Task]:
+    """Update tasks and move them between assignment task counters.
+
+    Previous assignment and status are taken from tasks loaded from DB, for
+    other tasks they are loaded with a single query. Changes of statuses are
+    recorded to history on behalf of `actor`.
+
+    """
+    unknown_pks = [task.pk for task in tasks if not task.loaded_counter_key]
+    stored_counter_keys = {
+        pk: (assignment_id, status)
+        for pk, assignment_id, status in models.Task.objects.filter(
+            pk__in=unknown_pks,
+        ).values_list("pk", "assignment_id", "status")
+    }
+    models.Task.objects.bulk_update(tasks, fields=fields)
+    invalidate_responses(models.Task)
+
+    previous_counter_keys = [
+        task.loaded_counter_key or stored_counter_keys[task.pk]
+        for task in tasks
+    ]
+    deltas = collections.Counter(task.counter_key for task in tasks)
+    deltas.subtract(previous_counter_keys)
+    update_task_counters(deltas)
+    invalidate_burndown(
+        {
+            assignment_id
+            for task, (previous_assignment_id, _) in zip(
+                tasks,
+                previous_counter_keys,
+                strict=True,
+            )
+            if previous_assignment_id != task.assignment_id
+            for assignment_id in (previous_assignment_id, task.assignment_id)
+        },
+    )
+    record_status_changes(
+        models.TaskStatusChange(
+            task=task,
+            from_status=previous_status,
+            to_status=task.status,
+            actor=actor,
+        )
+        for task, (_, previous_status) in zip(
+            tasks,
+            previous_counter_keys,
+            strict=True,
+        )
+        if previous_status != task.status
+    )
+    for task in tasks:
+        task.loaded_counter_key = task.counter_key
+    return tasks
+
+
+def get_transition_sources(status: str) -> list[str]:
+    """Get statuses from which task can be moved to `status`."""
+    return [
+        source
+        for source, targets in constants.TASK_STATUS_TRANSITIONS.items()
+        if status in targets
+    ]
+
+
+@transaction.atomic
+def transition_tasks(
+    queryset: QuerySet[models.Task],
+    status: str,
+    actor: users_models.User | None = None,
+) -> list[int]:
+    """Move tasks to `status` with a single `UPDATE` statement.
+
+    Only tasks which can be moved to `status` according to
+    `TASK_STATUS_TRANSITIONS` are updated, other tasks are skipped by the
+    database. Tasks are locked before update, so previous statuses returned
+    by the statement are actual and are used to update task counters and
+    to record status history on behalf of `actor`.
+
+    Returns ids of moved tasks.
+
+    """
+    tasks = (
+        models.Task.objects.filter(
+            pk__in=queryset.order_by().values("pk"),
+            status__in=get_transition_sources(status),
+        )
+        .order_by()
+        .select_for_update()
+        .values("id", "status")
+    )
+    tasks_sql, tasks_params = tasks.query.sql_with_params()
+    changed = timezone.now()
+    table = connection.ops.quote_name(models.Task._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {table} SET status = %s, modified = %s "  # noqa: S608
+            f"FROM ({tasks_sql}) AS old WHERE {table}.id = old.id "
+            f"RETURNING {table}.id, {table}.assignment_id, old.status",
+            (status, changed, *tasks_params),
+        )
+        rows = cursor.fetchall()
+    if rows:
+        invalidate_responses(models.Task)
+
+    deltas = collections.Counter()
+    for _, assignment_id, previous_status in rows:
+        deltas[(assignment_id, previous_status)] -= 1
+        deltas[(assignment_id, status)] += 1
+    update_task_counters(deltas)
+    record_status_changes(
+        models.TaskStatusChange(
+            task_id=task_id,
+            from_status=previous_status,
+            to_status=status,
+            actor=actor,
+            changed=changed,
+        )
+        for task_id, _, previous_status in rows
+    )
+    return sorted(task_id for task_id, _, _ in rows)
@@ -0,0 +1,71 @@
+import typing
+
+from django.db import models
+from django.utils import timezone
+
+from .. import constants
+from .. import models as assignment_models
+
+
+def get_workload(
+    queryset: models.QuerySet[assignment_models.Task],
+) -> list[dict[str, typing.Any]]:
+    """Calculate workload of each assignee of tasks with a single query.
+
+    Tasks are grouped by assignee and counted per status with conditional
+    aggregates. Overdue tasks are unfinished tasks which should have ended
+    already, next due date is the nearest end of unfinished task. Assignees
+    are ordered by number of completed tasks, so result can be used as a
+    leaderboard.
+
+    """
+    now = timezone.now()
+    unfinished = ~models.Q(status__in=constants.FINISHED_TASK_STATUSES)
+    aggregates = {
+        status: models.Count("id", filter=models.Q(status=status))
+        for status in constants.TaskStatus.values
+    }
+    # Reset ordering, otherwise ordering fields would be added to GROUP BY
+    rows = (
+        queryset.order_by()
+        .values(
+            "assignee",
+            "assignee__first_name",
+            "assignee__last_name",
+            "assignee__email",
+        )
+        .annotate(
+            **aggregates,
+            total=models.Count("id"),
+            overdue=models.Count(
+                "id",
+                filter=unfinished & models.Q(end__lt=now),
+            ),
+            next_due=models.Min(
+                "end",
+                filter=unfinished & models.Q(end__gte=now),
+            ),
+        )
+        .order_by(
+            f"-{constants.TaskStatus.COMPLETED}",
+            models.F("assignee").asc(nulls_last=True),
+        )
+    )
+    return [
+        {
+            "assignee": row["assignee"],
+            "assignee_data": {
+                "id": row["assignee"],
+                "first_name": row["assignee__first_name"],
+                "last_name": row["assignee__last_name"],
+                "email": row["assignee__email"],
+            }
+            if row["assignee"]
+            else None,
+            "counts": {status: row[status] for status in aggregates},
+            "total": row["total"],
+            "overdue": row["overdue"],
+            "next_due": row["next_due"],
+        }
+        for row in rows
+    ]
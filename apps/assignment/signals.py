@@ -0,0 +1,128 @@
+import collections
+
+from django.db.models import signals
+from django.dispatch import receiver
+
+from libs.api.response_cache import invalidate_responses
+
+from . import models, services
+
+
+def _get_stored_counter_key(task: models.Task) -> tuple[int, str] | None:
+    """Get assignment and status of task stored in DB."""
+    return (
+        models.Task.objects.filter(pk=task.pk)
+        .values_list("assignment_id", "status")
+        .first()
+    )
+
+
+@receiver(signals.pre_save, sender=models.Task)
+def load_task_counter_key(instance: models.Task, **kwargs) -> None:
+    """Load stored assignment and status if they are unknown for update."""
+    if instance._state.adding or instance.loaded_counter_key:
+        return
+    instance.loaded_counter_key = _get_stored_counter_key(instance)
+
+
+# Must be connected before `update_task_counters_on_save`, which replaces
+# loaded assignment and status of task with the saved ones
+@receiver(signals.post_save, sender=models.Task)
+def invalidate_burndown_on_move(
+    instance: models.Task,
+    created: bool,
+    **kwargs,
+) -> None:
+    """Drop cached burndowns of assignments task was moved between."""
+    if created or not instance.loaded_counter_key:
+        return
+    previous_assignment_id = instance.loaded_counter_key[0]
+    if previous_assignment_id != instance.assignment_id:
+        services.invalidate_burndown(
+            (previous_assignment_id, instance.assignment_id),
+        )
+
+
+@receiver(signals.post_save, sender=models.Task)
+def record_task_status_change(
+    instance: models.Task,
+    created: bool,
+    **kwargs,
+) -> None:
+    """Record new status of task to status history."""
+    if created:
+        from_status, actor_id = "", instance.creator_id
+    elif instance.loaded_counter_key and instance.counter_key:
+        from_status = instance.loaded_counter_key[1]
+        actor_id = getattr(instance.status_changed_by, "pk", None)
+    else:
+        return
+    if from_status == instance.status:
+        return
+    services.record_status_changes(
+        [
+            models.TaskStatusChange(
+                task=instance,
+                from_status=from_status,
+                to_status=instance.status,
+                actor_id=actor_id,
+            ),
+        ],
+    )
+
+
+@receiver(signals.post_save, sender=models.Task)
+def update_task_counters_on_save(
+    instance: models.Task,
+    created: bool,
+    **kwargs,
+) -> None:
+    """Move task between assignment task counters."""
+    counter_key = instance.counter_key or _get_stored_counter_key(instance)
+    deltas = collections.Counter({counter_key: 1})
+    if not created and instance.loaded_counter_key:
+        deltas[instance.loaded_counter_key] -= 1
+    services.update_task_counters(deltas)
+    instance.loaded_counter_key = counter_key
+
+
+@receiver(signals.post_delete, sender=models.Task)
+def update_task_counters_on_delete(
+    instance: models.Task,
+    **kwargs,
+) -> None:
+    """Remove deleted task from assignment task counter."""
+    if counter_key := instance.loaded_counter_key or instance.counter_key:
+        services.update_task_counters(collections.Counter({counter_key: -1}))
+
+
+@receiver(signals.post_delete, sender=models.Task)
+def invalidate_burndown_on_delete(
+    instance: models.Task,
+    **kwargs,
+) -> None:
+    """Drop cached burndown of assignment of deleted task."""
+    services.invalidate_burndown((instance.assignment_id,))
+
+
+@receiver(signals.post_delete, sender=models.Assignment)
+def invalidate_cascaded_on_delete(
+    instance: models.Assignment,
+    **kwargs,
+) -> None:
+    """Invalidate data of tasks and counters deleted by DB cascade."""
+    invalidate_responses(models.Task)
+    invalidate_responses(models.AssignmentTaskCounter)
+    services.invalidate_burndown((instance.pk,))
+
+
+@receiver(signals.post_save, sender=models.Task)
+@receiver(signals.post_delete, sender=models.Task)
+@receiver(signals.post_save, sender=models.Assignment)
+@receiver(signals.post_delete, sender=models.Assignment)
+def invalidate_cached_responses(
+    sender: type[models.Task | models.Assignment],
+    **kwargs,
+) -> None:
+    """Invalidate cached responses which depend on changed model."""
+    invalidate_responses(sender)
@@ -0,0 +1,33 @@
+import logging
+
+from config.celery import app
+
+from . import services
+
+logger = logging.getLogger("django")
+
+
+@app.task(ignore_result=True)
+def send_deadline_reminders() -> None:
+    """Send reminders about approaching deadlines.
+
+    Scheduled by celery beat (check `CELERY_BEAT_SCHEDULE` setting).
+
+    """
+    sent = services.send_deadline_reminders()
+    logger.info("Sent %s deadline reminder(s)", sent)
+
+
+@app.task(ignore_result=True)
+def purge_assignment(assignment_id: int) -> None:
+    """Delete assignment with many tasks in batches.
+
+    Enqueued by `services.delete_assignment`.
+
+    """
+    deleted = services.purge_assignment(assignment_id)
+    logger.info(
+        "Deleted assignment %s with %s task(s)",
+        assignment_id,
+        deleted,
+    )
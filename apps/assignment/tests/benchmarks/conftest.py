@@ -0,0 +1,26 @@
+import pytest
+
+from apps.users import factories as users_factories
+from apps.users import models as users_models
+
+from ... import factories
+
+# Page sizes of measured lists
+PAGE_SIZES = (25, 100)
+
+
+@pytest.fixture
+def benchmark_user() -> users_models.User:
+    """Create user with assignments and tasks for the largest page."""
+    user = users_factories.UserFactory(avatar=None)
+    for assignment in factories.AssignmentFactory.create_batch(
+        size=max(PAGE_SIZES),
+        creator=user,
+    ):
+        factories.TaskFactory.create_batch(
+            size=2,
+            assignment=assignment,
+            creator=user,
+            assignee=user,
+        )
+    return user
@@ -0,0 +1,53 @@
+import statistics
+import sys
+import time
+
+from rest_framework import renderers, test
+from rest_framework.request import Request
+
+import pytest
+
+from apps.users import models as users_models
+from libs.api.renderers import ORJSONRenderer
+
+from ... import models
+from ...api import serializers
+from .conftest import PAGE_SIZES
+
+pytestmark = pytest.mark.benchmark
+
+# Number of measured renders per case
+REPEAT = 200
+
+
+def measure(renderer: renderers.BaseRenderer, data: list) -> float:
+    """Get median time of rendering in milliseconds."""
+    timings = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        renderer.render(data)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+@pytest.mark.parametrize("limit", PAGE_SIZES)
+def test_json_renderers(
+    limit: int,
+    benchmark_user: users_models.User,
+    capsys: pytest.CaptureFixture,
+):
+    """Compare orjson renderer with drf renderer on pages of tasks."""
+    data = serializers.TaskSerializer(
+        models.Task.objects.filter(assignee=benchmark_user)[:limit],
+        many=True,
+        context={"request": Request(test.APIRequestFactory().get("/"))},
+    ).data
+    drf_time = measure(renderers.JSONRenderer(), data)
+    orjson_time = measure(ORJSONRenderer(), data)
+    with capsys.disabled():
+        sys.stdout.write(
+            f"\nTaskSerializer limit={limit}: "
+            f"drf {drf_time:.3f} ms, "
+            f"orjson {orjson_time:.3f} ms, "
+            f"x{drf_time / orjson_time:.2f}\n",
+        )
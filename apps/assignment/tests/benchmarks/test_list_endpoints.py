@@ -0,0 +1,72 @@
+import statistics
+import sys
+import time
+
+from rest_framework import mixins, status, test
+
+import pytest
+
+from apps.core.api.mixins import ValuesListMixin
+from apps.users import models as users_models
+
+from ...api import views
+from .conftest import PAGE_SIZES
+
+pytestmark = pytest.mark.benchmark
+
+# Number of measured requests per case
+REPEAT = 50
+
+
+def measure(
+    viewset: type,
+    user: users_models.User,
+    limit: int,
+) -> float:
+    """Get median time of list request in milliseconds."""
+    view = viewset.as_view({"get": "list"})
+    factory = test.APIRequestFactory()
+    timings = []
+    for _ in range(REPEAT):
+        request = factory.get("/", {"limit": limit})
+        test.force_authenticate(request, user=user)
+        started = time.perf_counter()
+        response = view(request)
+        response.render()
+        timings.append((time.perf_counter() - started) * 1000)
+        assert response.status_code == status.HTTP_200_OK
+    return statistics.median(timings)
+
+
+@pytest.mark.parametrize(
+    "viewset",
+    [views.TaskViewSet, views.AssignmentViewSet],
+)
+@pytest.mark.parametrize("limit", PAGE_SIZES)
+def test_values_list(
+    viewset: type,
+    limit: int,
+    benchmark_user: users_models.User,
+    capsys: pytest.CaptureFixture,
+):
+    """Compare lists represented from values and from model instances."""
+    # Cached responses and validators are bypassed to measure listing
+    values_viewset = type(
+        f"Values{viewset.__name__}",
+        (viewset,),
+        {"list": ValuesListMixin.list},
+    )
+    instances_viewset = type(
+        f"Instances{viewset.__name__}",
+        (viewset,),
+        {"list": mixins.ListModelMixin.list},
+    )
+    values_time = measure(values_viewset, benchmark_user, limit)
+    instances_time = measure(instances_viewset, benchmark_user, limit)
+    with capsys.disabled():
+        sys.stdout.write(
+            f"\n{viewset.__name__} limit={limit}: "
+            f"values {values_time:.2f} ms, "
+            f"instances {instances_time:.2f} ms, "
+            f"x{instances_time / values_time:.2f}\n",
+        )
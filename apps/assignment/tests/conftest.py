@@ -0,0 +1,31 @@
+import pytest
+
+from apps.users import models as users_models
+
+from .. import constants, factories, models
+
+
+@pytest.fixture
+def assignment() -> models.Assignment:
+    """Create assignment for testing."""
+    return factories.AssignmentFactory()
+
+
+@pytest.fixture
+def tasks(
+    assignment: models.Assignment,
+    user: users_models.User,
+) -> list[models.Task]:
+    """Create tasks with every status for testing.
+
+    There is one task for each status in `assignment` assigned to `user`.
+
+    """
+    return [
+        factories.TaskFactory(
+            assignment=assignment,
+            assignee=user,
+            status=status,
+        )
+        for status in constants.TaskStatus.values
+    ]
@@ -0,0 +1,238 @@
+import collections.abc
+import datetime as dt
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+from django.utils import timezone
+
+from rest_framework import serializers, status, test
+from rest_framework.response import Response
+
+import pytest
+import pytest_django
+
+from ... import constants, factories, models
+
+
+def test_list_expand_task_counters(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+    django_assert_num_queries: pytest_django.DjangoAssertNumQueries,
+):
+    """Test that task counters of all assignments are loaded at once."""
+    factories.AssignmentFactory.create_batch(size=3)
+    # Savepoint, count, assignments, counters and release of savepoint
+    with django_assert_num_queries(5):
+        response: Response = user_api_client.get(
+            path=reverse_lazy("v1:assignment-list"),
+            data={"expand": "task_counters"},
+        )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    task_counters = {
+        item["id"]: item["task_counters"] for item in response.data["results"]
+    }
+    assert task_counters.pop(tasks[0].assignment_id) == dict.fromkeys(
+        constants.TaskStatus.values,
+        1,
+    )
+    assert all(
+        counters == dict.fromkeys(constants.TaskStatus.values, 0)
+        for counters in task_counters.values()
+    )
+
+
+@pytest.mark.parametrize(
+    argnames="expand",
+    argvalues=["", "creator_data"],
+)
+def test_retrieve_without_task_counters(
+    user_api_client: test.APIClient,
+    assignment: models.Assignment,
+    expand: str,
+):
+    """Test that task counters are not included unless requested."""
+    response: Response = user_api_client.get(
+        path=reverse_lazy(
+            "v1:assignment-detail",
+            kwargs={"pk": assignment.pk},
+        ),
+        data={"expand": expand},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert "task_counters" not in response.data
+    assert "task_stats" not in response.data
+
+
+def test_list_expand_task_stats(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+    django_assert_num_queries: pytest_django.DjangoAssertNumQueries,
+):
+    """Test that task stats of all assignments are loaded at once."""
+    now = timezone.now()
+    models.Task.objects.update(end=now + dt.timedelta(days=3))
+    models.Task.objects.filter(pk=tasks[0].pk).update(
+        end=now + dt.timedelta(days=1),
+    )
+    models.Task.objects.filter(pk=tasks[1].pk).update(
+        end=now + dt.timedelta(days=2),
+    )
+    models.Task.objects.filter(pk=tasks[-1].pk).update(
+        end=now + dt.timedelta(hours=1),
+    )
+    models.Task.objects.filter(pk=tasks[2].pk).update(
+        end=now - dt.timedelta(days=1),
+    )
+    factories.AssignmentFactory.create_batch(size=3)
+    # Savepoint, count, assignments with next due date, task counters and
+    # release of savepoint
+    with django_assert_num_queries(5):
+        response: Response = user_api_client.get(
+            path=reverse_lazy("v1:assignment-list"),
+            data={"expand": "task_stats"},
+        )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    task_stats = {
+        item["id"]: item["task_stats"] for item in response.data["results"]
+    }
+    stats = task_stats.pop(tasks[0].assignment_id)
+    assert stats["total"] == len(tasks)
+    assert stats["counts"] == dict.fromkeys(constants.TaskStatus.values, 1)
+    assert stats["next_due"] == serializers.DateTimeField().to_representation(
+        now + dt.timedelta(days=1),
+    )
+    assert all(
+        stats
+        == {
+            "total": 0,
+            "counts": dict.fromkeys(constants.TaskStatus.values, 0),
+            "next_due": None,
+        }
+        for stats in task_stats.values()
+    )
+
+
+def test_list_expand_task_counters_and_stats(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+    django_assert_num_queries: pytest_django.DjangoAssertNumQueries,
+):
+    """Test that task counters and stats share prefetched counters."""
+    # Savepoint, count, assignments with next due date, task counters and
+    # release of savepoint
+    with django_assert_num_queries(5):
+        response: Response = user_api_client.get(
+            path=reverse_lazy("v1:assignment-list"),
+            data={"expand": "task_counters,task_stats"},
+        )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert all(
+        item["task_stats"]["counts"] == item["task_counters"]
+        for item in response.data["results"]
+    )
+
+
+def test_retrieve_expand_task_stats(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+):
+    """Test that task stats reflect changes of tasks."""
+    url = reverse_lazy(
+        "v1:assignment-detail",
+        kwargs={"pk": tasks[0].assignment_id},
+    )
+    user_api_client.get(path=url, data={"expand": "task_stats"})
+    tasks[0].status = constants.TaskStatus.COMPLETED
+    tasks[0].save()
+    response: Response = user_api_client.get(
+        path=url,
+        data={"expand": "task_stats"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert response.data["task_stats"]["counts"][tasks[0].status] == 2
+
+
+def delete_assignment(
+    user_api_client: test.APIClient,
+    assignment: models.Assignment,
+) -> Response:
+    """Delete assignment of user."""
+    models.Assignment.objects.filter(pk=assignment.pk).update(
+        creator=assignment.tasks.get(
+            status=constants.TaskStatus.BACKLOG,
+        ).assignee,
+    )
+    return user_api_client.delete(
+        path=reverse_lazy(
+            "v1:assignment-detail",
+            kwargs={"pk": assignment.pk},
+        ),
+    )
+
+
+def test_delete_cascaded_by_db(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+):
+    """Test that tasks with related rows are deleted without loading them."""
+    assignment = tasks[0].assignment
+    other_task = factories.TaskFactory()
+    with CaptureQueriesContext(connection) as context:
+        response = delete_assignment(user_api_client, assignment)
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert not any(
+        f'FROM "{models.Task._meta.db_table}"' in query["sql"]
+        and "LIMIT" not in query["sql"]
+        for query in context.captured_queries
+    )
+    assert list(models.Task.objects.all()) == [other_task]
+    assert not models.TaskStatusChange.objects.exclude(
+        task=other_task,
+    ).exists()
+    assert not models.AssignmentTaskCounter.objects.filter(
+        assignment_id=assignment.pk,
+    ).exists()
+
+
+def test_delete_large_assignment(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+    settings: pytest_django.fixtures.SettingsWrapper,
+    django_capture_on_commit_callbacks: collections.abc.Callable,
+):
+    """Test that assignment with many tasks is purged in background."""
+    settings.ASSIGNMENT_ASYNC_DELETE_THRESHOLD = len(tasks) - 1
+    settings.ASSIGNMENT_DELETE_BATCH_SIZE = 4
+    assignment = tasks[0].assignment
+    other_task = factories.TaskFactory()
+    with django_capture_on_commit_callbacks() as callbacks:
+        response = delete_assignment(user_api_client, assignment)
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert models.Task.objects.filter(assignment=assignment).exists()
+
+    # Assignment being deleted is hidden and tasks can't be added to it
+    detail_url = reverse_lazy(
+        "v1:assignment-detail",
+        kwargs={"pk": assignment.pk},
+    )
+    with django_capture_on_commit_callbacks() as repeated_callbacks:
+        response = user_api_client.delete(path=detail_url)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert not repeated_callbacks
+    response = user_api_client.get(path=detail_url)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    response = user_api_client.post(
+        path=reverse_lazy("v1:task-list"),
+        data={"assignment": assignment.pk, "title": "Task"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data["errors"][0]["attr"] == "assignment"
+
+    for callback in callbacks:
+        callback()
+    assert not models.Assignment.objects.filter(pk=assignment.pk).exists()
+    assert list(models.Task.objects.all()) == [other_task]
+    assert list(
+        models.AssignmentTaskCounter.objects.values_list("count", flat=True),
+    ) == [1]
@@ -0,0 +1,81 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+
+from rest_framework import status, test
+from rest_framework.response import Response
+
+import pytest
+import pytest_django
+
+from apps.users import models as users_models
+
+from ... import models
+
+
+def batch_get(
+    api_client: test.APIClient,
+    url_name: str,
+    ids: list,
+) -> Response:
+    """Retrieve objects by ids."""
+    return api_client.post(
+        path=reverse_lazy(url_name),
+        data={"ids": ids},
+        format="json",
+    )
+
+
+def test_batch_get_tasks(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+    django_assert_num_queries: pytest_django.DjangoAssertNumQueries,
+):
+    """Test that tasks are retrieved by a single query keyed by id."""
+    ids = [tasks[2].pk, tasks[0].pk, max(task.pk for task in tasks) + 1]
+    # Savepoint of request, select of tasks and savepoint release
+    with django_assert_num_queries(3):
+        response = batch_get(user_api_client, "v1:task-batch_get", ids)
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert response.data.keys() == {str(tasks[0].pk), str(tasks[2].pk)}
+    assert response.data[str(tasks[2].pk)]["title"] == tasks[2].title
+
+
+def test_batch_get_uses_any(
+    user_api_client: test.APIClient,
+    assignment: models.Assignment,
+):
+    """Test that ids are passed as a single array."""
+    with CaptureQueriesContext(connection) as context:
+        response = batch_get(
+            user_api_client,
+            "v1:assignment-batch_get",
+            [assignment.pk],
+        )
+    assert response.data[str(assignment.pk)]["id"] == assignment.pk
+    assert any(
+        '"assignment_assignment"."id" = ANY(' in query["sql"]
+        for query in context.captured_queries
+    )
+
+
+def test_batch_get_users(
+    user: users_models.User,
+    api_client: test.APIClient,
+    admin: users_models.User,
+):
+    """Test that users are retrieved by ids."""
+    api_client.force_authenticate(user=admin)
+    response = batch_get(api_client, "v1:users-batch_get", [user.pk])
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert response.data[str(user.pk)]["email"] == user.email
+
+
+@pytest.mark.parametrize(
+    argnames="ids",
+    argvalues=[[], ["a"], list(range(1, 102))],
+)
+def test_batch_get_invalid_ids(user_api_client: test.APIClient, ids: list):
+    """Test that empty, invalid and too many ids are rejected."""
+    response = batch_get(user_api_client, "v1:task-batch_get", ids)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,123 @@
+import datetime as dt
+
+from django.urls import reverse_lazy
+from django.utils import timezone
+
+from rest_framework import status, test
+from rest_framework.response import Response
+
+import pytest
+
+from ... import constants, factories, models
+
+DAY = dt.timedelta(days=1)
+
+
+def get_burndown(
+    api_client: test.APIClient,
+    assignment: models.Assignment,
+) -> list[tuple[int, int]]:
+    """Get burndown of assignment as remaining and completed per day."""
+    response: Response = api_client.get(
+        path=reverse_lazy(
+            "v1:assignment-burndown",
+            kwargs={"pk": assignment.pk},
+        ),
+    )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    return [
+        (day["remaining"], day["completed"]) for day in response.data["days"]
+    ]
+
+
+def create_task(
+    assignment: models.Assignment,
+    *changes: tuple[str, dt.datetime],
+) -> models.Task:
+    """Create task of assignment with given status history."""
+    task = factories.TaskFactory(
+        assignment=assignment,
+        status=changes[-1][0],
+    )
+    models.Task.objects.filter(pk=task.pk).update(created=changes[0][1])
+    task.status_changes.all().delete()
+    models.TaskStatusChange.objects.bulk_create(
+        models.TaskStatusChange(task=task, to_status=to_status, changed=when)
+        for to_status, when in changes
+    )
+    return task
+
+
+@pytest.fixture
+def burndown_assignment() -> models.Assignment:
+    """Create assignment with tasks created and completed on past days."""
+    now = timezone.now()
+    assignment = factories.AssignmentFactory(
+        start=now - 3 * DAY,
+        deadline=now + 3 * DAY,
+    )
+    create_task(
+        assignment,
+        (constants.TaskStatus.READY, now - 3 * DAY),
+        (constants.TaskStatus.COMPLETED, now - DAY),
+    )
+    create_task(assignment, (constants.TaskStatus.READY, now - 2 * DAY))
+    create_task(assignment, (constants.TaskStatus.CANCELED, now))
+    return assignment
+
+
+def test_burndown(
+    user_api_client: test.APIClient,
+    burndown_assignment: models.Assignment,
+):
+    """Test that tasks are counted by their statuses at the end of days."""
+    assert get_burndown(user_api_client, burndown_assignment) == [
+        (1, 0),
+        (2, 0),
+        (1, 1),
+        (1, 1),
+    ]
+
+
+def test_burndown_cached(
+    user_api_client: test.APIClient,
+    burndown_assignment: models.Assignment,
+):
+    """Test that past days are cached and today is recounted."""
+    get_burndown(user_api_client, burndown_assignment)
+    models.TaskStatusChange.objects.update(
+        to_status=constants.TaskStatus.COMPLETED,
+    )
+    assert get_burndown(user_api_client, burndown_assignment) == [
+        (1, 0),
+        (2, 0),
+        (1, 1),
+        (0, 3),
+    ]
+
+    burndown_assignment.tasks.filter(
+        status=constants.TaskStatus.CANCELED,
+    ).get().delete()
+    assert get_burndown(user_api_client, burndown_assignment) == [
+        (0, 1),
+        (0, 2),
+        (0, 2),
+        (0, 2),
+    ]
+
+
+def test_burndown_moved_task(
+    user_api_client: test.APIClient,
+    burndown_assignment: models.Assignment,
+):
+    """Test that moving task to another assignment drops cached days."""
+    get_burndown(user_api_client, burndown_assignment)
+    task = burndown_assignment.tasks.get(status=constants.TaskStatus.READY)
+    task.assignment = factories.AssignmentFactory()
+    task.save()
+    assert get_burndown(user_api_client, burndown_assignment) == [
+        (1, 0),
+        (1, 0),
+        (0, 1),
+        (0, 1),
+    ]
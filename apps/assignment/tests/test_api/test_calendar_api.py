@@ -0,0 +1,136 @@
+import datetime as dt
+
+from django.db import connection
+from django.urls import reverse_lazy
+
+from rest_framework import status, test
+from rest_framework.response import Response
+
+import pytest
+
+from apps.users import models as users_models
+
+from ... import factories, models, services
+
+WINDOW_START = dt.datetime(2030, 1, 10, tzinfo=dt.UTC)
+WINDOW_END = dt.datetime(2030, 1, 20, tzinfo=dt.UTC)
+
+
+def get_calendar(api_client: test.APIClient, **params) -> Response:
+    """Get calendar for time window."""
+    return api_client.get(
+        path=reverse_lazy("v1:calendar-list"),
+        data={
+            "from": WINDOW_START.isoformat(),
+            "to": WINDOW_END.isoformat(),
+            **params,
+        },
+    )
+
+
+@pytest.fixture
+def calendar_tasks(user: users_models.User) -> list[models.Task]:
+    """Create tasks of user in time window, outside of it and without dates.
+
+    First tasks are inside window, last ones shouldn't be in calendar.
+
+    """
+    assignment = factories.AssignmentFactory(start=None, deadline=None)
+    day = dt.timedelta(days=1)
+    periods = (
+        (WINDOW_START - day, WINDOW_START),
+        (WINDOW_START + day, None),
+        (WINDOW_END + day, WINDOW_START + day),
+        (WINDOW_END + day, WINDOW_END + 2 * day),
+        (None, None),
+    )
+    return [
+        factories.TaskFactory(
+            assignment=assignment,
+            assignee=user,
+            start=start,
+            end=end,
+        )
+        for start, end in periods
+    ]
+
+
+def test_calendar_tasks(
+    user_api_client: test.APIClient,
+    calendar_tasks: list[models.Task],
+):
+    """Test that only tasks of user overlapping window are returned."""
+    factories.TaskFactory(start=WINDOW_START, end=WINDOW_END)
+    response = get_calendar(user_api_client)
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert [task["id"] for task in response.data["tasks"]] == [
+        task.pk for task in calendar_tasks[:3]
+    ]
+    assert set(response.data["tasks"][0]) == {
+        "id",
+        "assignment",
+        "title",
+        "status",
+        "start",
+        "end",
+    }
+    assert response.data["assignments"] == []
+
+
+def test_calendar_assignments(
+    user: users_models.User,
+    user_api_client: test.APIClient,
+):
+    """Test that assignments of user or with tasks of user are returned."""
+    created = factories.AssignmentFactory(
+        creator=user,
+        start=WINDOW_START,
+        deadline=WINDOW_END,
+    )
+    with_task = factories.AssignmentFactory(
+        start=WINDOW_END,
+        deadline=WINDOW_END + dt.timedelta(days=7),
+    )
+    factories.TaskFactory(
+        assignment=with_task,
+        assignee=user,
+        start=None,
+        end=None,
+    )
+    factories.AssignmentFactory(start=WINDOW_START, deadline=WINDOW_END)
+    response = get_calendar(user_api_client)
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert [item["id"] for item in response.data["assignments"]] == [
+        created.pk,
+        with_task.pk,
+    ]
+
+
+def test_calendar_invalid_window(user_api_client: test.APIClient):
+    """Test that reversed or too long window is rejected."""
+    response = get_calendar(user_api_client, to=WINDOW_START - dt.timedelta(1))
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data["errors"][0]["attr"] == "to"
+
+    response = get_calendar(
+        user_api_client,
+        to=(WINDOW_START + dt.timedelta(days=400)).isoformat(),
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = user_api_client.get(path=reverse_lazy("v1:calendar-list"))
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert {error["attr"] for error in response.data["errors"]} == {
+        "from",
+        "to",
+    }
+
+
+@pytest.mark.usefixtures("calendar_tasks")
+def test_calendar_uses_index(user: users_models.User):
+    """Test that overlap queries use GiST indexes of periods."""
+    calendar = services.get_calendar(user, WINDOW_START, WINDOW_END)
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_seqscan = off")
+    assert "task_period_idx" in calendar["tasks"].explain()
+    assert "assignment_period_idx" in calendar["assignments"].explain()
@@ -0,0 +1,122 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+
+from rest_framework import status, test
+from rest_framework.response import Response
+
+import pytest_django
+
+from apps.users import models as users_models
+
+from ... import constants, models
+
+
+def get_etag(api_client: test.APIClient, url: str, **params) -> str:
+    """Get list or detail and return its ETag."""
+    response: Response = api_client.get(path=url, data=params)
+    assert response.status_code == status.HTTP_200_OK
+    return response["ETag"]
+
+
+def test_list_not_modified(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+    django_assert_num_queries: pytest_django.DjangoAssertNumQueries,
+):
+    """Test that actual list is answered with 304 by a single query."""
+    url = reverse_lazy("v1:task-list")
+    etag = get_etag(user_api_client, url)
+    # Otherwise cached response is answered without validators
+    cache.clear()
+    # Savepoint of request, aggregate of validators and savepoint release
+    with django_assert_num_queries(3):
+        response: Response = user_api_client.get(
+            path=url,
+            headers={"If-None-Match": etag},
+        )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response["ETag"] == etag
+    assert not response.content
+
+
+def test_list_count_reused(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+):
+    """Test that paginator reuses count of validators."""
+    with CaptureQueriesContext(connection) as context:
+        response: Response = user_api_client.get(
+            path=reverse_lazy("v1:task-list"),
+        )
+    assert response.data["count"] == len(tasks)
+    sql = " ".join(query["sql"] for query in context.captured_queries)
+    assert sql.count("COUNT(") == 1
+
+
+def test_list_etag_changes(
+    user: users_models.User,
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+):
+    """Test that list ETag changes with objects, related objects and params."""
+    url = reverse_lazy("v1:task-list")
+    etags = {get_etag(user_api_client, url)}
+
+    tasks[0].title = "Changed"
+    tasks[0].save()
+    etags.add(get_etag(user_api_client, url))
+
+    user.first_name = "Changed"
+    user.save()
+    etags.add(get_etag(user_api_client, url))
+
+    tasks[1].delete()
+    etags.add(get_etag(user_api_client, url))
+
+    etags.add(
+        get_etag(user_api_client, url, status=constants.TaskStatus.READY),
+    )
+    assert len(etags) == 5
+
+
+def test_detail_not_modified(
+    user_api_client: test.APIClient,
+    assignment: models.Assignment,
+):
+    """Test that detail has both validators and is answered with 304."""
+    url = reverse_lazy("v1:assignment-detail", kwargs={"pk": assignment.pk})
+    response: Response = user_api_client.get(path=url)
+    assert response.status_code == status.HTTP_200_OK
+    etag = response["ETag"]
+    last_modified = response["Last-Modified"]
+
+    response = user_api_client.get(
+        path=url,
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    response = user_api_client.get(
+        path=url,
+        headers={"If-Modified-Since": last_modified},
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    assignment.title = "Changed"
+    assignment.save()
+    response = user_api_client.get(
+        path=url,
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["title"] == "Changed"
+
+
+def test_detail_not_found(user_api_client: test.APIClient):
+    """Test that missing object isn't validated."""
+    response: Response = user_api_client.get(
+        path=reverse_lazy("v1:assignment-detail", kwargs={"pk": 0}),
+        headers={"If-None-Match": "*"},
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,107 @@
+import datetime as dt
+
+from django.urls import reverse_lazy
+from django.utils import timezone
+
+from rest_framework import status, test
+from rest_framework.response import Response
+
+import pytest_django
+
+from apps.users import models as users_models
+
+from ... import constants, factories, models
+
+
+def get_dashboard(api_client: test.APIClient) -> Response:
+    """Get dashboard of current user."""
+    response: Response = api_client.get(path=reverse_lazy("v1:dashboard-list"))
+    assert response.status_code == status.HTTP_200_OK, response.data
+    return response
+
+
+def test_dashboard(
+    user: users_models.User,
+    user_api_client: test.APIClient,
+    assignment: models.Assignment,
+    tasks: list[models.Task],
+    django_assert_num_queries: pytest_django.DjangoAssertNumQueries,
+):
+    """Test that dashboard is loaded with fixed number of queries."""
+    now = timezone.now()
+    models.Assignment.objects.filter(pk=assignment.pk).update(
+        deadline=now + dt.timedelta(days=1),
+    )
+    created = factories.AssignmentFactory(
+        creator=user,
+        deadline=now + dt.timedelta(days=2),
+    )
+    factories.AssignmentFactory(creator=user, deadline=now - dt.timedelta(1))
+    factories.AssignmentFactory(deadline=now + dt.timedelta(days=1))
+    factories.TaskFactory.create_batch(
+        2,
+        assignment=assignment,
+        assignee=user,
+        status=constants.TaskStatus.READY,
+    )
+
+    # Savepoint of request, assignments, tasks, counts and savepoint release
+    with django_assert_num_queries(5):
+        response = get_dashboard(user_api_client)
+    assert response.data["profile"]["id"] == user.pk
+    assert [item["id"] for item in response.data["assignments"]] == [
+        assignment.pk,
+        created.pk,
+    ]
+    assert set(response.data["tasks"]) == {
+        constants.TaskStatus.BACKLOG,
+        constants.TaskStatus.READY,
+        constants.TaskStatus.IN_PROGRESS,
+        constants.TaskStatus.READY_FOR_REVIEW,
+    }
+    assert len(response.data["tasks"][constants.TaskStatus.READY]) == 3
+    assert response.data["task_counts"][constants.TaskStatus.READY] == 3
+    # One completed of in progress, ready for review and completed tasks
+    assert response.data["percent_completed"] == 33
+
+
+def test_dashboard_limits(
+    user: users_models.User,
+    user_api_client: test.APIClient,
+    settings: pytest_django.fixtures.SettingsWrapper,
+):
+    """Test that open tasks of each status are limited."""
+    settings.DASHBOARD_ITEMS_LIMIT = 2
+    end = timezone.now()
+    ready_tasks = [
+        factories.TaskFactory(
+            assignee=user,
+            status=constants.TaskStatus.READY,
+            end=end + dt.timedelta(days=days),
+        )
+        for days in (3, 1, 2)
+    ]
+    factories.TaskFactory(assignee=user, status=constants.TaskStatus.BACKLOG)
+    tasks = get_dashboard(user_api_client).data["tasks"]
+    assert [task["id"] for task in tasks[constants.TaskStatus.READY]] == [
+        ready_tasks[1].pk,
+        ready_tasks[2].pk,
+    ]
+    assert len(tasks[constants.TaskStatus.BACKLOG]) == 1
+
+
+def test_dashboard_cached(
+    user: users_models.User,
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+    django_assert_num_queries: pytest_django.DjangoAssertNumQueries,
+):
+    """Test that dashboard is cached and invalidated by changes of tasks."""
+    get_dashboard(user_api_client)
+    # Savepoint of request and its release
+    with django_assert_num_queries(2):
+        get_dashboard(user_api_client)
+
+    factories.TaskFactory(assignee=user, status=constants.TaskStatus.READY)
+    response = get_dashboard(user_api_client)
+    assert response.data["task_counts"][constants.TaskStatus.READY] == 2
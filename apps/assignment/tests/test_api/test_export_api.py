@@ -0,0 +1,175 @@
+import csv
+import io
+import json
+import math
+
+from django.http import StreamingHttpResponse
+from django.urls import reverse_lazy
+
+from rest_framework import status, test
+
+import openpyxl
+import pytest
+from pyarrow import parquet
+
+from ... import constants, models
+from ...api import views
+
+
+def export(api_client: test.APIClient, url: str, **params) -> bytes:
+    """Export list and return content of exported file."""
+    response: StreamingHttpResponse = api_client.get(path=url, data=params)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.streaming
+    return b"".join(response.streaming_content)
+
+
+def test_export_ndjson(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+):
+    """Test that tasks are exported as JSON lines same as they're listed."""
+    params = {
+        "status": constants.TaskStatus.BACKLOG,
+        "fields": "id,title,assignee_data.email",
+    }
+    response: StreamingHttpResponse = user_api_client.get(
+        path=reverse_lazy("v1:task-export"),
+        data=params,
+    )
+    assert response["Content-Type"] == "application/x-ndjson"
+    assert response["Content-Disposition"] == (
+        'attachment; filename="task.ndjson"'
+    )
+    content = b"".join(response.streaming_content)
+    listed = user_api_client.get(
+        path=reverse_lazy("v1:task-list"),
+        data=params,
+    ).data["results"]
+    assert [json.loads(line) for line in content.splitlines()] == listed
+    assert listed[0]["assignee_data"]["email"] == tasks[0].assignee.email
+
+
+def test_export_ordering(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+):
+    """Test that export respects ordering and doesn't paginate."""
+    content = export(
+        user_api_client,
+        reverse_lazy("v1:task-export"),
+        fields="id",
+        ordering="created",
+        limit=1,
+    )
+    assert [json.loads(line)["id"] for line in content.splitlines()] == [
+        task.pk for task in tasks
+    ]
+
+
+def test_export_csv(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+):
+    """Test that nested fields are flattened into CSV columns."""
+    content = export(
+        user_api_client,
+        reverse_lazy("v1:task-export"),
+        export_format="csv",
+        fields="id,status,assignee_data.email,assignment_data.creator_data",
+        ordering="created",
+    )
+    reader = csv.DictReader(io.StringIO(content.decode()))
+    assert {
+        "id",
+        "status",
+        "assignee_data.email",
+        "assignment_data.creator_data.email",
+    } <= set(reader.fieldnames)
+    rows = list(reader)
+    assert [row["id"] for row in rows] == [str(task.pk) for task in tasks]
+    assert rows[0]["assignee_data.email"] == tasks[0].assignee.email
+    assert rows[0]["assignment_data.creator_data.email"] == (
+        tasks[0].assignment.creator.email
+    )
+
+
+def test_export_xlsx(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+):
+    """Test that XLSX has the same columns as CSV."""
+    content = export(
+        user_api_client,
+        reverse_lazy("v1:task-export"),
+        export_format="xlsx",
+        fields="id,status,assignee_data.email",
+        ordering="created",
+    )
+    header, *values = openpyxl.load_workbook(io.BytesIO(content)).active.values
+    assert [dict(zip(header, row, strict=True)) for row in values] == [
+        {
+            "id": task.pk,
+            "status": task.status,
+            "assignee_data.email": task.assignee.email,
+        }
+        for task in tasks
+    ]
+
+
+def test_export_parquet(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that Parquet has typed columns same as CSV in row groups."""
+    monkeypatch.setattr(views.TaskViewSet, "export_chunk_size", 2)
+    content = b"".join(
+        user_api_client.get(
+            path=reverse_lazy("v1:task-export"),
+            data={
+                "export_format": "parquet",
+                "fields": "id,status,assignee_data.email,assignment",
+                "ordering": "created",
+            },
+        ).streaming_content,
+    )
+    parquet_file = parquet.ParquetFile(io.BytesIO(content))
+    assert parquet_file.num_row_groups == math.ceil(len(tasks) / 2)
+    assert parquet_file.schema_arrow.field("id").type == "int64"
+    assert parquet_file.read().to_pylist() == [
+        {
+            "id": task.pk,
+            "status": task.status,
+            "assignee_data.email": task.assignee.email,
+            "assignment": task.assignment_id,
+        }
+        for task in tasks
+    ]
+
+
+@pytest.mark.usefixtures("tasks")
+def test_export_assignments_with_counters(user_api_client: test.APIClient):
+    """Test that assignments are exported with expanded task counters."""
+    content = export(
+        user_api_client,
+        reverse_lazy("v1:assignment-export"),
+        export_format="csv",
+        fields="id,task_counters",
+        expand="task_counters",
+    )
+    rows = list(csv.DictReader(io.StringIO(content.decode())))
+    assert json.loads(rows[0]["task_counters"]) == dict.fromkeys(
+        constants.TaskStatus.values,
+        1,
+    )
+
+
+def test_export_invalid_format(user_api_client: test.APIClient):
+    """Test that unknown export format is rejected."""
+    response = user_api_client.get(
+        path=reverse_lazy("v1:task-export"),
+        data={"export_format": "xml"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data["errors"][0]["attr"] == "export_format"
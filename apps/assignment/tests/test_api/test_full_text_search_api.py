@@ -0,0 +1,151 @@
+from django.db import connection
+from django.urls import reverse_lazy
+
+from rest_framework import status, test
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+import pytest
+
+from apps.users import models as users_models
+from libs.open_api.filters import FullTextSearchFilterBackend
+
+from ... import factories, models
+from ...api import views
+
+
+@pytest.fixture
+def searched_tasks(assignment: models.Assignment) -> list[models.Task]:
+    """Create tasks with searched words in title or description."""
+    return [
+        factories.TaskFactory(
+            assignment=assignment,
+            title="Write report",
+            description="Describe database indexes",
+        ),
+        factories.TaskFactory(
+            assignment=assignment,
+            title="Database indexes",
+            description="Add indexes for reports",
+        ),
+        factories.TaskFactory(
+            assignment=assignment,
+            title="Unrelated",
+            description="Nothing to see here",
+        ),
+    ]
+
+
+def search_tasks(api_client: test.APIClient, **params) -> list[int]:
+    """Search tasks and return ids of found tasks."""
+    response: Response = api_client.get(
+        path=reverse_lazy("v1:task-list"),
+        data=params,
+    )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    return [task["id"] for task in response.data["results"]]
+
+
+def test_search_ranks_results(
+    user_api_client: test.APIClient,
+    searched_tasks: list[models.Task],
+):
+    """Test that tasks are found by word prefixes and ordered by rank."""
+    assert search_tasks(user_api_client, search="datab index") == [
+        searched_tasks[1].pk,
+        searched_tasks[0].pk,
+    ]
+    assert search_tasks(user_api_client, search="report") == [
+        searched_tasks[0].pk,
+        searched_tasks[1].pk,
+    ]
+    assert search_tasks(user_api_client, search="report unrelated") == []
+
+
+def test_search_ignores_operators(
+    user_api_client: test.APIClient,
+    searched_tasks: list[models.Task],
+):
+    """Test that tsquery operators in search are ignored."""
+    assert search_tasks(user_api_client, search="!report | :*") == [
+        searched_tasks[0].pk,
+        searched_tasks[1].pk,
+    ]
+    assert len(search_tasks(user_api_client, search="!&|")) == len(
+        searched_tasks,
+    )
+
+
+def test_search_respects_ordering(
+    user_api_client: test.APIClient,
+    searched_tasks: list[models.Task],
+):
+    """Test that requested ordering is used instead of rank."""
+    assert search_tasks(
+        user_api_client,
+        search="report",
+        ordering="-created",
+    ) == [searched_tasks[1].pk, searched_tasks[0].pk]
+
+
+def test_search_assignments(user_api_client: test.APIClient):
+    """Test that assignments are searched by title and description."""
+    factories.AssignmentFactory(title="Homework", description="Read book")
+    other_assignment = factories.AssignmentFactory(
+        title="Final project",
+        description="Build search",
+    )
+    response: Response = user_api_client.get(
+        path=reverse_lazy("v1:assignment-list"),
+        data={"search": "proj"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert [item["id"] for item in response.data["results"]] == [
+        other_assignment.pk,
+    ]
+
+
+def test_search_related_fields(
+    user: users_models.User,
+    user_api_client: test.APIClient,
+    searched_tasks: list[models.Task],
+):
+    """Test that tasks are also found by assignment title and assignee."""
+    models.Task.objects.filter(pk=searched_tasks[2].pk).update(assignee=user)
+    assert search_tasks(user_api_client, search=user.email) == [
+        searched_tasks[2].pk,
+    ]
+    assert search_tasks(
+        user_api_client,
+        search=f"{user.email.split('@')[0]} unrelated",
+    ) == [searched_tasks[2].pk]
+
+    assignment = factories.AssignmentFactory(title="Course work")
+    task = factories.TaskFactory(assignment=assignment, title="Draft")
+    assert search_tasks(user_api_client, search="course draft") == [task.pk]
+
+    response: Response = user_api_client.get(
+        path=reverse_lazy("v1:assignment-list"),
+        data={"search": assignment.creator.email},
+    )
+    assert [item["id"] for item in response.data["results"]] == [
+        assignment.pk,
+    ]
+
+
+@pytest.mark.usefixtures("searched_tasks")
+def test_search_uses_index():
+    """Test that search query uses GIN index of search vector."""
+    view = views.TaskViewSet()
+    request = Request(test.APIRequestFactory().get("/", {"search": "index"}))
+    queryset = FullTextSearchFilterBackend().filter_queryset(
+        request=request,
+        queryset=views.TaskViewSet.queryset,
+        view=view,
+    )
+    # GIN index is scanned only by bitmap scans, plain index scans of other
+    # indexes may look cheaper for tiny tables depending on statistics
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_seqscan = off")
+        cursor.execute("SET LOCAL enable_indexscan = off")
+    assert "task_search_vector_idx" in queryset.explain()
@@ -0,0 +1,119 @@
+import io
+
+from django.core.management import call_command
+from django.urls import reverse_lazy
+
+from rest_framework import status, test
+from rest_framework.response import Response
+
+import pytest_django
+
+from apps.users import models as users_models
+from libs.api import response_cache
+
+from ... import constants, models
+
+
+def get_titles(api_client: test.APIClient) -> list[str]:
+    """List tasks and return their titles."""
+    response: Response = api_client.get(
+        path=reverse_lazy("v1:task-list"),
+        data={"ordering": "created"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    return [task["title"] for task in response.data["results"]]
+
+
+def test_cached_list(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+    django_assert_num_queries: pytest_django.DjangoAssertNumQueries,
+):
+    """Test that repeated list is served from cache."""
+    titles = get_titles(user_api_client)
+    # Savepoint of request and its release
+    with django_assert_num_queries(2):
+        assert get_titles(user_api_client) == titles
+    assert response_cache.get_metrics(["task"]) == {"task": (1, 1)}
+
+
+def test_cached_list_not_modified(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+    django_assert_num_queries: pytest_django.DjangoAssertNumQueries,
+):
+    """Test that ETag is cached with list and 304 is answered from cache."""
+    url = reverse_lazy("v1:task-list")
+    etag = user_api_client.get(path=url)["ETag"]
+    with django_assert_num_queries(2):
+        response: Response = user_api_client.get(path=url)
+    assert response["ETag"] == etag
+    with django_assert_num_queries(2):
+        response = user_api_client.get(
+            path=url,
+            headers={"If-None-Match": etag},
+        )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response["ETag"] == etag
+
+
+def test_invalidation_on_save(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+):
+    """Test that cached lists are invalidated by changes of models."""
+    get_titles(user_api_client)
+    tasks[0].title = "Changed"
+    tasks[0].save()
+    assert get_titles(user_api_client)[0] == "Changed"
+
+    tasks[0].assignment.title = "Changed assignment"
+    tasks[0].assignment.save()
+    response: Response = user_api_client.get(
+        path=reverse_lazy("v1:task-list"),
+        data={"ordering": "created"},
+    )
+    assert response.data["results"][0]["assignment_data"]["title"] == (
+        "Changed assignment"
+    )
+
+
+def test_invalidation_on_bulk_changes(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+):
+    """Test that bulk changes without signals invalidate cached lists."""
+    url = reverse_lazy("v1:task-list")
+    user_api_client.get(path=url)
+    user_api_client.post(
+        path=reverse_lazy("v1:task-transition"),
+        data={
+            "status": constants.TaskStatus.CANCELED,
+            "ids": [task.pk for task in tasks],
+        },
+        format="json",
+    )
+    response: Response = user_api_client.get(path=url)
+    assert {
+        (task["id"], task["status"]) for task in response.data["results"]
+    } == set(models.Task.objects.values_list("id", "status"))
+
+
+def test_cache_per_user(
+    api_client: test.APIClient,
+    user: users_models.User,
+    admin: users_models.User,
+):
+    """Test that responses are cached per user."""
+    url = reverse_lazy("v1:users-detail", kwargs={"pk": user.pk})
+    api_client.force_authenticate(user=admin)
+    api_client.get(path=url)
+    api_client.get(path=url)
+    api_client.force_authenticate(user=user)
+    api_client.get(path=url)
+
+    stdout = io.StringIO()
+    call_command("response_cache_stats", stdout=stdout)
+    assert "users: 1 hit(s), 2 miss(es), hit ratio 33.3%" in (
+        stdout.getvalue()
+    )
@@ -0,0 +1,190 @@
+import datetime as dt
+
+from django.urls import reverse_lazy
+from django.utils import timezone
+
+from rest_framework import status, test
+from rest_framework.response import Response
+
+from apps.users import models as users_models
+
+from ... import constants, factories, models
+
+DAY = dt.timedelta(days=1)
+WINDOW_START = timezone.now().replace(microsecond=0) - 10 * DAY
+
+
+def get_changes(task: models.Task) -> list[tuple[str, str, int | None]]:
+    """Get recorded status changes of task in order."""
+    return list(
+        task.status_changes.order_by("changed", "id").values_list(
+            "from_status",
+            "to_status",
+            "actor",
+        ),
+    )
+
+
+def test_status_history(
+    user: users_models.User,
+    user_api_client: test.APIClient,
+    assignment: models.Assignment,
+):
+    """Test that status changes are recorded on create, update, transition."""
+    response: Response = user_api_client.post(
+        path=reverse_lazy("v1:task-list"),
+        data={
+            "assignment": assignment.pk,
+            "assignee": user.pk,
+            "title": "Task",
+            "description": "Description",
+            "status": constants.TaskStatus.READY,
+        },
+        format="json",
+    )
+    assert response.status_code == status.HTTP_201_CREATED, response.data
+    task = models.Task.objects.get(pk=response.data["id"])
+
+    user_api_client.put(
+        path=reverse_lazy("v1:task-detail", kwargs={"pk": task.pk}),
+        data={**response.data, "status": constants.TaskStatus.IN_PROGRESS},
+        format="json",
+    )
+    user_api_client.put(
+        path=reverse_lazy("v1:task-bulk"),
+        data=[
+            {
+                **response.data,
+                "title": "Renamed",
+                "status": constants.TaskStatus.IN_PROGRESS,
+            },
+        ],
+        format="json",
+    )
+    user_api_client.post(
+        path=reverse_lazy("v1:task-transition"),
+        data={
+            "status": constants.TaskStatus.READY_FOR_REVIEW,
+            "ids": [task.pk],
+        },
+        format="json",
+    )
+    user_api_client.put(
+        path=reverse_lazy("v1:task-bulk"),
+        data=[{**response.data, "status": constants.TaskStatus.COMPLETED}],
+        format="json",
+    )
+    assert get_changes(task) == [
+        ("", constants.TaskStatus.READY, user.pk),
+        (
+            constants.TaskStatus.READY,
+            constants.TaskStatus.IN_PROGRESS,
+            user.pk,
+        ),
+        (
+            constants.TaskStatus.IN_PROGRESS,
+            constants.TaskStatus.READY_FOR_REVIEW,
+            user.pk,
+        ),
+        (
+            constants.TaskStatus.READY_FOR_REVIEW,
+            constants.TaskStatus.COMPLETED,
+            user.pk,
+        ),
+    ]
+
+
+def create_history(
+    task: models.Task,
+    *changes: tuple[str, dt.datetime],
+) -> None:
+    """Replace status history of task with given statuses and times."""
+    task.status_changes.all().delete()
+    models.TaskStatusChange.objects.bulk_create(
+        models.TaskStatusChange(task=task, to_status=to_status, changed=when)
+        for to_status, when in changes
+    )
+
+
+def test_status_analytics(
+    user_api_client: test.APIClient,
+    assignment: models.Assignment,
+):
+    """Test time in status, cycle time and throughput within window."""
+    completed, in_progress, outside = factories.TaskFactory.create_batch(
+        3,
+        assignment=assignment,
+    )
+    create_history(
+        completed,
+        (constants.TaskStatus.IN_PROGRESS, WINDOW_START - DAY),
+        (constants.TaskStatus.READY_FOR_REVIEW, WINDOW_START + DAY),
+        (constants.TaskStatus.COMPLETED, WINDOW_START + 3 * DAY),
+    )
+    create_history(
+        in_progress,
+        (constants.TaskStatus.READY, WINDOW_START),
+        (constants.TaskStatus.IN_PROGRESS, WINDOW_START + 2 * DAY),
+        (constants.TaskStatus.READY_FOR_REVIEW, WINDOW_START + 4 * DAY),
+    )
+    create_history(
+        outside,
+        (constants.TaskStatus.COMPLETED, WINDOW_START + 30 * DAY),
+    )
+    factories.TaskFactory()
+
+    response: Response = user_api_client.get(
+        path=reverse_lazy(
+            "v1:assignment-status_analytics",
+            kwargs={"pk": assignment.pk},
+        ),
+        data={
+            "from": WINDOW_START.isoformat(),
+            "to": (WINDOW_START + 5 * DAY).isoformat(),
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    day = DAY.total_seconds()
+    statuses = {item["status"]: item for item in response.data["statuses"]}
+    assert statuses.keys() == {
+        constants.TaskStatus.READY,
+        constants.TaskStatus.IN_PROGRESS,
+        constants.TaskStatus.READY_FOR_REVIEW,
+        constants.TaskStatus.COMPLETED,
+    }
+    assert statuses[constants.TaskStatus.READY] == {
+        "status": constants.TaskStatus.READY,
+        "count": 1,
+        "average_time_in_status": 2 * day,
+    }
+    assert statuses[constants.TaskStatus.IN_PROGRESS]["count"] == 1
+    assert statuses[constants.TaskStatus.READY_FOR_REVIEW]["count"] == 2
+    # Task still waiting for review is counted up to now
+    assert (
+        statuses[constants.TaskStatus.READY_FOR_REVIEW][
+            "average_time_in_status"
+        ]
+        > (2 * day + 6 * day) / 2
+    )
+    assert (
+        statuses[constants.TaskStatus.COMPLETED]["average_time_in_status"]
+        is None
+    )
+    assert response.data["cycle_time"] == 4 * day
+    assert response.data["throughput"] == 1
+
+
+def test_status_analytics_invalid_window(
+    user_api_client: test.APIClient,
+    assignment: models.Assignment,
+):
+    """Test that reversed time window is rejected."""
+    response: Response = user_api_client.get(
+        path=reverse_lazy(
+            "v1:assignment-status_analytics",
+            kwargs={"pk": assignment.pk},
+        ),
+        data={"from": WINDOW_START.isoformat(), "to": "2020-01-01T00:00Z"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data["errors"][0]["attr"] == "to"
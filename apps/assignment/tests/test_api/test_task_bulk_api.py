@@ -0,0 +1,167 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+
+from rest_framework import status, test
+from rest_framework.response import Response
+
+import pytest
+
+from apps.users import models as users_models
+
+from ... import constants, factories, models
+
+
+def get_task_data(
+    assignment: models.Assignment,
+    assignee: users_models.User,
+    **kwargs,
+) -> dict:
+    """Prepare data of task for bulk request."""
+    return {
+        "assignment": assignment.pk,
+        "assignee": assignee.pk,
+        "title": "Task",
+        "description": "Description",
+        "status": constants.TaskStatus.READY,
+        **kwargs,
+    }
+
+
+def count_bulk_create_queries(
+    user_api_client: test.APIClient,
+    assignment: models.Assignment,
+    user: users_models.User,
+    size: int,
+) -> int:
+    """Create tasks in bulk and return number of executed queries."""
+    with CaptureQueriesContext(connection) as context:
+        response: Response = user_api_client.post(
+            path=reverse_lazy("v1:task-bulk"),
+            data=[get_task_data(assignment, user) for _ in range(size)],
+            format="json",
+        )
+    assert response.status_code == status.HTTP_201_CREATED, response.data
+    return len(context.captured_queries)
+
+
+def test_bulk_create(
+    user_api_client: test.APIClient,
+    assignment: models.Assignment,
+    user: users_models.User,
+):
+    """Test that tasks are created with constant number of queries."""
+    assert count_bulk_create_queries(
+        user_api_client,
+        assignment,
+        user,
+        size=2,
+    ) == count_bulk_create_queries(
+        user_api_client,
+        assignment,
+        user,
+        size=20,
+    )
+    tasks = models.Task.objects.filter(assignment=assignment)
+    assert tasks.count() == 22
+    assert set(tasks.values_list("creator", flat=True)) == {user.pk}
+    assert assignment.task_counters.get().count == 22
+
+
+def test_bulk_create_errors(
+    user_api_client: test.APIClient,
+    assignment: models.Assignment,
+    user: users_models.User,
+):
+    """Test that errors are reported per task and nothing is created."""
+    response: Response = user_api_client.post(
+        path=reverse_lazy("v1:task-bulk"),
+        data=[
+            get_task_data(assignment, user),
+            {**get_task_data(assignment, user), "assignee": 0},
+            get_task_data(assignment, user, status="unknown"),
+        ],
+        format="json",
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.data
+    assert {error["attr"] for error in response.data["errors"]} == {
+        "1.assignee",
+        "2.status",
+    }
+    assert not models.Task.objects.exists()
+
+
+def test_bulk_update(
+    user_api_client: test.APIClient,
+    assignment: models.Assignment,
+    tasks: list[models.Task],
+    user: users_models.User,
+):
+    """Test that tasks are updated and moved between task counters."""
+    other_assignment = factories.AssignmentFactory()
+    response: Response = user_api_client.put(
+        path=reverse_lazy("v1:task-bulk"),
+        data=[
+            get_task_data(
+                other_assignment,
+                user,
+                id=task.pk,
+                status=constants.TaskStatus.COMPLETED,
+            )
+            for task in tasks[:3]
+        ],
+        format="json",
+    )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert [task["id"] for task in response.data] == [
+        task.pk for task in tasks[:3]
+    ]
+    for task in tasks[:3]:
+        task_modified = task.modified
+        task.refresh_from_db()
+        assert task.assignment == other_assignment
+        assert task.status == constants.TaskStatus.COMPLETED
+        assert task.modified > task_modified
+    assert dict(
+        other_assignment.task_counters.values_list("status", "count"),
+    ) == {constants.TaskStatus.COMPLETED: 3}
+    assert dict(
+        assignment.task_counters.filter(count__gt=0).values_list(
+            "status",
+            "count",
+        ),
+    ) == {task.status: 1 for task in tasks[3:]}
+
+
+@pytest.mark.parametrize(
+    argnames="task_ids",
+    argvalues=[
+        (0,),
+        ("invalid",),
+        (None,),
+        ("task", "task"),
+    ],
+)
+def test_bulk_update_invalid_ids(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+    user: users_models.User,
+    task_ids: tuple,
+):
+    """Test that unknown and duplicated ids are reported per task."""
+    response: Response = user_api_client.put(
+        path=reverse_lazy("v1:task-bulk"),
+        data=[
+            get_task_data(
+                tasks[0].assignment,
+                user,
+                id=tasks[0].pk if task_id == "task" else task_id,
+            )
+            for task_id in task_ids
+        ],
+        format="json",
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.data
+    assert [error["attr"] for error in response.data["errors"]] == [
+        f"{len(task_ids) - 1}.id",
+    ]
@@ -0,0 +1,155 @@
+import datetime as dt
+import itertools
+
+from django.urls import reverse_lazy
+from django.utils import timezone
+
+from rest_framework import status, test
+from rest_framework.response import Response
+
+import pytest
+import pytest_django
+
+from ... import factories, models
+
+
+@pytest.fixture
+def paginated_tasks(assignment: models.Assignment) -> list[models.Task]:
+    """Create tasks with the same and empty start dates."""
+    now = timezone.now()
+    starts = [now + dt.timedelta(days=days) for days in (1, 0, 1, 2, 0, 1)]
+    return [
+        factories.TaskFactory(assignment=assignment, start=start, end=None)
+        for start in [*starts[:2], None, *starts[2:4], None, *starts[4:]]
+    ]
+
+
+def get_expected_ids(tasks: list[models.Task], ordering: str) -> list[int]:
+    """Order tasks in python like keyset pagination does."""
+    if not ordering:
+        return sorted((task.pk for task in tasks), reverse=True)
+    field = ordering.removeprefix("-")
+    descending = ordering.startswith("-")
+    with_value = sorted(
+        (task for task in tasks if getattr(task, field) is not None),
+        key=lambda task: (getattr(task, field), task.pk),
+        reverse=descending,
+    )
+    without_value = sorted(
+        (task for task in tasks if getattr(task, field) is None),
+        key=lambda task: task.pk,
+        reverse=descending,
+    )
+    return [task.pk for task in with_value + without_value]
+
+
+def get_pages(
+    api_client: test.APIClient,
+    url: str,
+    link: str,
+) -> tuple[list[list[int]], str]:
+    """Follow links of pages and collect ids of each page.
+
+    Return ids of pages and url of the last page.
+
+    """
+    pages = []
+    while True:
+        response: Response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK, response.data
+        assert "count" not in response.data
+        pages.append([task["id"] for task in response.data["results"]])
+        if not response.data[link]:
+            return pages, url
+        url = response.data[link]
+
+
+@pytest.mark.parametrize(
+    argnames="ordering",
+    argvalues=["start", "-start", "created", ""],
+)
+def test_cursor_pagination(
+    user_api_client: test.APIClient,
+    paginated_tasks: list[models.Task],
+    ordering: str,
+):
+    """Test that pages are consistent in both directions."""
+    url = reverse_lazy("v1:task-list")
+    pages, last_page_url = get_pages(
+        user_api_client,
+        f"{url}?pagination=cursor&limit=3&ordering={ordering}",
+        link="next",
+    )
+    assert [len(page) for page in pages] == [3, 3, 2]
+    assert list(itertools.chain(*pages)) == get_expected_ids(
+        paginated_tasks,
+        ordering,
+    )
+    previous_pages, _ = get_pages(
+        user_api_client,
+        last_page_url,
+        link="previous",
+    )
+    assert previous_pages == pages[::-1]
+
+
+def test_cursor_pagination_queries(
+    user_api_client: test.APIClient,
+    paginated_tasks: list[models.Task],
+    django_assert_num_queries: pytest_django.DjangoAssertNumQueries,
+):
+    """Test that cursor pagination doesn't count objects."""
+    response: Response = user_api_client.get(
+        path=reverse_lazy("v1:task-list"),
+        data={"pagination": "cursor", "limit": 2},
+    )
+    # Savepoint, page of tasks and release of savepoint
+    with django_assert_num_queries(3):
+        response = user_api_client.get(response.data["next"])
+    assert response.status_code == status.HTTP_200_OK, response.data
+
+
+@pytest.mark.parametrize(
+    argnames="cursor",
+    argvalues=["invalid", "eyJwIjogWyJhIiwgMV0sICJyIjogZmFsc2V9"],
+)
+def test_cursor_pagination_invalid_cursor(
+    user_api_client: test.APIClient,
+    cursor: str,
+):
+    """Test that invalid cursor is reported as not found page."""
+    response: Response = user_api_client.get(
+        path=reverse_lazy("v1:task-list"),
+        data={"pagination": "cursor", "cursor": cursor, "ordering": "start"},
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND, response.data
+
+
+def test_cursor_pagination_empty_page(
+    user_api_client: test.APIClient,
+    paginated_tasks: list[models.Task],
+):
+    """Test that previous link of empty page points to the last page."""
+    url = reverse_lazy("v1:task-list")
+    pages, last_page_url = get_pages(
+        user_api_client,
+        f"{url}?pagination=cursor&limit=3",
+        link="next",
+    )
+    # Cursor of the last page points after objects of the second page
+    models.Task.objects.filter(pk__in=pages[-1]).delete()
+    response: Response = user_api_client.get(last_page_url)
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert response.data["results"] == []
+    assert response.data["next"] is None
+
+    response = user_api_client.get(response.data["previous"])
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert [task["id"] for task in response.data["results"]] == pages[1]
+    assert response.data["next"] is None
+    previous_pages, _ = get_pages(
+        user_api_client,
+        response.data["previous"],
+        link="previous",
+    )
+    assert previous_pages == [pages[0]]
@@ -0,0 +1,88 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+
+from rest_framework import status, test
+from rest_framework.response import Response
+
+from ... import constants, factories, models
+
+
+def get_tasks(api_client: test.APIClient, **params) -> tuple[dict, str]:
+    """Get list of tasks and return its data and all executed SQL."""
+    with CaptureQueriesContext(connection) as context:
+        response: Response = api_client.get(
+            path=reverse_lazy("v1:task-list"),
+            data=params,
+        )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    return response.data, " ".join(
+        query["sql"] for query in context.captured_queries
+    )
+
+
+def test_exact_count(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+):
+    """Test that count is exact by default."""
+    data, _ = get_tasks(user_api_client)
+    assert data["count"] == len(tasks)
+    assert data["count_is_exact"]
+
+
+def test_estimated_count_of_table(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+):
+    """Test that planner estimate is used for not filtered list."""
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {models.Task._meta.db_table}")
+    data, sql = get_tasks(user_api_client, count="estimated", limit=2)
+    assert "reltuples" in sql
+    assert "COUNT(" not in sql
+    assert data["count"] == len(tasks)
+    assert not data["count_is_exact"]
+    assert data["next"]
+
+
+def test_estimated_count_of_filtered_list(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+):
+    """Test that count of filtered list is cached."""
+    params = {
+        "count": "estimated",
+        "status": constants.TaskStatus.COMPLETED,
+    }
+    data, sql = get_tasks(user_api_client, **params)
+    assert "COUNT(" in sql
+    assert data["count"] == 1
+    assert data["count_is_exact"]
+
+    factories.TaskFactory(status=constants.TaskStatus.COMPLETED)
+    data, sql = get_tasks(user_api_client, **params)
+    assert "COUNT(" not in sql
+    assert data["count"] == 1
+    assert not data["count_is_exact"]
+    assert len(data["results"]) == 2
+
+    data, sql = get_tasks(user_api_client, **params, search="other")
+    assert "COUNT(" in sql
+
+
+def test_skipped_count(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+):
+    """Test that next page is detected without counting."""
+    data, sql = get_tasks(user_api_client, count="none", limit=3)
+    assert "COUNT(" not in sql
+    assert data["count"] is None
+    assert not data["count_is_exact"]
+    assert data["next"]
+
+    data, _ = get_tasks(user_api_client, count="none", limit=3, offset=3)
+    assert len(data["results"]) == 3
+    assert data["next"] is None
+    assert data["previous"]
@@ -0,0 +1,97 @@
+from django.urls import reverse_lazy
+
+from rest_framework import status, test
+from rest_framework.response import Response
+
+import pytest_django
+
+from apps.users import models as users_models
+
+from ... import constants, factories, models
+
+
+def test_percent_completed(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+    django_assert_num_queries: pytest_django.DjangoAssertNumQueries,
+):
+    """Test that percent completed is calculated with a single query."""
+    # Savepoint, aggregation query and release of savepoint (ATOMIC_REQUESTS)
+    with django_assert_num_queries(3):
+        response: Response = user_api_client.get(
+            path=reverse_lazy("v1:task-percent_completed"),
+        )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    # 1 completed out of 3 tasks in progress statuses
+    assert response.data == {"percent_completed": 33}
+
+
+def test_percent_completed_respects_filters(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+):
+    """Test that percent completed is calculated only for filtered tasks."""
+    factories.TaskFactory.create_batch(
+        size=3,
+        status=constants.TaskStatus.IN_PROGRESS,
+    )
+    response: Response = user_api_client.get(
+        path=reverse_lazy("v1:task-percent_completed"),
+        data={
+            "assignment_id": tasks[0].assignment_id,
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert response.data == {"percent_completed": 33}
+
+
+def test_percent_completed_group_by_assignment(
+    user_api_client: test.APIClient,
+    user: users_models.User,
+    tasks: list[models.Task],
+    django_assert_num_queries: pytest_django.DjangoAssertNumQueries,
+):
+    """Test that percent completed can be grouped by assignment."""
+    other_task = factories.TaskFactory(
+        assignee=user,
+        status=constants.TaskStatus.COMPLETED,
+    )
+    # Savepoint, validation of `assignee_id` filter, aggregation query and
+    # release of savepoint
+    with django_assert_num_queries(4):
+        response: Response = user_api_client.get(
+            path=reverse_lazy("v1:task-percent_completed"),
+            data={
+                "assignee_id": user.pk,
+                "group_by": constants.TaskProgressGroupBy.ASSIGNMENT,
+            },
+        )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert response.data["percent_completed"] == 50
+    assert response.data["groups"] == [
+        {
+            "key": str(tasks[0].assignment_id),
+            "completed": 1,
+            "total": 3,
+            "percent_completed": 33,
+        },
+        {
+            "key": str(other_task.assignment_id),
+            "completed": 1,
+            "total": 1,
+            "percent_completed": 100,
+        },
+    ]
+
+
+def test_percent_completed_invalid_group_by(
+    user_api_client: test.APIClient,
+):
+    """Test that only supported fields can be used for grouping."""
+    response: Response = user_api_client.get(
+        path=reverse_lazy("v1:task-percent_completed"),
+        data={
+            "group_by": "title",
+        },
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.data
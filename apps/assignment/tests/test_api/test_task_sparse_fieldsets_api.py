@@ -0,0 +1,139 @@
+from django.urls import reverse_lazy
+
+from rest_framework import status, test
+from rest_framework.response import Response
+
+import pytest
+import pytest_django
+
+from ... import models
+
+
+def get_tasks_query(captured_queries: list[dict]) -> str:
+    """Get SQL query which selected tasks."""
+    return next(
+        query["sql"]
+        for query in captured_queries
+        if query["sql"].startswith('SELECT "assignment_task"."id"')
+    )
+
+
+@pytest.mark.usefixtures("tasks")
+def test_list_fields(
+    user_api_client: test.APIClient,
+    django_assert_num_queries: pytest_django.DjangoAssertNumQueries,
+):
+    """Test that only requested fields are represented and loaded."""
+    # Savepoint, count, tasks and release of savepoint
+    with django_assert_num_queries(4) as captured:
+        response: Response = user_api_client.get(
+            path=reverse_lazy("v1:task-list"),
+            data={"fields": "id,title"},
+        )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert all(
+        item.keys() == {"id", "title"} for item in response.data["results"]
+    )
+    query = get_tasks_query(captured.captured_queries)
+    assert "JOIN" not in query
+    assert '"assignment_task"."description"' not in query
+
+
+def test_list_nested_fields(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+    django_assert_num_queries: pytest_django.DjangoAssertNumQueries,
+):
+    """Test that nested fields are pruned and only needed joins are made."""
+    with django_assert_num_queries(4) as captured:
+        response: Response = user_api_client.get(
+            path=reverse_lazy("v1:task-list"),
+            data={"fields": "id,assignee_data.email"},
+        )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert {
+        item["id"]: item["assignee_data"] for item in response.data["results"]
+    } == {task.pk: {"email": task.assignee.email} for task in tasks}
+    query = get_tasks_query(captured.captured_queries)
+    assert query.count("JOIN") == 1
+    assert '"users_user"."first_name"' not in query
+
+
+@pytest.mark.usefixtures("tasks")
+def test_list_all_fields(user_api_client: test.APIClient):
+    """Test that all fields are represented by default."""
+    response: Response = user_api_client.get(
+        path=reverse_lazy("v1:task-list"),
+    )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    task = response.data["results"][0]
+    assert task.keys() == {
+        "id",
+        "assignment",
+        "assignment_data",
+        "creator_data",
+        "assignee",
+        "assignee_data",
+        "title",
+        "description",
+        "status",
+        "start",
+        "end",
+        "created",
+        "modified",
+    }
+    assert "task_counters" not in task["assignment_data"]
+
+
+def test_retrieve_expand_nested(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+):
+    """Test that expandable fields of nested serializers can be expanded."""
+    response: Response = user_api_client.get(
+        path=reverse_lazy("v1:task-detail", kwargs={"pk": tasks[0].pk}),
+        data={
+            "fields": "id,assignment_data.task_counters",
+            "expand": "assignment_data.task_counters",
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert response.data["assignment_data"]["task_counters"]["backlog"] == 1
+
+
+@pytest.mark.usefixtures("tasks")
+def test_list_fields_with_cursor_ordering(
+    user_api_client: test.APIClient,
+    django_assert_num_queries: pytest_django.DjangoAssertNumQueries,
+):
+    """Test that ordering fields are loaded for cursor pagination."""
+    # Savepoint, tasks and release of savepoint
+    with django_assert_num_queries(3):
+        response: Response = user_api_client.get(
+            path=reverse_lazy("v1:task-list"),
+            data={
+                "fields": "id",
+                "ordering": "-created",
+                "pagination": "cursor",
+                "limit": 2,
+            },
+        )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert response.data["next"]
+
+
+def test_create_ignores_fields(
+    user_api_client: test.APIClient,
+    assignment: models.Assignment,
+):
+    """Test that fields are not pruned for write requests."""
+    response: Response = user_api_client.post(
+        path=f"{reverse_lazy('v1:task-list')}?fields=id",
+        data={
+            "assignment": assignment.pk,
+            "title": "Task",
+            "description": "Description",
+        },
+    )
+    assert response.status_code == status.HTTP_201_CREATED, response.data
+    assert response.data["title"] == "Task"
@@ -0,0 +1,129 @@
+from django.db.models import Count
+from django.urls import reverse_lazy
+
+from rest_framework import status, test
+from rest_framework.response import Response
+
+import pytest
+import pytest_django
+
+from ... import constants, factories, models, services
+
+
+@pytest.mark.parametrize(
+    argnames="target_status",
+    argvalues=constants.TaskStatus.values,
+)
+def test_transition(
+    user_api_client: test.APIClient,
+    assignment: models.Assignment,
+    tasks: list[models.Task],
+    target_status: str,
+    django_assert_num_queries: pytest_django.DjangoAssertNumQueries,
+):
+    """Test that only tasks with allowed statuses are moved."""
+    # Savepoints of request and service, update of tasks, creation and
+    # update of counters, insert of status history, release of savepoints
+    with django_assert_num_queries(8):
+        response: Response = user_api_client.post(
+            path=reverse_lazy("v1:task-transition"),
+            data={
+                "status": target_status,
+                "ids": [task.pk for task in tasks],
+            },
+            format="json",
+        )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    sources = services.get_transition_sources(target_status)
+    moved_tasks = sorted(task.pk for task in tasks if task.status in sources)
+    assert response.data == {"ids": moved_tasks}
+
+    for task in tasks:
+        task_status = task.status
+        task.refresh_from_db()
+        expected_status = (
+            target_status if task.pk in moved_tasks else task_status
+        )
+        assert task.status == expected_status
+    counts = dict(
+        assignment.task_counters.filter(count__gt=0).values_list(
+            "status",
+            "count",
+        ),
+    )
+    assert counts == dict(
+        models.Task.objects.values_list("status").annotate(
+            count=Count("id"),
+        ),
+    )
+
+
+def test_transition_filtered_tasks(
+    user_api_client: test.APIClient,
+    assignment: models.Assignment,
+    tasks: list[models.Task],
+):
+    """Test that filtered tasks are moved if ids are not provided."""
+    other_task = factories.TaskFactory(
+        status=constants.TaskStatus.READY_FOR_REVIEW,
+    )
+    response: Response = user_api_client.post(
+        path=reverse_lazy("v1:task-transition"),
+        data={"status": constants.TaskStatus.COMPLETED},
+        QUERY_STRING=f"assignment_id={assignment.pk}",
+        format="json",
+    )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert response.data == {
+        "ids": [
+            task.pk
+            for task in tasks
+            if task.status == constants.TaskStatus.READY_FOR_REVIEW
+        ],
+    }
+    other_task.refresh_from_db()
+    assert other_task.status == constants.TaskStatus.READY_FOR_REVIEW
+
+
+@pytest.mark.parametrize(
+    argnames="query_string",
+    argvalues=["", "status=", "search=!"],
+)
+def test_transition_without_ids_and_filters(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+    query_string: str,
+):
+    """Test that all tasks can't be moved by omitting ids and filters."""
+    response: Response = user_api_client.post(
+        path=reverse_lazy("v1:task-transition"),
+        data={"status": constants.TaskStatus.CANCELED},
+        QUERY_STRING=query_string,
+        format="json",
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data["errors"][0]["attr"] == "ids"
+    assert (
+        not models.Task.objects.filter(
+            status=constants.TaskStatus.CANCELED,
+        )
+        .exclude(pk=tasks[-1].pk)
+        .exists()
+    )
+
+
+def test_transition_too_many_ids(
+    user_api_client: test.APIClient,
+    settings: pytest_django.fixtures.SettingsWrapper,
+):
+    """Test that number of ids is limited."""
+    response: Response = user_api_client.post(
+        path=reverse_lazy("v1:task-transition"),
+        data={
+            "status": constants.TaskStatus.CANCELED,
+            "ids": list(range(1, settings.TASK_TRANSITION_MAX_IDS + 2)),
+        },
+        format="json",
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data["errors"][0]["attr"] == "ids"
@@ -0,0 +1,80 @@
+import datetime as dt
+
+from django.urls import reverse_lazy
+from django.utils import timezone
+
+from rest_framework import status, test
+from rest_framework.response import Response
+
+import pytest_django
+
+from apps.users import factories as users_factories
+from apps.users import models as users_models
+
+from ... import constants, factories, models
+
+
+def test_workload(
+    user: users_models.User,
+    user_api_client: test.APIClient,
+    assignment: models.Assignment,
+    tasks: list[models.Task],
+    django_assert_num_queries: pytest_django.DjangoAssertNumQueries,
+):
+    """Test that workload is counted per assignee with a single query."""
+    now = timezone.now()
+    models.Task.objects.filter(pk__in=[task.pk for task in tasks]).update(
+        end=now - dt.timedelta(days=1),
+    )
+    next_due = now + dt.timedelta(days=2)
+    factories.TaskFactory(assignment=assignment, assignee=user, end=next_due)
+    other = users_factories.UserFactory()
+    factories.TaskFactory.create_batch(
+        2,
+        assignment=assignment,
+        assignee=other,
+        status=constants.TaskStatus.COMPLETED,
+    )
+    factories.TaskFactory(assignee=other)
+
+    # Savepoint of request, validation of filter by assignment, grouped
+    # query and savepoint release
+    with django_assert_num_queries(4):
+        response: Response = user_api_client.get(
+            path=reverse_lazy("v1:task-workload"),
+            data={"assignment_id": assignment.pk},
+        )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert [row["assignee"] for row in response.data] == [other.pk, user.pk]
+    assert response.data[0]["counts"] == {
+        **dict.fromkeys(constants.TaskStatus.values, 0),
+        constants.TaskStatus.COMPLETED: 2,
+    }
+    assert response.data[0]["overdue"] == 0
+    workload = response.data[1]
+    assert workload["assignee_data"]["email"] == user.email
+    assert workload["counts"] == {
+        **dict.fromkeys(constants.TaskStatus.values, 1),
+        constants.TaskStatus.BACKLOG: 2,
+    }
+    assert workload["total"] == len(tasks) + 1
+    # Completed and canceled tasks are not overdue
+    assert workload["overdue"] == len(tasks) - 2
+    assert workload["next_due"] == next_due.isoformat().replace(
+        "+00:00",
+        "Z",
+    )
+
+
+def test_workload_search(
+    user_api_client: test.APIClient,
+    tasks: list[models.Task],
+):
+    """Test that workload respects search."""
+    models.Task.objects.filter(pk=tasks[0].pk).update(title="Unique title")
+    response: Response = user_api_client.get(
+        path=reverse_lazy("v1:task-workload"),
+        data={"search": "unique"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert [row["total"] for row in response.data] == [1]
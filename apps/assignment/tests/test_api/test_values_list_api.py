@@ -0,0 +1,109 @@
+import json
+
+from django.urls import reverse_lazy
+
+from rest_framework import mixins, status, test
+from rest_framework.response import Response
+
+import pytest
+import pytest_django
+
+from apps.users import factories as users_factories
+from apps.users import models as users_models
+
+from ... import factories, models
+from ...api import views
+
+
+@pytest.fixture
+def listed_tasks(
+    tasks: list[models.Task],
+    monkeypatch: pytest.MonkeyPatch,
+) -> list[models.Task]:
+    """Create tasks with empty optional fields in addition to `tasks`.
+
+    Signing of avatar urls is disabled, since signatures depend on time.
+
+    """
+    storage = users_models.User._meta.get_field("avatar").storage
+    monkeypatch.setattr(storage, "querystring_auth", False)
+    return [
+        *tasks,
+        factories.TaskFactory(
+            assignment=factories.AssignmentFactory(creator=None),
+            creator=None,
+            assignee=users_factories.UserFactory(avatar=None),
+            start=None,
+            end=None,
+        ),
+    ]
+
+
+def get_list(
+    api_client: test.APIClient,
+    url: str,
+    params: dict,
+) -> list | dict:
+    """Get list from api as parsed json."""
+    response: Response = api_client.get(path=url, data=params)
+    assert response.status_code == status.HTTP_200_OK, response.data
+    return json.loads(response.content)
+
+
+@pytest.mark.parametrize(
+    argnames=["url", "params"],
+    argvalues=[
+        [reverse_lazy("v1:task-list"), {}],
+        [reverse_lazy("v1:task-list"), {"status": "backlog"}],
+        [
+            reverse_lazy("v1:task-list"),
+            {"fields": "id,status,assignee_data.avatar,assignment_data"},
+        ],
+        [
+            reverse_lazy("v1:task-list"),
+            {"ordering": "-start", "pagination": "cursor", "limit": 3},
+        ],
+        [
+            reverse_lazy("v1:task-list"),
+            {"ordering": "end", "count": "estimated", "limit": 2},
+        ],
+        [reverse_lazy("v1:assignment-list"), {}],
+        [reverse_lazy("v1:assignment-list"), {"expand": "task_counters"}],
+    ],
+)
+@pytest.mark.usefixtures("listed_tasks")
+def test_list_equivalence(
+    user_api_client: test.APIClient,
+    monkeypatch: pytest.MonkeyPatch,
+    url: str,
+    params: dict,
+):
+    """Test that values are represented the same way as instances."""
+    values_data = get_list(user_api_client, url, params)
+    for viewset in (views.TaskViewSet, views.AssignmentViewSet):
+        monkeypatch.setattr(viewset, "list", mixins.ListModelMixin.list)
+    instances_data = get_list(user_api_client, url, params)
+    assert values_data == instances_data
+    assert values_data["results"]
+
+
+def test_list_without_instances(
+    user_api_client: test.APIClient,
+    listed_tasks: list[models.Task],
+    django_assert_num_queries: pytest_django.DjangoAssertNumQueries,
+):
+    """Test that only serialized columns are fetched for list."""
+    # Savepoint, count, tasks and release of savepoint
+    with django_assert_num_queries(4) as captured:
+        response: Response = user_api_client.get(
+            path=reverse_lazy("v1:task-list"),
+            data={"fields": "id,title"},
+        )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert response.data["count"] == len(listed_tasks)
+    assert captured.captured_queries[2]["sql"] == (
+        'SELECT "assignment_task"."id" AS "id", '
+        '"assignment_task"."title" AS "title", '
+        '"assignment_task"."id" AS "pk" '
+        'FROM "assignment_task" LIMIT 25'
+    )
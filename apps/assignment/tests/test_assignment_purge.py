@@ -0,0 +1,40 @@
+from django.db import connections
+
+import pytest
+import pytest_django
+
+from .. import models, services
+
+
+@pytest.mark.django_db(transaction=True)
+def test_purge_with_concurrent_purge(
+    tasks: list[models.Task],
+    settings: pytest_django.fixtures.SettingsWrapper,
+):
+    """Test that tasks locked by concurrent purge are skipped.
+
+    Assignment is kept until locked tasks are deleted, so they aren't
+    deleted by cascade in one transaction.
+
+    """
+    settings.ASSIGNMENT_DELETE_BATCH_SIZE = 2
+    assignment = tasks[0].assignment
+    other_connection = connections.create_connection("default")
+    try:
+        other_connection.set_autocommit(False)
+        with other_connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT id FROM {models.Task._meta.db_table} "  # noqa: S608
+                "WHERE id = %s FOR UPDATE",
+                [tasks[0].pk],
+            )
+            assert services.purge_assignment(assignment.pk) == len(tasks) - 1
+            assert models.Assignment.objects.filter(pk=assignment.pk).exists()
+        other_connection.rollback()
+    finally:
+        other_connection.close()
+    assert services.purge_assignment(assignment.pk) == 1
+    assert not models.Assignment.objects.filter(pk=assignment.pk).exists()
+    assert not models.AssignmentTaskCounter.objects.filter(
+        assignment_id=assignment.pk,
+    ).exists()
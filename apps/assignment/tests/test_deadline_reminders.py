@@ -0,0 +1,150 @@
+import collections.abc
+import datetime as dt
+
+from django.core import mail
+from django.core.mail.backends.base import BaseEmailBackend
+from django.db import connections
+from django.utils import timezone
+
+import pytest
+import pytest_django
+
+from apps.users import factories as users_factories
+from apps.users import models as users_models
+
+from .. import constants, factories, models, notifications, services, tasks
+
+NOW = dt.datetime(2030, 1, 10, tzinfo=dt.UTC)
+
+
+def create_task(end: dt.datetime, **kwargs) -> models.Task:
+    """Create task without assignment deadline, which ends at `end`."""
+    return factories.TaskFactory(
+        assignment=factories.AssignmentFactory(start=None, deadline=None),
+        start=None,
+        end=end,
+        **kwargs,
+    )
+
+
+def test_task_reminders(user: users_models.User):
+    """Test that only the closest reminder is sent once for open tasks."""
+    soon = create_task(NOW + dt.timedelta(minutes=30), assignee=user)
+    create_task(
+        NOW + dt.timedelta(minutes=30),
+        assignee=user,
+        status=constants.TaskStatus.COMPLETED,
+    )
+    tomorrow = create_task(NOW + dt.timedelta(hours=3), assignee=user)
+    create_task(NOW + dt.timedelta(days=3), assignee=user)
+
+    assert services.send_deadline_reminders(now=NOW) == 2
+    assert [message.to for message in mail.outbox] == [[user.email]] * 2
+    assert set(
+        models.DeadlineReminder.objects.values_list("task", "window"),
+    ) == {
+        (soon.pk, dt.timedelta(hours=1)),
+        (tomorrow.pk, dt.timedelta(days=1)),
+    }
+
+    assert services.send_deadline_reminders(now=NOW) == 0
+    # Task moves to smaller window and gets its reminder
+    later = NOW + dt.timedelta(hours=2, minutes=30)
+    assert services.send_deadline_reminders(now=later) == 1
+    assert tomorrow.title in mail.outbox[-1].body
+
+
+def test_assignment_reminders(user: users_models.User):
+    """Test that assignees of unfinished tasks get one reminder each."""
+    assignment = factories.AssignmentFactory(
+        start=None,
+        deadline=NOW + dt.timedelta(hours=5),
+    )
+    for _ in range(2):
+        factories.TaskFactory(
+            assignment=assignment,
+            assignee=user,
+            start=None,
+            end=None,
+        )
+    factories.TaskFactory(
+        assignment=assignment,
+        start=None,
+        end=None,
+        status=constants.TaskStatus.CANCELED,
+    )
+
+    assert services.send_deadline_reminders(now=NOW) == 1
+    assert mail.outbox[0].to == [user.email]
+    assert assignment.title in mail.outbox[0].body
+    assert models.DeadlineReminder.objects.get().assignment == assignment
+
+
+def fail_send(
+    self: notifications.DeadlineReminderEmailNotification,
+    connection: BaseEmailBackend | None = None,
+) -> bool:
+    """Fail sending of notification without error."""
+    return False
+
+
+def raise_send(
+    self: notifications.DeadlineReminderEmailNotification,
+    connection: BaseEmailBackend | None = None,
+) -> bool:
+    """Fail sending of notification with unexpected error."""
+    raise OSError("Connection reset")
+
+
+@pytest.mark.parametrize(
+    "send",
+    [fail_send, raise_send],
+)
+def test_failed_reminders_are_retried(
+    user: users_models.User,
+    monkeypatch: pytest.MonkeyPatch,
+    send: collections.abc.Callable,
+):
+    """Test that reminders which failed to be sent are not recorded."""
+    create_task(NOW + dt.timedelta(minutes=30), assignee=user)
+    monkeypatch.setattr(
+        notifications.DeadlineReminderEmailNotification,
+        "send",
+        send,
+    )
+    assert services.send_deadline_reminders(now=NOW) == 0
+    assert not models.DeadlineReminder.objects.exists()
+
+    monkeypatch.undo()
+    assert services.send_deadline_reminders(now=NOW) == 1
+
+
+def test_reminders_batches(settings: pytest_django.fixtures.SettingsWrapper):
+    """Test that reminders are sent in batches."""
+    settings.DEADLINE_REMINDER_BATCH_SIZE = 2
+    for assignee in users_factories.UserFactory.create_batch(5):
+        create_task(NOW + dt.timedelta(minutes=30), assignee=assignee)
+    assert services.send_deadline_reminders(now=NOW) == 5
+    assert len(mail.outbox) == 5
+
+
+def test_reminders_locked(user: users_models.User):
+    """Test that reminders are skipped while another run holds the lock."""
+    create_task(NOW + dt.timedelta(minutes=30), assignee=user)
+    other_connection = connections.create_connection("default")
+    lock = services.reminders.DEADLINE_REMINDERS_LOCK
+    try:
+        with other_connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_lock(%s)", [lock])
+            assert services.send_deadline_reminders(now=NOW) == 0
+            cursor.execute("SELECT pg_advisory_unlock(%s)", [lock])
+    finally:
+        other_connection.close()
+    assert services.send_deadline_reminders(now=NOW) == 1
+
+
+def test_send_deadline_reminders_task(user: users_models.User):
+    """Test that periodic task sends reminders."""
+    create_task(timezone.now() + dt.timedelta(minutes=30), assignee=user)
+    tasks.send_deadline_reminders.delay()
+    assert [message.to for message in mail.outbox] == [[user.email]]
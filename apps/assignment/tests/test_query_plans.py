@@ -0,0 +1,94 @@
+from django.db import connection
+
+import pytest
+
+from apps.users import factories as users_factories
+
+from .. import constants, factories, models
+from ..api import views
+
+TASK_TABLE = models.Task._meta.db_table
+ASSIGNMENT_TABLE = models.Assignment._meta.db_table
+
+
+@pytest.fixture
+def seeded_task() -> models.Task:
+    """Create dataset of tasks for checking query plans.
+
+    Sequential scans are disabled for the test transaction, so query uses
+    a sequential scan or an unrelated index only if no suitable index
+    exists.
+
+    """
+    users = users_factories.UserFactory.create_batch(size=5)
+    assignments = models.Assignment.objects.bulk_create(
+        factories.AssignmentFactory.build(creator=users[index % len(users)])
+        for index in range(100)
+    )
+    tasks = models.Task.objects.bulk_create(
+        factories.TaskFactory.build(
+            assignment=assignments[index % len(assignments)],
+            creator=users[index % len(users)],
+            assignee=users[(index + 1) % len(users)],
+            status=constants.TaskStatus.values[
+                index % len(constants.TaskStatus.values)
+            ],
+        )
+        for index in range(500)
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {TASK_TABLE}, {ASSIGNMENT_TABLE}")
+        cursor.execute("SET LOCAL enable_seqscan = off")
+    return tasks[0]
+
+
+@pytest.mark.parametrize(
+    argnames=["filter_fields", "ordering", "index"],
+    argvalues=[
+        [("assignment_id",), None, "task_assignment_status_idx"],
+        [("assignment_id", "status"), None, "task_assignment_status_idx"],
+        [("assignee_id",), None, "task_assignee_status_end_idx"],
+        [("assignee_id", "status"), "end", "task_assignee_status_end_idx"],
+        [("creator_id",), None, f"{TASK_TABLE}_creator_id"],
+        [(), "created", "task_created_idx"],
+        [(), "-created", "task_created_idx"],
+        [(), "start", "task_start_idx"],
+        [(), "-start", "task_start_idx"],
+        [(), "end", "task_end_idx"],
+        [(), "-end", "task_end_idx"],
+    ],
+)
+def test_task_query_plans(
+    seeded_task: models.Task,
+    filter_fields: tuple[str, ...],
+    ordering: str | None,
+    index: str,
+):
+    """Test that list and filter queries of tasks use indexes."""
+    queryset = views.TaskViewSet.queryset.filter(
+        **{field: getattr(seeded_task, field) for field in filter_fields},
+    )
+    if ordering:
+        queryset = queryset.order_by(ordering)[:25]
+    plan = queryset.explain()
+    assert f"Seq Scan on {TASK_TABLE}" not in plan, plan
+    assert index in plan, plan
+
+
+@pytest.mark.parametrize(
+    argnames=["ordering", "index"],
+    argvalues=[
+        ["created", "assignment_created_idx"],
+        ["-created", "assignment_created_idx"],
+        ["start", "assignment_start_idx"],
+        ["-start", "assignment_start_idx"],
+        ["deadline", "assignment_deadline_idx"],
+        ["-deadline", "assignment_deadline_idx"],
+    ],
+)
+@pytest.mark.usefixtures("seeded_task")
+def test_assignment_query_plans(ordering: str, index: str):
+    """Test that list queries of assignments use indexes."""
+    plan = views.AssignmentViewSet.queryset.order_by(ordering)[:25].explain()
+    assert f"Seq Scan on {ASSIGNMENT_TABLE}" not in plan, plan
+    assert index in plan, plan
@@ -0,0 +1,112 @@
+from django.core.management import call_command
+
+import pytest
+
+from apps.users import models as users_models
+
+from .. import constants, factories, models
+
+
+def get_counts(assignment: models.Assignment) -> dict[str, int]:
+    """Get stored task counts of assignment per status."""
+    return dict(
+        assignment.task_counters.filter(count__gt=0).values_list(
+            "status",
+            "count",
+        ),
+    )
+
+
+def test_counters_on_create(tasks: list[models.Task]) -> None:
+    """Ensure counters are incremented on task creation."""
+    assignment = tasks[0].assignment
+    factories.TaskFactory(
+        assignment=assignment,
+        status=constants.TaskStatus.COMPLETED,
+    )
+    expected = dict.fromkeys(constants.TaskStatus.values, 1)
+    expected[constants.TaskStatus.COMPLETED] = 2
+    assert get_counts(assignment) == expected
+
+
+def test_counters_on_update(
+    assignment: models.Assignment,
+    user: users_models.User,
+) -> None:
+    """Ensure task is moved between counters on status or assignment change.
+
+    Task loaded from DB and partially loaded tasks are covered too.
+
+    """
+    task = factories.TaskFactory(
+        assignment=assignment,
+        assignee=user,
+        status=constants.TaskStatus.BACKLOG,
+    )
+    task.status = constants.TaskStatus.IN_PROGRESS
+    task.save()
+    assert get_counts(assignment) == {constants.TaskStatus.IN_PROGRESS: 1}
+
+    task = models.Task.objects.only("id", "title").get(pk=task.pk)
+    task.status = constants.TaskStatus.COMPLETED
+    task.save(update_fields=["status"])
+    assert get_counts(assignment) == {constants.TaskStatus.COMPLETED: 1}
+
+    other_assignment = factories.AssignmentFactory()
+    task = models.Task.objects.get(pk=task.pk)
+    task.assignment = other_assignment
+    task.save()
+    assert get_counts(assignment) == {}
+    assert get_counts(other_assignment) == {
+        constants.TaskStatus.COMPLETED: 1,
+    }
+
+
+def test_counters_on_delete(tasks: list[models.Task]) -> None:
+    """Ensure counters are decremented on task deletion."""
+    assignment = tasks[0].assignment
+    tasks[0].delete()
+    models.Task.objects.filter(pk=tasks[1].pk).delete()
+    assert get_counts(assignment) == {task.status: 1 for task in tasks[2:]}
+
+
+def test_delete_assignment(tasks: list[models.Task]) -> None:
+    """Ensure assignment with tasks and counters can be deleted."""
+    tasks[0].assignment.delete()
+    assert not models.AssignmentTaskCounter.objects.exists()
+
+
+@pytest.mark.parametrize(
+    argnames="only_assignment",
+    argvalues=[False, True],
+)
+def test_rebuild_task_counters(
+    tasks: list[models.Task],
+    only_assignment: bool,
+) -> None:
+    """Ensure broken counters are fixed by management command."""
+    assignment = tasks[0].assignment
+    models.AssignmentTaskCounter.objects.filter(
+        status=constants.TaskStatus.BACKLOG,
+    ).update(count=5)
+    models.AssignmentTaskCounter.objects.filter(
+        status=constants.TaskStatus.READY,
+    ).delete()
+    options = {}
+    if only_assignment:
+        options["assignment_ids"] = [assignment.pk]
+    call_command("rebuild_task_counters", **options)
+    assert get_counts(assignment) == dict.fromkeys(
+        constants.TaskStatus.values,
+        1,
+    )
+
+
+def test_rebuild_task_counters_of_other_assignment(
+    tasks: list[models.Task],
+) -> None:
+    """Ensure only counters of requested assignments are rebuilt."""
+    models.AssignmentTaskCounter.objects.update(count=5)
+    other_assignment = factories.AssignmentFactory()
+    call_command("rebuild_task_counters", assignment_ids=[other_assignment.pk])
+    assert set(get_counts(tasks[0].assignment).values()) == {5}
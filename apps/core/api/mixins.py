@@ -1,7 +1,26 @@
 import collections.abc
+import datetime as dt
+import hashlib
 import typing
 
-from rest_framework import mixins, permissions
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import models
+from django.http import HttpResponseBase, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date, quote_etag
+
+from rest_framework import decorators, mixins, permissions, response, status
+
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+
+from libs.api import exports, response_cache
+
+from .. import services as core_services
+from . import serializers as core_serializers
 
 PermissionType = type[permissions.BasePermission] | permissions.OperandHolder
 PermissionsTypesSequence: type = collections.abc.Sequence[PermissionType]
@@ -211,3 +230,437 @@ class UpdateModelWithoutPatchMixin:
 
     update = mixins.UpdateModelMixin.update
     perform_update = mixins.UpdateModelMixin.perform_update
+
+
+class SparseFieldsetsMixin:
+    """Mixin which loads only data needed for requested fields.
+
+    If serializer supports `?fields=` and `?expand=` (see
+    `ModelBaseSerializer`), queryset of `sparse_fieldsets_actions` is
+    optimized after filtering, so joins, prefetches and columns match
+    fields which are going to be represented.
+
+    """
+
+    sparse_fieldsets_actions: collections.abc.Sequence[str] = (
+        "list",
+        "retrieve",
+        "export",
+        "batch_get",
+    )
+
+    def filter_queryset(self, queryset: models.QuerySet) -> models.QuerySet:
+        """Optimize queryset for requested fields."""
+        queryset = super().filter_queryset(queryset)
+        if getattr(self, "action", None) not in self.sparse_fieldsets_actions:
+            return queryset
+        serializer = self.get_serializer()
+        if not hasattr(serializer, "optimize_queryset"):
+            return queryset
+        return serializer.optimize_queryset(queryset)
+
+
+class ValuesListMixin:
+    """Mixin which lists objects without instantiating models.
+
+    If serializer can represent rows of `values()` (see
+    `ModelBaseSerializer.get_values_transformer`), only serialized columns
+    are fetched and rows are represented by precompiled transformer, which
+    gives the same output as regular serialization. Otherwise regular
+    `list` is used.
+
+    """
+
+    def list(self, request, *args, **kwargs) -> response.Response:
+        """List objects using values of columns if it's possible."""
+        serializer = self.get_serializer()
+        transformer = None
+        if hasattr(serializer, "get_values_transformer"):
+            transformer = serializer.get_values_transformer()
+        if transformer is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        # Pagination may need values of ordering fields
+        ordering_columns = [
+            term.removeprefix("-")
+            for term in queryset.query.order_by
+            if isinstance(term, str) and term != "?"
+        ]
+        queryset = queryset.prefetch_related(None).values(
+            *dict.fromkeys(
+                (*transformer.columns, "pk", *ordering_columns),
+            ),
+        )
+        page = self.paginate_queryset(queryset)
+        rows = queryset if page is None else page
+        data = [transformer.transform(row) for row in rows]
+        if page is None:
+            return response.Response(data)
+        return self.get_paginated_response(data)
+
+
+class ExportMixin:
+    """Mixin which adds action streaming filtered list as file.
+
+    List is exported as NDJSON, CSV, XLSX or Parquet (`?export_format=`) by
+    `apps.core.services.get_export_content`, which is also used by export
+    jobs.
+
+    """
+
+    export_chunk_size = settings.EXPORT_CHUNK_SIZE
+
+    @extend_schema(
+        parameters=[
+            core_serializers.ExportQuerySerializer,
+        ],
+        responses={
+            (200, content_type): OpenApiTypes.BINARY
+            for content_type in exports.CONTENT_TYPES.values()
+        },
+        filters=True,
+    )
+    @decorators.action(
+        detail=False,
+        methods=["GET"],
+        url_path="export",
+        url_name="export",
+    )
+    def export(self, request, *args, **kwargs) -> StreamingHttpResponse:
+        """Export filtered list as NDJSON, CSV, XLSX or Parquet file."""
+        query_serializer = core_serializers.ExportQuerySerializer(
+            data=request.query_params,
+        )
+        query_serializer.is_valid(raise_exception=True)
+        export_format = query_serializer.validated_data["export_format"]
+
+        streaming_response = StreamingHttpResponse(
+            core_services.get_export_content(
+                view=self,
+                export_format=export_format,
+                chunk_size=self.export_chunk_size,
+            ),
+            content_type=exports.CONTENT_TYPES[export_format],
+        )
+        streaming_response["Content-Disposition"] = (
+            f'attachment; filename="{self.basename}.{export_format}"'
+        )
+        return streaming_response
+
+
+class BatchRetrieveMixin:
+    """Mixin which adds action retrieving objects by ids in one request.
+
+    Objects are taken from the same queryset as `retrieve` (so scoping of
+    and optimization of queryset apply) with a single `id = ANY(...)`
+    query and object permissions are checked for each of them. Missing
+    objects are omitted, found ones are returned keyed by id. Response
+    schema is documented by `libs.open_api.schema.AutoSchema`.
+
+    """
+
+    @extend_schema(
+        request=core_serializers.BatchRetrieveSerializer,
+    )
+    @decorators.action(
+        detail=False,
+        methods=["POST"],
+        url_path="batch-get",
+        url_name="batch_get",
+        pagination_class=None,
+    )
+    def batch_get(self, request, *args, **kwargs) -> response.Response:
+        """Retrieve objects by ids, result is keyed by id."""
+        ids_serializer = core_serializers.BatchRetrieveSerializer(
+            data=request.data,
+        )
+        ids_serializer.is_valid(raise_exception=True)
+        instances = list(
+            self.filter_queryset(self.get_queryset())
+            .filter(pk__any=ids_serializer.validated_data["ids"])
+            .order_by(),
+        )
+        for instance in instances:
+            self.check_object_permissions(request, instance)
+        serializer = self.get_serializer(instances, many=True)
+        return response.Response(
+            {
+                str(instance.pk): data
+                for instance, data in zip(
+                    instances,
+                    serializer.data,
+                    strict=True,
+                )
+            },
+        )
+
+
+class ConditionalGetValidators(typing.NamedTuple):
+    """Validators of response computed before serialization."""
+
+    etag: str
+    last_modified: dt.datetime
+    count: int
+
+
+class ConditionalGetMixin:
+    """Mixin which answers conditional GET before serialization.
+
+    Validators of `list` and `retrieve` are computed from filtered queryset
+    with a single aggregate query: max of `conditional_get_modified_fields`
+    (timestamps of the object and of related objects it represents) and
+    count of objects. ETag also depends on user, query params (filters,
+    pagination, fields) and format, so `If-None-Match` matching the current
+    ETag is answered with 304 without loading and serializing objects.
+
+    `Last-Modified` is set only for details, since deletion of objects
+    from list doesn't change max of timestamps. Responses with expanded
+    fields (`?expand=`) are not covered, since they're computed from other
+    tables. Validators are renewed every `CONDITIONAL_GET_VALIDATORS_TTL`
+    seconds, so clients don't keep presigned file links longer than they're
+    valid.
+
+    Object permissions are not checked before answering with 304.
+
+    """
+
+    conditional_get_modified_fields: collections.abc.Sequence[str] = (
+        "modified",
+    )
+
+    def list(self, request, *args, **kwargs) -> response.Response:
+        """List objects unless client has actual version of list.
+
+        Validators are computed only if list is counted exactly, their count
+        is reused by paginator. Lists with cheaper count modes are not
+        validated, since they are too large for counting.
+
+        """
+        paginator = self.paginator
+        validators = None
+        if paginator is None or (
+            hasattr(paginator, "is_exact_count_requested")
+            and paginator.is_exact_count_requested(request)
+        ):
+            validators = self.get_conditional_get_validators(
+                self.filter_queryset(self.get_queryset()),
+            )
+        if validators is not None and paginator is not None:
+            paginator.known_count = validators.count
+        return self.conditional_get(
+            super().list,
+            validators,
+            request,
+            *args,
+            **kwargs,
+        )
+
+    def retrieve(self, request, *args, **kwargs) -> response.Response:
+        """Retrieve object unless client has actual version of object."""
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            queryset = self.filter_queryset(self.get_queryset()).filter(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]},
+            )
+            validators = self.get_conditional_get_validators(queryset)
+        except (TypeError, ValueError, DjangoValidationError):
+            validators = None
+        if validators is not None and validators.count != 1:
+            validators = None
+        return self.conditional_get(
+            super().retrieve,
+            validators,
+            request,
+            *args,
+            **kwargs,
+        )
+
+    def conditional_get(
+        self,
+        get: collections.abc.Callable[..., response.Response],
+        validators: ConditionalGetValidators | None,
+        request,
+        *args,
+        **kwargs,
+    ) -> HttpResponseBase:
+        """Answer with 304 if client has actual version, otherwise get it."""
+        if validators is None:
+            return get(request, *args, **kwargs)
+        last_modified = None
+        if self.detail:
+            last_modified = int(validators.last_modified.timestamp())
+        not_modified_response = get_conditional_response(
+            request,
+            etag=validators.etag,
+            last_modified=last_modified,
+        )
+        if not_modified_response is None:
+            get_response = get(request, *args, **kwargs)
+            if get_response.status_code != status.HTTP_200_OK:
+                return get_response
+        else:
+            get_response = not_modified_response
+        get_response["ETag"] = validators.etag
+        if last_modified is not None:
+            get_response["Last-Modified"] = http_date(last_modified)
+        return get_response
+
+    def get_conditional_get_validators(
+        self,
+        queryset: models.QuerySet,
+    ) -> ConditionalGetValidators | None:
+        """Compute validators of objects of queryset with a single query.
+
+        Returns None if response can't be validated by objects' timestamps.
+
+        """
+        request = self.request
+        if (
+            request.method != "GET"
+            or core_serializers.ModelBaseSerializer.expand_param
+            in request.query_params
+        ):
+            return None
+        stats = (
+            queryset.select_related(None)
+            .prefetch_related(None)
+            .order_by()
+            .aggregate(
+                count=models.Count("pk"),
+                **{
+                    f"modified_{index}": models.Max(field)
+                    for index, field in enumerate(
+                        self.conditional_get_modified_fields,
+                    )
+                },
+            )
+        )
+        count = stats.pop("count")
+        ttl = settings.CONDITIONAL_GET_VALIDATORS_TTL
+        window = int(timezone.now().timestamp()) // ttl
+        last_modified = max(
+            (
+                modified
+                for modified in (
+                    *stats.values(),
+                    dt.datetime.fromtimestamp(window * ttl, tz=dt.UTC),
+                )
+                if modified is not None
+            ),
+        )
+        key = ":".join(
+            (
+                str(request.user.pk),
+                request.accepted_renderer.format,
+                request.get_full_path(),
+                str(count),
+                last_modified.isoformat(),
+            ),
+        )
+        return ConditionalGetValidators(
+            etag=quote_etag(
+                hashlib.md5(key.encode(), usedforsecurity=False).hexdigest(),
+            ),
+            last_modified=last_modified,
+            count=count,
+        )
+
+
+class ResponseCacheMixin:
+    """Mixin which caches data of `list` and `retrieve` responses.
+
+    Data is cached per user and full URL (query params, including
+    pagination and fields), key also contains generations of
+    `response_cache_models`, which are bumped on any change of these models
+    (check `libs.api.response_cache`). So changed data is never served and
+    invalidation doesn't need to find cached keys.
+
+    ETag and Last-Modified (check `ConditionalGetMixin`, which should
+    follow this mixin) are cached with data, so cached responses and 304
+    responses to them are returned without DB queries.
+
+    Hits and misses are counted per view's basename, check
+    `response_cache_stats` management command.
+
+    """
+
+    response_cache_headers = ("ETag", "Last-Modified")
+
+    response_cache_models: collections.abc.Sequence[type[models.Model]] = ()
+    response_cache_timeout = settings.RESPONSE_CACHE_TIMEOUT
+
+    def list(self, request, *args, **kwargs) -> response.Response:
+        """List objects or return cached list."""
+        return self.get_cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs) -> response.Response:
+        """Retrieve object or return cached object."""
+        return self.get_cached_response(
+            super().retrieve,
+            request,
+            *args,
+            **kwargs,
+        )
+
+    def get_cached_response(
+        self,
+        get: collections.abc.Callable[..., response.Response],
+        request,
+        *args,
+        **kwargs,
+    ) -> response.Response:
+        """Return response with cached data or get and cache it.
+
+        Cached response is answered with 304 if client has its version.
+
+        """
+        key = self.get_response_cache_key(request)
+        cached = cache.get(key)
+        response_cache.record_lookup(self.basename, hit=cached is not None)
+        if cached is not None:
+            data, headers = cached
+            last_modified = headers.get("Last-Modified")
+            get_response = get_conditional_response(
+                request,
+                etag=headers.get("ETag"),
+                last_modified=last_modified and parse_http_date(last_modified),
+            ) or response.Response(data)
+            for header, value in headers.items():
+                get_response[header] = value
+            return get_response
+
+        get_response = get(request, *args, **kwargs)
+        if get_response.status_code == status.HTTP_200_OK:
+            headers = {
+                header: get_response[header]
+                for header in self.response_cache_headers
+                if header in get_response
+            }
+            cache.set(
+                key,
+                (get_response.data, headers),
+                self.response_cache_timeout,
+            )
+        return get_response
+
+    def get_response_cache_key(self, request) -> str:
+        """Get cache key of response for current user and generations."""
+        generations = response_cache.get_generations(
+            self.response_cache_models,
+        )
+        url_hash = hashlib.md5(
+            request.build_absolute_uri().encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+        return ":".join(
+            (
+                "response-cache",
+                self.basename,
+                self.action,
+                str(request.user.pk),
+                request.accepted_renderer.format,
+                url_hash,
+                *map(str, generations),
+            ),
+        )
@@ -1,6 +1,55 @@
+import collections.abc
 import copy
+import typing
 
-from rest_framework import request, serializers
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import models
+from django.db.models.constants import LOOKUP_SEP
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework import permissions, request, serializers
+from rest_framework.relations import PKOnlyObject
+
+from libs.api.exports import ExportFormat
+
+# Tree of requested field names, where `None` means all nested fields
+FieldsTree = dict[str, "FieldsTree | None"]
+
+
+def parse_fields_tree(value: str) -> FieldsTree:
+    """Parse comma separated field paths to tree of field names.
+
+    Example: `id,assignee_data.email,assignee_data.id` ->
+    `{"id": None, "assignee_data": {"email": None, "id": None}}`
+
+    """
+    tree: FieldsTree = {}
+    for path in value.split(","):
+        names = [name.strip() for name in path.split(".")]
+        if not all(names):
+            continue
+        node = tree
+        for name in names[:-1]:
+            node = node.setdefault(name, {})
+            if node is None:
+                break
+        else:
+            node[names[-1]] = None
+    return tree
+
+
+def get_fields_subtree(
+    tree: FieldsTree | None,
+    path: collections.abc.Sequence[str],
+) -> FieldsTree | None:
+    """Get tree of fields requested for nested field by its path."""
+    for name in path:
+        if tree is None:
+            return None
+        tree = tree.get(name, {})
+    return tree
 
 
 class BaseSerializer(serializers.Serializer):
@@ -22,8 +71,141 @@ class BaseSerializer(serializers.Serializer):
         return self.Meta
 
 
+class PrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """Primary key related field which can use prefetched objects.
+
+    `BulkListSerializer` sets `prefetched_objects` before validation of
+    items, so related objects of all items are fetched with a single query.
+
+    """
+
+    prefetched_objects: dict[typing.Any, models.Model] | None = None
+
+    def to_internal_value(self, data: typing.Any) -> models.Model:
+        """Get related object from prefetched objects if they're set."""
+        if self.prefetched_objects is None:
+            return super().to_internal_value(data)
+        pk = self.to_pk(data)
+        if pk is None:
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        if pk not in self.prefetched_objects:
+            self.fail("does_not_exist", pk_value=data)
+        return self.prefetched_objects[pk]
+
+    def to_pk(self, data: typing.Any) -> typing.Any:
+        """Convert primitive value to pk, return None if it's invalid."""
+        if isinstance(data, bool):
+            return None
+        try:
+            return self.get_queryset().model._meta.pk.to_python(data)
+        except DjangoValidationError:
+            return None
+
+
+class ValuesTransformer(typing.NamedTuple):
+    """Columns to fetch with `values()` and function representing rows."""
+
+    columns: list[str]
+    transform: collections.abc.Callable[[dict], dict]
+
+
+# Function representing column value, it receives the whole row since
+# nested serializers are represented from columns of related models
+ValueConverter = collections.abc.Callable[[typing.Any, dict], typing.Any]
+
+
 class ModelBaseSerializer(BaseSerializer, serializers.ModelSerializer):
-    """Model Serializer with common logic."""
+    """Model Serializer with common logic.
+
+    Supports sparse fieldsets and opt-in expansion via query params:
+        `?fields=` - comma separated fields to represent, other fields are
+            dropped. Applied only to safe requests, since writes need all
+            fields for validation.
+        `?expand=` - comma separated fields from `Meta.expandable_fields`,
+            which are not represented unless requested.
+
+    Both params support nested serializers via dots, for example
+    `?fields=id,assignment_data.title&expand=assignment_data.task_counters`.
+
+    """
+
+    serializer_related_field = PrimaryKeyRelatedField
+    fields_param = "fields"
+    expand_param = "expand"
+
+    def get_fields(self) -> dict[str, serializers.Field]:
+        """Drop fields which were not requested."""
+        fields = super().get_fields()
+        if getattr(self.context.get("view"), "swagger_fake_view", False):
+            return fields
+
+        path = self._get_field_path()
+        expand = get_fields_subtree(
+            self._get_requested_fields_tree(self.expand_param),
+            path,
+        )
+        for field_name in getattr(self._meta, "expandable_fields", ()):
+            if field_name not in (expand or {}):
+                fields.pop(field_name, None)
+
+        if self._request_method not in permissions.SAFE_METHODS:
+            return fields
+        requested = get_fields_subtree(
+            self._get_requested_fields_tree(self.fields_param),
+            path,
+        )
+        if requested is None:
+            return fields
+        return {
+            field_name: field
+            for field_name, field in fields.items()
+            if field_name in requested
+        }
+
+    def optimize_queryset(self, queryset: models.QuerySet) -> models.QuerySet:
+        """Load only data needed for representation of instances.
+
+        Forward relations represented with nested serializers are joined,
+        reverse and many-to-many relations are prefetched, other joins are
+        dropped. Columns are limited with `only()` unless some field isn't
+        backed by a model field (like properties or method fields).
+
+        """
+        only: set[str] | None = set()
+        select_related: set[str] = set()
+        prefetch_related: set[str] = set()
+        if not self._collect_loaded_fields(
+            prefix="",
+            only=only,
+            select_related=select_related,
+            prefetch_related=prefetch_related,
+        ):
+            only = None
+
+        # Values of ordering fields may be read by pagination
+        for ordering in queryset.query.order_by:
+            if not isinstance(ordering, str) or only is None:
+                continue
+            field_name = ordering.lstrip("-")
+            if field_name in queryset.query.annotations or field_name in (
+                "pk",
+                "?",
+            ):
+                continue
+            if LOOKUP_SEP in field_name:
+                only = None
+            else:
+                only.add(field_name)
+
+        # Without arguments `select_related()` follows all relations
+        queryset = queryset.select_related(None)
+        if select_related:
+            queryset = queryset.select_related(*sorted(select_related))
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*sorted(prefetch_related))
+        if only is not None:
+            queryset = queryset.only(*sorted(only))
+        return queryset
 
     def get_instance(self, attrs: dict):
         """Get instance depending on request."""
@@ -32,6 +214,8 @@ class ModelBaseSerializer(BaseSerializer, serializers.ModelSerializer):
         # If attrs have `id` data, get instance form db
         # if it is a create request, we return empty instance
         instance_id = attrs.get("id")
+        if instance_id is None:
+            return self._meta.model()
         instance = self._meta.model.objects.filter(pk=instance_id).first()
         return instance or self._meta.model()
 
@@ -74,6 +258,193 @@ class ModelBaseSerializer(BaseSerializer, serializers.ModelSerializer):
 
         return attrs
 
+    def get_values_transformer(self) -> ValuesTransformer | None:
+        """Compile transformer which represents rows of `values()`.
+
+        Rows are represented the same way as instances, but without
+        instantiating models and resolving attributes per each field. Return
+        `None` if some field can't be represented from column values (like
+        method fields, properties or reverse relations).
+
+        """
+        columns: list[str] = []
+        transform = self._compile_values_transform(prefix="", columns=columns)
+        if transform is None:
+            return None
+        return ValuesTransformer(columns=columns, transform=transform)
+
+    @property
+    def _request_method(self) -> str | None:
+        """Get method of current request."""
+        return getattr(self.context.get("request"), "method", None)
+
+    def _get_requested_fields_tree(self, param: str) -> FieldsTree | None:
+        """Get tree of fields requested in query param."""
+        query_params = getattr(self.context.get("request"), "query_params", {})
+        value = query_params.get(param)
+        if not value:
+            return None
+        return parse_fields_tree(value)
+
+    def _get_field_path(self) -> list[str]:
+        """Get names of fields from root serializer to this one."""
+        path = []
+        node = self
+        while node.parent is not None:
+            if node.field_name:
+                path.append(node.field_name)
+            node = node.parent
+        return path[::-1]
+
+    def _collect_loaded_fields(
+        self,
+        prefix: str,
+        only: set[str],
+        select_related: set[str],
+        prefetch_related: set[str],
+    ) -> bool:
+        """Collect fields and relations used by serializer fields.
+
+        Return `False` if columns can't be limited to collected ones.
+
+        """
+        model = self._meta.model
+        only.add(f"{prefix}{model._meta.pk.name}")
+        is_limited = True
+        for field in self.fields.values():
+            if field.source == "*":
+                is_limited = False
+                continue
+            field_name = field.source_attrs[0]
+            try:
+                model_field = model._meta.get_field(field_name)
+            except FieldDoesNotExist:
+                is_limited = False
+                continue
+            if model_field.many_to_many or model_field.one_to_many:
+                prefetch_related.add(f"{prefix}{field_name}")
+                continue
+            if not model_field.concrete:
+                is_limited = False
+                continue
+            only.add(f"{prefix}{field_name}")
+            if not model_field.is_relation or isinstance(
+                field,
+                serializers.PrimaryKeyRelatedField,
+            ):
+                continue
+            select_related.add(f"{prefix}{field_name}")
+            if (
+                not isinstance(field, ModelBaseSerializer)
+                or len(field.source_attrs) > 1
+            ):
+                is_limited = False
+                continue
+            is_limited &= field._collect_loaded_fields(
+                prefix=f"{prefix}{field_name}{LOOKUP_SEP}",
+                only=only,
+                select_related=select_related,
+                prefetch_related=prefetch_related,
+            )
+        return is_limited
+
+    def _compile_values_transform(
+        self,
+        prefix: str,
+        columns: list[str],
+    ) -> collections.abc.Callable[[dict], dict] | None:
+        """Compile function representing row, collect needed columns."""
+        steps: list[tuple[str, str, ValueConverter]] = []
+        for field in self._readable_fields:
+            column = f"{prefix}{field.source}"
+            converter = self._get_converter(field, column, columns)
+            if converter is None:
+                return None
+            columns.append(column)
+            steps.append((field.field_name, column, converter))
+
+        def transform(row: dict) -> dict:
+            """Represent row as serializer represents instance."""
+            representation = {}
+            for field_name, column, converter in steps:
+                value = row[column]
+                representation[field_name] = (
+                    None if value is None else converter(value, row)
+                )
+            return representation
+
+        return transform
+
+    def _get_converter(
+        self,
+        field: serializers.Field,
+        column: str,
+        columns: list[str],
+    ) -> ValueConverter | None:
+        """Get converter of column value of field.
+
+        Return `None` if field can't be represented from column value.
+
+        """
+        if field.source == "*" or len(field.source_attrs) > 1:
+            return None
+        try:
+            model_field = self._meta.model._meta.get_field(field.source)
+        except FieldDoesNotExist:
+            return None
+        if not model_field.concrete or model_field.many_to_many:
+            return None
+
+        if not model_field.is_relation:
+            return self._get_value_converter(field, model_field)
+        if isinstance(field, serializers.PrimaryKeyRelatedField):
+            return self._get_pk_converter(field)
+        if not isinstance(field, ModelBaseSerializer):
+            return None
+        nested_transform = field._compile_values_transform(
+            prefix=f"{column}{LOOKUP_SEP}",
+            columns=columns,
+        )
+        if nested_transform is None:
+            return None
+        return self._get_nested_converter(nested_transform)
+
+    def _get_value_converter(
+        self,
+        field: serializers.Field,
+        model_field: models.Field,
+    ) -> ValueConverter:
+        """Get converter of column value of regular field."""
+        to_representation = field.to_representation
+        if isinstance(model_field, models.FileField):
+            # `values()` returns names of files instead of `FieldFile`
+            def convert_file(value: str, row: dict) -> typing.Any:
+                return to_representation(
+                    model_field.attr_class(None, model_field, value),
+                )
+
+            return convert_file
+        return lambda value, row: to_representation(value)
+
+    def _get_pk_converter(
+        self,
+        field: serializers.PrimaryKeyRelatedField,
+    ) -> ValueConverter:
+        """Get converter of column value of primary key related field."""
+        to_representation = field.to_representation
+        return lambda value, row: to_representation(PKOnlyObject(pk=value))
+
+    def _get_nested_converter(
+        self,
+        nested_transform: collections.abc.Callable[[dict], dict],
+    ) -> ValueConverter:
+        """Get converter of related object represented by nested serializer.
+
+        Column of foreign key is used only to check that object is set.
+
+        """
+        return lambda value, row: nested_transform(row)
+
     def _get_relations_fields_names(self) -> set[str]:
         """Extract fields with relations before validation."""
         relations = set()
@@ -111,3 +482,194 @@ class ModelBaseSerializer(BaseSerializer, serializers.ModelSerializer):
                 relations.add(field.source)
 
         return relations
+
+
+class BulkListSerializer(serializers.ListSerializer):
+    """List serializer which validates and saves items in bulk.
+
+    Related objects of all items are fetched with one query per relation
+    field and items are saved with `bulk_create` or `bulk_update`, so number
+    of queries doesn't depend on number of items. Many-to-many relations are
+    not supported.
+
+    For update `instance` must be a queryset and each item must contain `id`
+    of instance to update. Instances are loaded with a single query too.
+
+    """
+
+    default_max_length = 500
+    default_error_messages = {
+        "does_not_exist": _(
+            'Invalid pk "{pk_value}" - object does not exist.',
+        ),
+        "duplicate": _(
+            'Object "{pk_value}" is already updated by other item.',
+        ),
+    }
+
+    def __init__(self, *args, **kwargs) -> None:
+        kwargs.setdefault("max_length", self.default_max_length)
+        super().__init__(*args, **kwargs)
+        self._instances: dict[typing.Any, models.Model] = {}
+        self._validated_instances: list[models.Model] = []
+        self._validated_pks: set = set()
+
+    def to_internal_value(self, data: typing.Any) -> list[dict]:
+        """Prefetch related objects and instances of all items."""
+        # Leave errors of invalid data to the default validation
+        if not isinstance(data, list) or (
+            self.max_length is not None and len(data) > self.max_length
+        ):
+            return super().to_internal_value(data)
+
+        related_fields = [
+            field
+            for field in self.child.fields.values()
+            if isinstance(field, PrimaryKeyRelatedField)
+            and not field.read_only
+            and field.pk_field is None
+        ]
+        self._validated_instances = []
+        self._validated_pks = set()
+        try:
+            for field in related_fields:
+                field.prefetched_objects = field.get_queryset().in_bulk(
+                    self._get_pks(data, field.field_name, field.to_pk),
+                )
+            if self.instance is not None:
+                self._instances = self.instance.in_bulk(
+                    self._get_pks(data, "id", self._to_instance_pk),
+                )
+            return super().to_internal_value(data)
+        finally:
+            for field in related_fields:
+                field.prefetched_objects = None
+            self._instances = {}
+
+    def run_child_validation(self, data: typing.Any) -> dict:
+        """Validate item against instance it updates."""
+        if self.instance is None or not isinstance(data, dict):
+            return super().run_child_validation(data)
+
+        instance_pk = self._to_instance_pk(data.get("id"))
+        if instance_pk not in self._instances:
+            raise serializers.ValidationError(
+                {
+                    "id": self.error_messages["does_not_exist"].format(
+                        pk_value=data.get("id"),
+                    ),
+                },
+                code="does_not_exist",
+            )
+        instance = self._instances[instance_pk]
+        if instance_pk in self._validated_pks:
+            raise serializers.ValidationError(
+                {
+                    "id": self.error_messages["duplicate"].format(
+                        pk_value=instance_pk,
+                    ),
+                },
+                code="duplicate",
+            )
+
+        self.child.instance = instance
+        try:
+            attrs = super().run_child_validation(data)
+        finally:
+            self.child.instance = None
+        self._validated_instances.append(instance)
+        self._validated_pks.add(instance_pk)
+        return attrs
+
+    def create(self, validated_data: list[dict]) -> list[models.Model]:
+        """Create all instances at once."""
+        model = self.child.Meta.model
+        instances = [model(**attrs) for attrs in validated_data]
+        return self.perform_bulk_create(instances)
+
+    def update(
+        self,
+        instance: models.QuerySet,
+        validated_data: list[dict],
+    ) -> list[models.Model]:
+        """Update all validated instances at once.
+
+        Fields with `auto_now` (like `modified`) are updated too, since
+        `bulk_update` doesn't call `save()`.
+
+        """
+        instances = self._validated_instances
+        fields = set()
+        for obj, attrs in zip(instances, validated_data, strict=True):
+            for attr, value in attrs.items():
+                setattr(obj, attr, value)
+            fields.update(attrs)
+        for field in self.child.Meta.model._meta.concrete_fields:
+            if getattr(field, "auto_now", False):
+                for obj in instances:
+                    setattr(obj, field.attname, field.pre_save(obj, add=False))
+                fields.add(field.name)
+        return self.perform_bulk_update(instances, sorted(fields))
+
+    def perform_bulk_create(
+        self,
+        instances: list[models.Model],
+    ) -> list[models.Model]:
+        """Save new instances with `bulk_create`."""
+        return self.child.Meta.model.objects.bulk_create(instances)
+
+    def perform_bulk_update(
+        self,
+        instances: list[models.Model],
+        fields: list[str],
+    ) -> list[models.Model]:
+        """Save changed instances with `bulk_update`."""
+        if instances and fields:
+            self.child.Meta.model.objects.bulk_update(instances, fields=fields)
+        return instances
+
+    def _to_instance_pk(self, data: typing.Any) -> typing.Any:
+        """Convert primitive value to instance pk, return None if invalid."""
+        if isinstance(data, bool):
+            return None
+        try:
+            return self.child.Meta.model._meta.pk.to_python(data)
+        except DjangoValidationError:
+            return None
+
+    def _get_pks(
+        self,
+        data: list,
+        field_name: str,
+        to_pk: typing.Callable[[typing.Any], typing.Any],
+    ) -> set:
+        """Collect valid pks of field from all items."""
+        pks = {
+            to_pk(item.get(field_name))
+            for item in data
+            if isinstance(item, dict)
+        }
+        pks.discard(None)
+        return pks
+
+
+class ExportQuerySerializer(serializers.Serializer):
+    """Serializer for query params of list export."""
+
+    export_format = serializers.ChoiceField(
+        choices=ExportFormat.choices,
+        default=ExportFormat.NDJSON,
+        help_text="Format of exported file.",
+    )
+
+
+class BatchRetrieveSerializer(serializers.Serializer):
+    """Serializer for ids of objects retrieved in batch."""
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=settings.BATCH_RETRIEVE_MAX_IDS,
+        help_text="Ids of objects to retrieve, at most "
+        f"{settings.BATCH_RETRIEVE_MAX_IDS}.",
+    )
@@ -8,6 +8,7 @@ from . import mixins as core_mixins
 class BaseViewSet(
     core_mixins.ActionPermissionsMixin,
     core_mixins.ActionSerializerMixin,
+    core_mixins.SparseFieldsetsMixin,
     GenericViewSet,
 ):
     """Base viewset for api."""
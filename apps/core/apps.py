@@ -5,3 +5,6 @@ class CoreAppConfig(AppConfig):
     """Default configuration for Core app."""
 
     name = "apps.core"
+
+    def ready(self) -> None:
+        from . import lookups  # noqa: F401
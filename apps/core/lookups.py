@@ -0,0 +1,31 @@
+from django.db import models
+
+
+@models.Field.register_lookup
+class Any(models.Lookup):
+    """Lookup which matches any of values passed as a single array.
+
+    Unlike `__in`, which renders placeholder per value, `field__any=[...]`
+    is rendered as `field = ANY(%s)`, so query text doesn't depend on number
+    of values and it's planned the same way for any of them.
+
+    """
+
+    lookup_name = "any"
+    prepare_rhs = False
+
+    def get_db_prep_lookup(self, value, connection) -> tuple[str, list]:  # noqa: ANN001
+        """Pass values prepared by field as a single array parameter."""
+        field = self.lhs.output_field
+        return "%s", [
+            [
+                field.get_db_prep_value(item, connection, prepared=False)
+                for item in value
+            ],
+        ]
+
+    def as_sql(self, compiler, connection) -> tuple[str, list]:  # noqa: ANN001
+        """Render `lhs = ANY(rhs)`."""
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} = ANY({rhs})", [*lhs_params, *rhs_params]
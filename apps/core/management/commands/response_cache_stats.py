@@ -0,0 +1,42 @@
+import collections.abc
+
+from django.core.management.base import BaseCommand
+from django.urls import URLResolver, get_resolver
+
+from libs.api import response_cache
+
+from ...api.mixins import ResponseCacheMixin
+
+
+class Command(BaseCommand):
+    """Report hits and misses of cached responses."""
+
+    help = (
+        "Show number of hits, misses and hit ratio of cached responses of "
+        "each view with response cache."
+    )
+
+    def handle(self, *args, **options) -> None:
+        """Report metrics of views found in urls."""
+        basenames = dict.fromkeys(self.get_basenames(get_resolver()))
+        metrics = response_cache.get_metrics(basenames)
+        for basename, (hits, misses) in metrics.items():
+            lookups = hits + misses
+            ratio = hits / lookups if lookups else 0
+            self.stdout.write(
+                f"{basename}: {hits} hit(s), {misses} miss(es), "
+                f"hit ratio {ratio:.1%}",
+            )
+
+    def get_basenames(
+        self,
+        resolver: URLResolver,
+    ) -> collections.abc.Iterator[str]:
+        """Get basenames of viewsets with response cache."""
+        for pattern in resolver.url_patterns:
+            if isinstance(pattern, URLResolver):
+                yield from self.get_basenames(pattern)
+                continue
+            view_class = getattr(pattern.callback, "cls", None)
+            if view_class and issubclass(view_class, ResponseCacheMixin):
+                yield pattern.callback.initkwargs["basename"]
@@ -0,0 +1,73 @@
+import collections.abc
+
+from django.db import models
+
+from rest_framework import generics
+
+from libs.api import exports
+
+from .api import serializers as core_serializers
+
+
+def get_export_content(
+    view: generics.GenericAPIView,
+    export_format: str,
+    chunk_size: int,
+) -> collections.abc.Iterator[bytes]:
+    """Get content of file exporting filtered list of view.
+
+    List has the same filters, search, ordering and fields as `list` of
+    view, but isn't paginated. Queryset is filtered right away, so invalid
+    params are raised as validation errors before content is iterated.
+    Rows are read with server-side cursor by `chunk_size` while content is
+    iterated, so memory usage doesn't depend on number of exported objects.
+
+    """
+    serializer = view.get_serializer()
+    rows = iter_export_rows(
+        serializer=serializer,
+        queryset=view.filter_queryset(view.get_queryset()),
+        chunk_size=chunk_size,
+    )
+    if export_format == exports.ExportFormat.CSV:
+        return exports.iter_csv(
+            rows=rows,
+            field_names=exports.get_field_names(serializer),
+            chunk_size=chunk_size,
+        )
+    if export_format == exports.ExportFormat.XLSX:
+        return exports.iter_xlsx(
+            rows=rows,
+            field_names=exports.get_field_names(serializer),
+        )
+    if export_format == exports.ExportFormat.PARQUET:
+        return exports.iter_parquet(
+            rows=rows,
+            schema=exports.get_parquet_schema(serializer),
+            chunk_size=chunk_size,
+        )
+    return exports.iter_ndjson(rows=rows, chunk_size=chunk_size)
+
+
+def iter_export_rows(
+    serializer: core_serializers.ModelBaseSerializer,
+    queryset: models.QuerySet,
+    chunk_size: int,
+) -> collections.abc.Iterator[dict]:
+    """Iterate over represented objects fetched in chunks.
+
+    Rows are represented from `values()` if serializer supports it,
+    otherwise from model instances.
+
+    """
+    transformer = serializer.get_values_transformer()
+    if transformer is None:
+        for instance in queryset.iterator(chunk_size=chunk_size):
+            yield serializer.to_representation(instance)
+        return
+    for row in (
+        queryset.prefetch_related(None)
+        .values(*transformer.columns)
+        .iterator(chunk_size=chunk_size)
+    ):
+        yield transformer.transform(row)
@@ -0,0 +1,89 @@
+import datetime
+import decimal
+import io
+import uuid
+
+from django.urls import reverse_lazy
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework import renderers, status, test
+from rest_framework.exceptions import ParseError
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+import pytest
+
+from libs.api.renderers import ORJSONParser, ORJSONRenderer
+
+
+def test_render_as_drf():
+    """Test that orjson renderer renders data the same way as drf."""
+    data = ReturnDict(
+        {
+            "datetime": datetime.datetime(
+                2025,
+                1,
+                2,
+                3,
+                4,
+                5,
+                678901,
+                tzinfo=datetime.UTC,
+            ),
+            "date": datetime.date(2025, 1, 2),
+            "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "decimal": decimal.Decimal("1.5"),
+            "lazy": _("User"),
+            "timedelta": datetime.timedelta(minutes=1),
+            "list": ReturnList([1, "two", None, True], serializer=None),
+            "separators": "line\u2028paragraph\u2029",
+            1: "int key",
+        },
+        serializer=None,
+    )
+    assert ORJSONRenderer().render(data) == renderers.JSONRenderer().render(
+        data,
+    )
+    assert ORJSONRenderer().render(None) == b""
+
+
+def test_render_indent():
+    """Test that indent is applied if requested."""
+    content = ORJSONRenderer().render(
+        {"now": timezone.now()},
+        accepted_media_type="application/json; indent=4",
+    )
+    assert content.startswith(b'{\n  "now": "')
+
+
+def test_parse():
+    """Test that orjson parser parses JSON and reports errors."""
+    assert ORJSONParser().parse(io.BytesIO('{"a": ["日本", 1]}'.encode())) == {
+        "a": ["日本", 1],
+    }
+    assert ORJSONParser().parse(
+        io.BytesIO('{"a": "日本"}'.encode("utf-16")),
+        parser_context={"encoding": "utf-16"},
+    ) == {"a": "日本"}
+    with pytest.raises(ParseError):
+        ORJSONParser().parse(io.BytesIO(b'{"a": NaN}'))
+
+
+def test_api_parse_error(user_api_client: test.APIClient):
+    """Test that invalid JSON is rejected by api."""
+    response = user_api_client.post(
+        path=reverse_lazy("v1:task-list"),
+        data=b"{",
+        content_type="application/json",
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_browsable_api(user_api_client: test.APIClient):
+    """Test that browsable api renders data with orjson renderer."""
+    response = user_api_client.get(
+        path=reverse_lazy("v1:task-list"),
+        HTTP_ACCEPT="text/html",
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert b"&quot;results&quot;: []" in response.content
@@ -0,0 +1,58 @@
+from django.contrib import admin
+
+from apps.core.admin import BaseAdmin
+
+from .. import models
+
+
+@admin.register(models.ExportJob)
+class ExportJobAdmin(BaseAdmin):
+    """Admin UI for ExportJob model."""
+
+    ordering = (
+        "-id",
+    )
+    list_display = (
+        "id",
+        "resource",
+        "export_format",
+        "creator",
+        "status",
+        "created",
+        "finished",
+    )
+    list_display_links = (
+        "resource",
+    )
+    list_filter = (
+        "status",
+        "resource",
+        "export_format",
+    )
+    list_select_related = (
+        "creator",
+    )
+    autocomplete_fields = (
+        "creator",
+    )
+    readonly_fields = (
+        "params_hash",
+        "finished",
+    )
+    fieldsets = (
+        (
+            None, {
+                "fields": (
+                    "creator",
+                    "resource",
+                    "export_format",
+                    "params",
+                    "params_hash",
+                    "status",
+                    "file",
+                    "error",
+                    "finished",
+                ),
+            },
+        ),
+    )
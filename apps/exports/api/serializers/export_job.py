@@ -0,0 +1,60 @@
+from django.conf import settings
+
+from rest_framework import serializers
+
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema_field
+
+from apps.core.api.serializers import ModelBaseSerializer
+
+from ... import constants, models
+
+
+class ExportJobSerializer(ModelBaseSerializer):
+    """Serializer for ExportJob model."""
+
+    resource = serializers.ChoiceField(
+        choices=tuple(settings.EXPORT_JOB_RESOURCES),
+        help_text="Exported list.",
+    )
+    params = serializers.DictField(
+        child=serializers.CharField(),
+        required=False,
+        help_text="Query params of exported list: filters, `search`, "
+        "`ordering` and `fields`.",
+    )
+    download_url = serializers.SerializerMethodField(
+        help_text="Presigned link to exported file, set when job is "
+        f"completed. Link expires in {settings.EXPORT_JOB_URL_EXPIRE} "
+        "seconds.",
+    )
+
+    class Meta:
+        model = models.ExportJob
+        fields = (
+            "id",
+            "resource",
+            "export_format",
+            "params",
+            "status",
+            "error",
+            "download_url",
+            "created",
+            "finished",
+        )
+        read_only_fields = (
+            "status",
+            "error",
+            "created",
+            "finished",
+        )
+
+    @extend_schema_field(OpenApiTypes.URI)
+    def get_download_url(self, job: models.ExportJob) -> str | None:
+        """Get presigned link to file of completed job."""
+        if job.status != constants.ExportJobStatus.COMPLETED or not job.file:
+            return None
+        return job.file.storage.url(
+            job.file.name,
+            expire=settings.EXPORT_JOB_URL_EXPIRE,
+        )
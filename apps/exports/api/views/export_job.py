@@ -0,0 +1,74 @@
+from rest_framework import mixins, response, status
+from rest_framework.permissions import IsAuthenticated
+
+from drf_spectacular.utils import extend_schema
+
+from apps.core.api.views import BaseViewSet
+
+from ... import models, services
+from .. import serializers
+
+
+class ExportJobViewSet(
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    mixins.CreateModelMixin,
+    BaseViewSet,
+):
+    """Api viewset for ExportJob model.
+
+    Exports which are too large for synchronous `export` actions are
+    written to storage by worker, clients poll job until it's completed
+    and download file by presigned link.
+
+    """
+
+    queryset = models.ExportJob.objects.all()
+    serializer_class = serializers.ExportJobSerializer
+    base_permission_classes = (
+        IsAuthenticated,
+    )
+    search_fields = (
+        "resource",
+    )
+    ordering_fields = (
+        "created",
+    )
+    filterset_fields = (
+        "resource",
+        "export_format",
+        "status",
+    )
+
+    def get_queryset(self):
+        """Limit jobs to jobs of current user."""
+        queryset = super().get_queryset()
+        if getattr(self, "swagger_fake_view", False):
+            return queryset.none()
+        return queryset.filter(creator=self.request.user)
+
+    @extend_schema(
+        responses={
+            200: serializers.ExportJobSerializer(),
+            201: serializers.ExportJobSerializer(),
+        },
+    )
+    def create(self, request, *args, **kwargs) -> response.Response:
+        """Request export of filtered list.
+
+        If the same export was already requested and isn't failed, existing
+        job is returned with 200 status instead of creating a new one.
+
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        job, created = services.get_or_create_export_job(
+            user=request.user,
+            resource=serializer.validated_data["resource"],
+            export_format=serializer.validated_data["export_format"],
+            params=serializer.validated_data.get("params", {}),
+        )
+        return response.Response(
+            self.get_serializer(job).data,
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
+
+
+class ExportsAppConfig(AppConfig):
+    """Default configuration for Exports app."""
+
+    name = "apps.exports"
+    verbose_name = _("Exports")
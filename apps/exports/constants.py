@@ -0,0 +1,18 @@
+from django.db import models
+
+
+class ExportJobStatus(models.TextChoices):
+    """Export job status choices."""
+
+    PENDING = "pending", "Pending"
+    RUNNING = "running", "Running"
+    COMPLETED = "completed", "Completed"
+    FAILED = "failed", "Failed"
+
+
+# Statuses of jobs which are queued or being processed by worker, there can
+# be only one such job for the same export
+ACTIVE_EXPORT_JOB_STATUSES = (
+    ExportJobStatus.PENDING,
+    ExportJobStatus.RUNNING,
+)
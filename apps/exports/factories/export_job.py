@@ -0,0 +1,19 @@
+import uuid
+
+import factory
+
+from libs.api.exports import ExportFormat
+
+from .. import models
+
+
+class ExportJobFactory(factory.django.DjangoModelFactory):
+    """Factory to generate test ExportJob instance."""
+
+    creator = factory.SubFactory("apps.users.factories.UserFactory")
+    resource = "tasks"
+    export_format = ExportFormat.CSV
+    params_hash = factory.LazyFunction(lambda: uuid.uuid4().hex)
+
+    class Meta:
+        model = models.ExportJob
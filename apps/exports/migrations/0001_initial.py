@@ -0,0 +1,138 @@
+# Generated by Django 5.2 on 2026-10-18 14:24
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+import django_extensions.db.fields
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExportJob",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created",
+                    django_extensions.db.fields.CreationDateTimeField(
+                        auto_now_add=True,
+                        verbose_name="created",
+                    ),
+                ),
+                (
+                    "modified",
+                    django_extensions.db.fields.ModificationDateTimeField(
+                        auto_now=True,
+                        verbose_name="modified",
+                    ),
+                ),
+                (
+                    "resource",
+                    models.CharField(max_length=50, verbose_name="Resource"),
+                ),
+                (
+                    "export_format",
+                    models.CharField(
+                        choices=[("ndjson", "NDJSON"), ("csv", "CSV")],
+                        max_length=10,
+                        verbose_name="Export format",
+                    ),
+                ),
+                (
+                    "params",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        verbose_name="Params",
+                    ),
+                ),
+                (
+                    "params_hash",
+                    models.CharField(
+                        max_length=64,
+                        verbose_name="Params hash",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("running", "Running"),
+                            ("completed", "Completed"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                        verbose_name="Status",
+                    ),
+                ),
+                (
+                    "file",
+                    models.FileField(
+                        blank=True,
+                        max_length=512,
+                        upload_to="",
+                        verbose_name="File",
+                    ),
+                ),
+                ("error", models.TextField(blank=True, verbose_name="Error")),
+                (
+                    "finished",
+                    models.DateTimeField(
+                        blank=True,
+                        null=True,
+                        verbose_name="Finished",
+                    ),
+                ),
+                (
+                    "creator",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="export_jobs",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Creator",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Export job",
+                "verbose_name_plural": "Export jobs",
+                "indexes": [
+                    models.Index(
+                        fields=["params_hash", "created"],
+                        name="export_job_hash_created_idx",
+                    ),
+                    models.Index(
+                        fields=["creator", "created"],
+                        name="export_job_creator_created_idx",
+                    ),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(
+                            ("status__in", ("pending", "running")),
+                        ),
+                        fields=("creator", "params_hash"),
+                        name="unique_active_export_job",
+                    ),
+                ],
+            },
+        ),
+    ]
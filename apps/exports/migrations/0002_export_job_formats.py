@@ -0,0 +1,26 @@
+# Generated by Django 5.2 on 2026-10-18 16:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("exports", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="exportjob",
+            name="export_format",
+            field=models.CharField(
+                choices=[
+                    ("ndjson", "NDJSON"),
+                    ("csv", "CSV"),
+                    ("xlsx", "XLSX"),
+                    ("parquet", "Parquet"),
+                ],
+                max_length=10,
+                verbose_name="Export format",
+            ),
+        ),
+    ]
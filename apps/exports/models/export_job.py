@@ -0,0 +1,90 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from apps.core.models import BaseModel
+from libs.api.exports import ExportFormat
+
+from ..constants import ACTIVE_EXPORT_JOB_STATUSES, ExportJobStatus
+
+
+class ExportJob(BaseModel):
+    """Export of filtered list, which is written to storage by worker.
+
+    Jobs are identified by `params_hash` of creator, resource, format and
+    params, so repeated requests of the same export reuse one job. There can
+    be only one queued or running job with the same hash.
+
+    """
+
+    creator = models.ForeignKey(
+        "users.User",
+        on_delete=models.CASCADE,
+        related_name="export_jobs",
+        verbose_name=_("Creator"),
+        # Covered by `export_job_creator_created_idx`
+        db_index=False,
+    )
+    resource = models.CharField(
+        max_length=50,
+        verbose_name=_("Resource"),
+    )
+    export_format = models.CharField(
+        max_length=10,
+        verbose_name=_("Export format"),
+        choices=ExportFormat.choices,
+    )
+    params = models.JSONField(
+        verbose_name=_("Params"),
+        default=dict,
+        blank=True,
+    )
+    params_hash = models.CharField(
+        max_length=64,
+        verbose_name=_("Params hash"),
+    )
+    status = models.CharField(
+        max_length=20,
+        verbose_name=_("Status"),
+        choices=ExportJobStatus.choices,
+        default=ExportJobStatus.PENDING,
+    )
+    file = models.FileField(
+        max_length=512,
+        verbose_name=_("File"),
+        blank=True,
+    )
+    error = models.TextField(
+        verbose_name=_("Error"),
+        blank=True,
+    )
+    finished = models.DateTimeField(
+        verbose_name=_("Finished"),
+        null=True,
+        blank=True,
+    )
+
+    class Meta:
+        verbose_name = _("Export job")
+        verbose_name_plural = _("Export jobs")
+        constraints = (
+            models.UniqueConstraint(
+                fields=("creator", "params_hash"),
+                condition=models.Q(status__in=ACTIVE_EXPORT_JOB_STATUSES),
+                name="unique_active_export_job",
+            ),
+        )
+        indexes = (
+            # Lookup of finished jobs which can be reused
+            models.Index(
+                fields=("params_hash", "created"),
+                name="export_job_hash_created_idx",
+            ),
+            # Jobs of creator ordered by creation
+            models.Index(
+                fields=("creator", "created"),
+                name="export_job_creator_created_idx",
+            ),
+        )
+
+    def __str__(self) -> str:
+        return f"{self.resource}.{self.export_format} ({self.status})"
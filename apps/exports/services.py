@@ -0,0 +1,185 @@
+import datetime as dt
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import IntegrityError, transaction
+from django.http import HttpRequest, QueryDict
+from django.utils import timezone
+from django.utils.http import urlencode
+from django.utils.module_loading import import_string
+
+from rest_framework import exceptions, generics
+
+import orjson
+
+from apps.core import services as core_services
+from apps.users import models as users_models
+
+from . import constants, models
+
+# Params which are set by export job itself and can't be overridden
+RESERVED_PARAMS = ("export_format",)
+
+
+def get_params_hash(
+    user: users_models.User,
+    resource: str,
+    export_format: str,
+    params: dict,
+) -> str:
+    """Get hash identifying export, it doesn't depend on order of params."""
+    key = orjson.dumps(
+        {
+            "creator": user.pk,
+            "resource": resource,
+            "export_format": export_format,
+            "params": params,
+        },
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return hashlib.sha256(key).hexdigest()
+
+
+def get_or_create_export_job(
+    user: users_models.User,
+    resource: str,
+    export_format: str,
+    params: dict,
+) -> tuple[models.ExportJob, bool]:
+    """Get export job for export request or create and enqueue a new one.
+
+    Queued or running job with the same params is returned, as well as
+    completed one if it was created within `EXPORT_JOB_REUSE_TIMEOUT`.
+    Queued or running jobs older than `EXPORT_JOB_TIMEOUT` are considered
+    lost and marked as failed. New job is sent to worker after commit.
+
+    """
+    params = {
+        key: value
+        for key, value in params.items()
+        if key not in RESERVED_PARAMS
+    }
+    params_hash = get_params_hash(user, resource, export_format, params)
+    jobs = models.ExportJob.objects.filter(
+        creator=user,
+        params_hash=params_hash,
+    )
+    now = timezone.now()
+    jobs.filter(
+        status__in=constants.ACTIVE_EXPORT_JOB_STATUSES,
+        created__lt=now
+        - dt.timedelta(
+            seconds=settings.EXPORT_JOB_TIMEOUT,
+        ),
+    ).update(
+        status=constants.ExportJobStatus.FAILED,
+        error="Export job timed out.",
+        finished=now,
+        modified=now,
+    )
+    reusable_jobs = jobs.filter(
+        status__in=(
+            *constants.ACTIVE_EXPORT_JOB_STATUSES,
+            constants.ExportJobStatus.COMPLETED,
+        ),
+        created__gte=now
+        - dt.timedelta(
+            seconds=settings.EXPORT_JOB_REUSE_TIMEOUT,
+        ),
+    )
+    job = reusable_jobs.order_by("-created").first()
+    if job is not None:
+        return job, False
+
+    try:
+        with transaction.atomic():
+            job = models.ExportJob.objects.create(
+                creator=user,
+                resource=resource,
+                export_format=export_format,
+                params=params,
+                params_hash=params_hash,
+            )
+    except IntegrityError:
+        # Same job was created by concurrent request, it may be finished
+        # already, so active job is looked up first and then reusable one
+        job = (
+            jobs.filter(status__in=constants.ACTIVE_EXPORT_JOB_STATUSES)
+            .order_by("-created")
+            .first()
+        ) or reusable_jobs.order_by("-created").first()
+        if job is None:
+            raise
+        return job, False
+
+    from . import tasks
+
+    transaction.on_commit(lambda: tasks.run_export_job.delay(job.pk))
+    return job, True
+
+
+def get_export_view(job: models.ExportJob) -> generics.GenericAPIView:
+    """Set up viewset of job's resource to export list on behalf of creator.
+
+    Request of viewset has job's params as query params, so list is scoped,
+    filtered and represented the same way as for synchronous export.
+
+    """
+    http_request = HttpRequest()
+    http_request.method = "GET"
+    http_request.GET = QueryDict(urlencode(job.params, doseq=True))
+    view = import_string(settings.EXPORT_JOB_RESOURCES[job.resource])(
+        action_map={"get": "export"},
+        args=(),
+        kwargs={},
+        format_kwarg=None,
+    )
+    view.request = view.initialize_request(http_request)
+    view.request.user = job.creator
+    view.check_permissions(view.request)
+    return view
+
+
+def run_export_job(job: models.ExportJob) -> None:
+    """Write export of claimed job to default storage.
+
+    Content is produced by the same service as synchronous export and
+    written to storage as it's produced (S3 storage uploads it with
+    multipart upload), so neither the whole list nor the file is kept in
+    memory. Job fails if params are rejected by viewset.
+
+    """
+    try:
+        content = core_services.get_export_content(
+            view=get_export_view(job),
+            export_format=job.export_format,
+            chunk_size=settings.EXPORT_CHUNK_SIZE,
+        )
+    except exceptions.APIException as error:
+        finish_export_job(
+            job=job,
+            status=constants.ExportJobStatus.FAILED,
+            error=orjson.dumps(error.get_full_details()).decode(),
+        )
+        return
+
+    name = f"exports/{uuid.uuid4()}/{job.resource}.{job.export_format}"
+    with default_storage.open(name, "wb") as file:
+        for chunk in content:
+            file.write(chunk)
+    job.file.name = name
+    finish_export_job(job=job, status=constants.ExportJobStatus.COMPLETED)
+
+
+def finish_export_job(
+    job: models.ExportJob,
+    status: str,
+    error: str = "",
+) -> None:
+    """Save result of export job."""
+    job.status = status
+    job.error = error
+    job.finished = timezone.now()
+    job.save(update_fields=("status", "error", "file", "finished", "modified"))
@@ -0,0 +1,40 @@
+import logging
+
+from django.utils import timezone
+
+from config.celery import app
+
+from . import constants, models, services
+
+logger = logging.getLogger("django")
+
+
+@app.task(ignore_result=True)
+def run_export_job(job_id: int) -> None:
+    """Write export of queued job to storage.
+
+    Job is claimed by switching it from pending to running in one query, so
+    it's run once even if task is delivered to several workers. Unexpected
+    errors are logged and job is marked as failed, so clients polling the
+    job don't wait for it forever.
+
+    """
+    claimed = models.ExportJob.objects.filter(
+        pk=job_id,
+        status=constants.ExportJobStatus.PENDING,
+    ).update(
+        status=constants.ExportJobStatus.RUNNING,
+        modified=timezone.now(),
+    )
+    if not claimed:
+        return
+    job = models.ExportJob.objects.select_related("creator").get(pk=job_id)
+    try:
+        services.run_export_job(job)
+    except Exception:
+        logger.exception("Export job %s failed", job_id)
+        services.finish_export_job(
+            job=job,
+            status=constants.ExportJobStatus.FAILED,
+            error="Unexpected error.",
+        )
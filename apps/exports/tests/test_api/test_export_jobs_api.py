@@ -0,0 +1,257 @@
+import collections.abc
+import contextlib
+import datetime as dt
+import io
+import json
+import types
+
+from django.core.files.storage import default_storage
+from django.db import IntegrityError
+from django.urls import reverse_lazy
+from django.utils import timezone
+
+from rest_framework import status, test
+from rest_framework.response import Response
+
+import pytest
+from pyarrow import parquet
+
+from apps.assignment import constants as assignment_constants
+from apps.assignment import factories as assignment_factories
+from apps.assignment import models as assignment_models
+from apps.users import models as users_models
+
+from ... import constants, factories, models, services
+from ... import tasks as export_tasks
+
+
+@pytest.fixture
+def tasks(user: users_models.User) -> list[assignment_models.Task]:
+    """Create tasks with every status assigned to `user`."""
+    assignment = assignment_factories.AssignmentFactory()
+    return [
+        assignment_factories.TaskFactory(
+            assignment=assignment,
+            assignee=user,
+            status=task_status,
+        )
+        for task_status in assignment_constants.TaskStatus.values
+    ]
+
+
+@pytest.fixture
+def request_export(
+    user_api_client: test.APIClient,
+    django_capture_on_commit_callbacks: collections.abc.Callable,
+) -> collections.abc.Callable[..., Response]:
+    """Request export job and run enqueued jobs."""
+
+    def _request_export(**data) -> Response:
+        with django_capture_on_commit_callbacks(execute=True):
+            return user_api_client.post(
+                path=reverse_lazy("v1:exportjob-list"),
+                data=data,
+                format="json",
+            )
+
+    return _request_export
+
+
+def read_export(job_id: int) -> bytes:
+    """Read file of completed export job."""
+    job = models.ExportJob.objects.get(pk=job_id)
+    assert job.status == constants.ExportJobStatus.COMPLETED, job.error
+    with default_storage.open(job.file.name, "rb") as file:
+        return file.read()
+
+
+def test_export_job(
+    user_api_client: test.APIClient,
+    request_export: collections.abc.Callable[..., Response],
+    tasks: list[assignment_models.Task],
+):
+    """Test that export is written to storage and linked when completed."""
+    response = request_export(
+        resource="tasks",
+        export_format="ndjson",
+        params={
+            "status": assignment_constants.TaskStatus.READY,
+            "fields": "id,status",
+        },
+    )
+    assert response.status_code == status.HTTP_201_CREATED, response.data
+    assert response.data["status"] == constants.ExportJobStatus.PENDING
+    assert response.data["download_url"] is None
+
+    content = read_export(response.data["id"])
+    assert [json.loads(line) for line in content.splitlines()] == [
+        {"id": tasks[1].pk, "status": tasks[1].status},
+    ]
+
+    response = user_api_client.get(
+        path=reverse_lazy(
+            "v1:exportjob-detail",
+            kwargs={"pk": response.data["id"]},
+        ),
+    )
+    assert response.data["status"] == constants.ExportJobStatus.COMPLETED
+    assert "tasks.ndjson?" in response.data["download_url"]
+    assert response.data["finished"] is not None
+
+
+def test_export_job_csv(
+    request_export: collections.abc.Callable[..., Response],
+    tasks: list[assignment_models.Task],
+):
+    """Test that export job writes CSV with the same columns as export."""
+    response = request_export(
+        resource="tasks",
+        export_format="csv",
+        params={"fields": "id", "ordering": "created"},
+    )
+    assert read_export(response.data["id"]).decode().splitlines() == [
+        "id",
+        *(str(task.pk) for task in tasks),
+    ]
+
+
+def test_export_job_parquet(
+    request_export: collections.abc.Callable[..., Response],
+    tasks: list[assignment_models.Task],
+):
+    """Test that export job writes Parquet file."""
+    response = request_export(
+        resource="tasks",
+        export_format="parquet",
+        params={"fields": "id", "ordering": "created"},
+    )
+    content = read_export(response.data["id"])
+    assert parquet.read_table(io.BytesIO(content)).to_pylist() == [
+        {"id": task.pk} for task in tasks
+    ]
+
+
+@pytest.mark.usefixtures("tasks")
+def test_export_job_deduplication(
+    request_export: collections.abc.Callable[..., Response],
+):
+    """Test that repeated export requests reuse the same job."""
+    data = {
+        "resource": "tasks",
+        "export_format": "csv",
+        "params": {"status": "ready", "ordering": "created"},
+    }
+    job_id = request_export(**data).data["id"]
+    response = request_export(**{**data, "params": {**data["params"]}})
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert response.data["id"] == job_id
+    assert models.ExportJob.objects.count() == 1
+
+    other_response = request_export(**{**data, "export_format": "ndjson"})
+    assert other_response.status_code == status.HTTP_201_CREATED
+    assert other_response.data["id"] != job_id
+
+
+def test_export_job_timeouts(
+    user: users_models.User,
+    request_export: collections.abc.Callable[..., Response],
+):
+    """Test that outdated and lost jobs are not reused."""
+    data = {"resource": "tasks", "export_format": "csv", "params": {}}
+    job_id = request_export(**data).data["id"]
+    lost_job = factories.ExportJobFactory(
+        creator=user,
+        params_hash=models.ExportJob.objects.get(pk=job_id).params_hash,
+        status=constants.ExportJobStatus.RUNNING,
+    )
+    models.ExportJob.objects.update(
+        created=timezone.now() - dt.timedelta(hours=2),
+    )
+    response = request_export(**data)
+    assert response.status_code == status.HTTP_201_CREATED, response.data
+    lost_job.refresh_from_db()
+    assert lost_job.status == constants.ExportJobStatus.FAILED
+
+
+def test_export_job_invalid_params(
+    request_export: collections.abc.Callable[..., Response],
+):
+    """Test that job fails if export rejects params."""
+    response = request_export(
+        resource="tasks",
+        export_format="csv",
+        params={"status": "unknown"},
+    )
+    job = models.ExportJob.objects.get(pk=response.data["id"])
+    assert job.status == constants.ExportJobStatus.FAILED
+    assert job.error
+    assert not job.file
+
+
+def test_export_jobs_of_other_users(
+    user_api_client: test.APIClient,
+):
+    """Test that users see only their own export jobs."""
+    job = factories.ExportJobFactory()
+    response: Response = user_api_client.get(
+        path=reverse_lazy("v1:exportjob-list"),
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["results"] == []
+    response = user_api_client.get(
+        path=reverse_lazy("v1:exportjob-detail", kwargs={"pk": job.pk}),
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_export_job_concurrent_request(
+    user: users_models.User,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that job of concurrent request is reused even if it's finished."""
+
+    def create(**kwargs) -> models.ExportJob:
+        # Concurrent request has created and completed the same job
+        models.ExportJob(
+            **kwargs,
+            status=constants.ExportJobStatus.COMPLETED,
+        ).save()
+        raise IntegrityError
+
+    monkeypatch.setattr(models.ExportJob.objects, "create", create)
+    # Job of concurrent request isn't rolled back with creation of new one
+    monkeypatch.setattr(
+        services,
+        "transaction",
+        types.SimpleNamespace(atomic=contextlib.nullcontext),
+    )
+    job, created = services.get_or_create_export_job(
+        user=user,
+        resource="tasks",
+        export_format="csv",
+        params={},
+    )
+    assert not created
+    assert job.status == constants.ExportJobStatus.COMPLETED
+
+
+def test_export_job_delivered_twice(user: users_models.User):
+    """Test that job is run only by the worker which claimed it."""
+    job = factories.ExportJobFactory(creator=user)
+    export_tasks.run_export_job(job.pk)
+    job.refresh_from_db()
+    assert job.status == constants.ExportJobStatus.COMPLETED
+    file_name = job.file.name
+
+    export_tasks.run_export_job(job.pk)
+    job.refresh_from_db()
+    assert job.file.name == file_name
+
+    running_job = factories.ExportJobFactory(
+        creator=user,
+        status=constants.ExportJobStatus.RUNNING,
+    )
+    export_tasks.run_export_job(running_job.pk)
+    running_job.refresh_from_db()
+    assert running_job.status == constants.ExportJobStatus.RUNNING
+    assert not running_job.file
@@ -1 +1,5 @@
-from .user import UserSerializer
+from .user import (
+    UserLookupQuerySerializer,
+    UserLookupSerializer,
+    UserSerializer,
+)
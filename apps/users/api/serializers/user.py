@@ -1,3 +1,7 @@
+from django.conf import settings
+
+from rest_framework import serializers
+
 from apps.core.api.serializers import ModelBaseSerializer
 
 from ... import models
@@ -27,3 +31,32 @@ class UserSerializer(ModelBaseSerializer):
             "created",
             "modified",
         )
+
+
+class UserLookupSerializer(ModelBaseSerializer):
+    """Serializer for representing `User` in lookups (e.g. pickers)."""
+
+    class Meta:
+        model = models.User
+        fields = (
+            "id",
+            "first_name",
+            "last_name",
+            "email",
+            "avatar",
+        )
+        read_only_fields = fields
+
+
+class UserLookupQuerySerializer(serializers.Serializer):
+    """Serializer for query params of users lookup."""
+
+    search = serializers.CharField(
+        help_text="Name or email (or their parts) of searched users.",
+    )
+    limit = serializers.IntegerField(
+        min_value=1,
+        max_value=settings.USER_LOOKUP_MAX_LIMIT,
+        default=10,
+        help_text="Max number of returned users.",
+    )
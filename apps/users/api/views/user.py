@@ -1,12 +1,25 @@
+from rest_framework import decorators, response
 from rest_framework.permissions import IsAuthenticated
 
+from drf_spectacular.utils import extend_schema
+
+from apps.core.api.mixins import (
+    BatchRetrieveMixin,
+    ConditionalGetMixin,
+    ResponseCacheMixin,
+)
 from apps.core.api.views import ReadOnlyViewSet
 
-from ... import models
+from ... import models, services
 from .. import serializers
 
 
-class UsersViewSet(ReadOnlyViewSet):
+class UsersViewSet(
+    ResponseCacheMixin,
+    ConditionalGetMixin,
+    BatchRetrieveMixin,
+    ReadOnlyViewSet,
+):
     """ViewSet for viewing accounts."""
 
     queryset = models.User.objects.all()
@@ -24,3 +37,51 @@ class UsersViewSet(ReadOnlyViewSet):
         "last_name",
         "email",
     )
+    conditional_get_modified_fields = (
+        "modified",
+        "last_login",
+    )
+    response_cache_models = (
+        models.User,
+    )
+
+    @extend_schema(
+        parameters=[
+            serializers.UserLookupQuerySerializer,
+        ],
+        responses={
+            200: serializers.UserLookupSerializer(many=True),
+        },
+    )
+    @decorators.action(
+        detail=False,
+        methods=["GET"],
+        url_path="lookup",
+        url_name="lookup",
+        pagination_class=None,
+        filter_backends=(),
+    )
+    def lookup(self, request, *args, **kwargs) -> response.Response:
+        """Fuzzy search users by name or email.
+
+        Designed for pickers (e.g. of assignees), which search on every
+        keystroke: users are found with trigram indexes, ordered by
+        similarity and only a small set of fields is loaded.
+
+        """
+        query_serializer = serializers.UserLookupQuerySerializer(
+            data=request.query_params,
+        )
+        query_serializer.is_valid(raise_exception=True)
+        queryset = services.lookup_users(
+            queryset=self.get_queryset().only(
+                *serializers.UserLookupSerializer.Meta.fields,
+            ),
+            search=query_serializer.validated_data["search"],
+        )
+        serializer = serializers.UserLookupSerializer(
+            queryset[: query_serializer.validated_data["limit"]],
+            many=True,
+            context=self.get_serializer_context(),
+        )
+        return response.Response(serializer.data)
@@ -7,3 +7,6 @@ class UsersAppConfig(AppConfig):
 
     name = "apps.users"
     verbose_name = _("Users")
+
+    def ready(self) -> None:
+        from . import signals  # noqa: F401
@@ -1,6 +1,7 @@
 from django.conf import settings
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from django.contrib.auth.models import UserManager as DjangoUserManager
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
@@ -107,6 +108,24 @@ class User(
     class Meta:
         verbose_name = _("User")
         verbose_name_plural = _("Users")
+        # Trigram indexes for fuzzy search of users by name or email
+        indexes = (
+            GinIndex(
+                fields=("first_name",),
+                opclasses=("gin_trgm_ops",),
+                name="user_first_name_trgm_idx",
+            ),
+            GinIndex(
+                fields=("last_name",),
+                opclasses=("gin_trgm_ops",),
+                name="user_last_name_trgm_idx",
+            ),
+            GinIndex(
+                fields=("email",),
+                opclasses=("gin_trgm_ops",),
+                name="user_email_trgm_idx",
+            ),
+        )
 
     def __str__(self) -> str:
         return self.email
@@ -0,0 +1,59 @@
+import functools
+import operator
+
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import models
+from django.db.models.functions import Greatest
+
+from . import models as users_models
+
+LOOKUP_FIELDS = (
+    "first_name",
+    "last_name",
+    "email",
+)
+
+
+def lookup_users(
+    queryset: models.QuerySet[users_models.User],
+    search: str,
+) -> models.QuerySet[users_models.User]:
+    """Find users which fuzzy match `search` by name or email.
+
+    Each word of search should be similar to a word of any of lookup fields,
+    so `john sm` finds `John Smith`. Matching is done with `pg_trgm` word
+    similarity operator, which is supported by trigram indexes of the fields.
+    Users are ordered by total similarity of words, most similar first.
+
+    """
+    words = search.split()
+    if not words:
+        return queryset.none()
+    queryset = queryset.filter(
+        *(
+            functools.reduce(
+                operator.or_,
+                (
+                    models.Q(**{f"{field}__trigram_word_similar": word})
+                    for field in LOOKUP_FIELDS
+                ),
+            )
+            for word in words
+        ),
+    )
+    similarity = functools.reduce(
+        operator.add,
+        (
+            Greatest(
+                *(
+                    TrigramWordSimilarity(word, field)
+                    for field in LOOKUP_FIELDS
+                ),
+            )
+            for word in words
+        ),
+    )
+    return queryset.annotate(similarity=similarity).order_by(
+        "-similarity",
+        "pk",
+    )
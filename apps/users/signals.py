@@ -0,0 +1,13 @@
+from django.db.models import signals
+from django.dispatch import receiver
+
+from libs.api.response_cache import invalidate_responses
+
+from . import models
+
+
+@receiver(signals.post_save, sender=models.User)
+@receiver(signals.post_delete, sender=models.User)
+def invalidate_cached_responses(**kwargs) -> None:
+    """Invalidate cached responses which depend on users."""
+    invalidate_responses(models.User)
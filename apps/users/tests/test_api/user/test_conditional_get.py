@@ -0,0 +1,29 @@
+from django.urls import reverse_lazy
+
+from rest_framework import status, test
+from rest_framework.response import Response
+
+from .... import models
+
+
+def test_api(
+    api_client: test.APIClient,
+    admin: models.User,
+    instance: models.User,
+):
+    """Test that user is validated by modification and last login."""
+    api_client.force_authenticate(user=admin)
+    url = reverse_lazy("v1:users-detail", kwargs={"pk": instance.pk})
+    etag = api_client.get(path=url)["ETag"]
+    response: Response = api_client.get(
+        path=url,
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    api_client.force_login(instance)
+    response = api_client.get(
+        path=url,
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_200_OK
@@ -0,0 +1,110 @@
+from django.db import connection
+from django.urls import reverse_lazy
+
+from rest_framework import status, test
+from rest_framework.response import Response
+
+import pytest
+import pytest_django
+
+from .... import factories, models, services
+
+
+@pytest.fixture
+def looked_up_users() -> list[models.User]:
+    """Create users for lookup."""
+    return [
+        factories.UserFactory(
+            first_name="Zorvan",
+            last_name="Quillfeather",
+            email="zorvan.quillfeather@example.com",
+        ),
+        factories.UserFactory(
+            first_name="Zorvanny",
+            last_name="Thornwick",
+            email="thornwick@example.com",
+        ),
+        factories.UserFactory(
+            first_name="Ysolde",
+            last_name="Quillfeathers",
+            email="ysolde@example.com",
+        ),
+    ]
+
+
+def lookup_users(api_client: test.APIClient, **params) -> list[int]:
+    """Lookup users and return ids of found users."""
+    response: Response = api_client.get(
+        path=reverse_lazy("v1:users-lookup"),
+        data=params,
+    )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    return [user["id"] for user in response.data]
+
+
+def test_lookup(
+    user_api_client: test.APIClient,
+    looked_up_users: list[models.User],
+):
+    """Test that users are fuzzy matched and ordered by similarity."""
+    zorvan, zorvanny, ysolde = looked_up_users
+    assert lookup_users(user_api_client, search="zorvan") == [
+        zorvan.pk,
+        zorvanny.pk,
+    ]
+    assert lookup_users(user_api_client, search="quillfeat zo") == [zorvan.pk]
+    assert lookup_users(user_api_client, search="quillfeather") == [
+        zorvan.pk,
+        ysolde.pk,
+    ]
+    assert lookup_users(user_api_client, search="thornwick@") == [zorvanny.pk]
+    assert lookup_users(user_api_client, search="quillfeather", limit=1) == [
+        zorvan.pk,
+    ]
+
+
+def test_lookup_fields(
+    user_api_client: test.APIClient,
+    looked_up_users: list[models.User],
+    django_assert_num_queries: pytest_django.DjangoAssertNumQueries,
+):
+    """Test that lookup returns only small set of fields with one query."""
+    # Savepoint and release of atomic request + lookup query
+    with django_assert_num_queries(3):
+        response: Response = user_api_client.get(
+            path=reverse_lazy("v1:users-lookup"),
+            data={"search": "ysolde"},
+        )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert response.data[0].keys() == {
+        "id",
+        "first_name",
+        "last_name",
+        "email",
+        "avatar",
+    }
+    assert response.data[0]["id"] == looked_up_users[2].pk
+
+
+def test_lookup_requires_search(user_api_client: test.APIClient):
+    """Test that search param is required for lookup."""
+    response: Response = user_api_client.get(
+        path=reverse_lazy("v1:users-lookup"),
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data["errors"][0]["attr"] == "search"
+
+
+@pytest.mark.usefixtures("looked_up_users")
+def test_lookup_uses_indexes():
+    """Test that lookup query uses trigram indexes."""
+    queryset = services.lookup_users(
+        queryset=models.User.objects.all(),
+        search="zorvan quillfeather",
+    )
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_seqscan = off")
+    plan = queryset.explain()
+    assert "user_first_name_trgm_idx" in plan
+    assert "user_last_name_trgm_idx" in plan
+    assert "user_email_trgm_idx" in plan
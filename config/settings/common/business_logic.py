@@ -1 +1,71 @@
 # This file holds settings specific to the project
+from datetime import timedelta
+
+# Text search configuration of full-text search vectors and queries. Simple
+# configuration doesn't stem words, since texts may be in any language.
+# Setting is bound to migrations: stored `search_vector` columns are
+# generated by database with configuration written to migration (check
+# `assignment` migration 0006), while queries read this setting. Changing it
+# requires a new migration regenerating the columns (`makemigrations` detects
+# it), otherwise queries won't match stored vectors
+FULL_TEXT_SEARCH_CONFIG = "simple"
+
+# Max number of users returned by fuzzy user lookup (e.g. assignee pickers)
+USER_LOOKUP_MAX_LIMIT = 50
+
+# Resources which can be exported by export jobs, mapped to viewsets with
+# `export` action (check `apps.core.api.mixins.ExportMixin`)
+EXPORT_JOB_RESOURCES = {
+    "tasks": "apps.assignment.api.views.TaskViewSet",
+    "assignments": "apps.assignment.api.views.AssignmentViewSet",
+}
+# Seconds for which completed export job is reused by the same export request
+EXPORT_JOB_REUSE_TIMEOUT = 10 * 60
+# Seconds after which queued or running export job is considered lost
+EXPORT_JOB_TIMEOUT = 60 * 60
+# Seconds for which presigned download link of export file is valid
+EXPORT_JOB_URL_EXPIRE = 60 * 60
+
+# Seconds after which ETag and Last-Modified of conditional GET are renewed
+# even if data wasn't changed. Responses contain presigned file links, which
+# expire in an hour (`AWS_QUERYSTRING_EXPIRE`), so they are renewed earlier
+CONDITIONAL_GET_VALIDATORS_TTL = 30 * 60
+
+# Seconds to cache data of list and detail responses, cached data is also
+# invalidated on any change of models it depends on
+RESPONSE_CACHE_TIMEOUT = 5 * 60
+
+# Max length of time window of calendar
+CALENDAR_MAX_WINDOW = timedelta(days=366)
+
+# How long before deadline of assignment or end of task reminders are sent to
+# assignees. Each window gives at most one reminder per user and object
+DEADLINE_REMINDER_WINDOWS = (
+    timedelta(hours=1),
+    timedelta(days=1),
+)
+# Number of reminders which are recorded and sent at once
+DEADLINE_REMINDER_BATCH_SIZE = 500
+# Minutes between runs of periodic task which sends deadline reminders
+DEADLINE_REMINDER_INTERVAL = 10
+
+# Default length of time window of status analytics of assignments
+STATUS_ANALYTICS_DEFAULT_WINDOW = timedelta(days=30)
+
+# Max number of upcoming assignments and open tasks of each status shown on
+# dashboard of user
+DASHBOARD_ITEMS_LIMIT = 10
+# Seconds to cache dashboard of user, it's also invalidated on any change of
+# tasks, assignments or users
+DASHBOARD_CACHE_TIMEOUT = 60
+
+# Max number of tasks moved to new status by ids in a single request
+TASK_TRANSITION_MAX_IDS = 1000
+
+# Max number of objects retrieved by a single batch-get request
+BATCH_RETRIEVE_MAX_IDS = 100
+
+# Assignments with more tasks are deleted asynchronously in batches of
+# `ASSIGNMENT_DELETE_BATCH_SIZE` tasks
+ASSIGNMENT_ASYNC_DELETE_THRESHOLD = 1000
+ASSIGNMENT_DELETE_BATCH_SIZE = 1000
@@ -1,3 +1,7 @@
+from datetime import timedelta
+
+from .business_logic import DEADLINE_REMINDER_INTERVAL
+
 CELERY_TASK_SERIALIZER = "pickle"
 CELERY_ACCEPT_CONTENT = ["pickle", "json"]
 
@@ -15,3 +19,12 @@ CELERY_BROKER_TRANSPORT_OPTIONS = {
     "socket_timeout": 5,
     "global_keyprefix": "bika:",
 }
+
+# Periodic tasks, `django_celery_beat` scheduler syncs them to database
+# https://docs.celeryq.dev/en/stable/userguide/periodic-tasks.html
+CELERY_BEAT_SCHEDULE = {
+    "send-deadline-reminders": {
+        "task": "apps.assignment.tasks.send_deadline_reminders",
+        "schedule": timedelta(minutes=DEADLINE_REMINDER_INTERVAL),
+    },
+}
@@ -17,14 +17,19 @@ REST_FRAMEWORK = {
     # In order to be secure, all permissions are disabled by default
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAdminUser",),
     "DEFAULT_RENDERER_CLASSES": (
-        "rest_framework.renderers.JSONRenderer",
+        "libs.api.renderers.ORJSONRenderer",
         "libs.api.renderers.CustomBrowsableAPIRenderer",
     ),
-    "DEFAULT_SCHEMA_CLASS": "drf_standardized_errors.openapi.AutoSchema",
+    "DEFAULT_PARSER_CLASSES": (
+        "libs.api.renderers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
+    "DEFAULT_SCHEMA_CLASS": "libs.open_api.schema.AutoSchema",
     "DEFAULT_FILTER_BACKENDS": (
         "libs.api.filter_backends.CustomDjangoFilterBackend",
         "libs.open_api.filters.OrderingFilterBackend",
-        "libs.open_api.filters.SearchFilterBackend",
+        "libs.open_api.filters.FullTextSearchFilterBackend",
     ),
     "DEFAULT_PAGINATION_CLASS": (
         "libs.api.pagination.CustomLimitOffsetPagination"
@@ -36,6 +41,10 @@ REST_FRAMEWORK = {
 
 # Limit max objects in list APIs
 MAX_PAGINATION_SIZE = 100
+# Seconds to cache counts of filtered lists requested with `?count=estimated`
+PAGINATION_COUNT_CACHE_TIMEOUT = 60
+# Rows fetched from database (and streamed) per chunk when exporting lists
+EXPORT_CHUNK_SIZE = 2000
 
 # https://drf-spectacular.readthedocs.io/en/latest/settings.html
 SPECTACULAR_SETTINGS = {
@@ -59,6 +68,8 @@ SPECTACULAR_SETTINGS = {
         "ErrorCode415Enum": "drf_standardized_errors.openapi_serializers.ErrorCode415Enum.choices",
         "ErrorCode429Enum": "drf_standardized_errors.openapi_serializers.ErrorCode429Enum.choices",
         "ErrorCode500Enum": "drf_standardized_errors.openapi_serializers.ErrorCode500Enum.choices",
+        "TaskStatusEnum": "apps.assignment.constants.TaskStatus",
+        "ExportJobStatusEnum": "apps.exports.constants.ExportJobStatus",
     },
     "SERVE_INCLUDE_SCHEMA": False,
     "SERVE_PERMISSIONS": [
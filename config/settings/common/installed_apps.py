@@ -32,6 +32,7 @@ LOCAL_APPS = (
     "apps.auth",
     "apps.users",
     "apps.assignment",
+    "apps.exports",
 )
 
 INSTALLED_APPS += DRF_PACKAGES + THIRD_PARTY + HEALTH_CHECKS_APPS + LOCAL_APPS
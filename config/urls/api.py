@@ -1,6 +1,7 @@
 from django.urls import include, path
 
 import apps.assignment.api.urls
+import apps.exports.api.urls
 
 app_name = "api"
 
@@ -10,4 +11,5 @@ urlpatterns = [
     path("users/", include("apps.users.api.urls")),
     path("auth/", include("apps.auth.api.urls")),
     *apps.assignment.api.urls.urlpatterns,
+    *apps.exports.api.urls.urlpatterns,
 ]
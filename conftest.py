@@ -3,6 +3,7 @@
 import collections.abc
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.storage import default_storage
 
 import pytest
@@ -31,6 +32,14 @@ def pytest_configure() -> None:
     # To separate test files from prod files
     settings.AWS_LOCATION = "test-files"
 
+    # To isolate cache of tests from redis and from each other, check
+    # `_clear_cache`
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        },
+    }
+
 
 @pytest.fixture(scope="session", autouse=True)
 def django_db_setup(django_db_setup) -> None:  # noqa: ANN001
@@ -42,6 +51,13 @@ def _enable_db_access_for_all_tests(django_db_setup, db) -> None:  # noqa: ANN00
     """Enable access to DB for all tests."""
 
 
+@pytest.fixture(autouse=True)
+def _clear_cache() -> collections.abc.Generator[None]:
+    """Clear cache after each test."""
+    yield
+    cache.clear()
+
+
 @pytest.fixture(scope="session")
 def _clean_up_test_files() -> collections.abc.Generator[None]:
     """Clear test files after finishing tests."""
@@ -0,0 +1,282 @@
+import collections.abc
+import csv
+import io
+import itertools
+import tempfile
+import typing
+
+from django.db import models
+
+from rest_framework import serializers
+
+import openpyxl
+import orjson
+import pyarrow
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from pyarrow import parquet
+
+from .renderers import ORJSONRenderer
+
+Rows = collections.abc.Iterable[dict]
+
+
+class ExportFormat(models.TextChoices):
+    """Formats of exported lists."""
+
+    NDJSON = "ndjson", "NDJSON"
+    CSV = "csv", "CSV"
+    XLSX = "xlsx", "XLSX"
+    PARQUET = "parquet", "Parquet"
+
+
+CONTENT_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.XLSX: (
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    ),
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+}
+
+# Size of chunks in which saved XLSX workbook is read
+XLSX_READ_SIZE = 64 * 1024
+
+# Parquet types of columns by serializer fields, other fields are written
+# as strings (non-scalar values as JSON, same as for CSV)
+PARQUET_TYPES: tuple[tuple[type[serializers.Field], pyarrow.DataType], ...] = (
+    (serializers.BooleanField, pyarrow.bool_()),
+    (serializers.IntegerField, pyarrow.int64()),
+    (serializers.PrimaryKeyRelatedField, pyarrow.int64()),
+    (serializers.FloatField, pyarrow.float64()),
+)
+
+
+class Echo:
+    """File-like object which returns written value instead of storing it.
+
+    Allows to stream output of `csv.writer` without buffering it.
+
+    """
+
+    def write(self, value: str) -> str:
+        """Return value to be yielded."""
+        return value
+
+
+class ChunkBuffer(io.RawIOBase):
+    """Write-only file which keeps written data until it's popped.
+
+    Allows to stream output of writers, which need a file and its position
+    (like `parquet.ParquetWriter`), by parts.
+
+    """
+
+    def __init__(self) -> None:
+        """Set up empty buffer."""
+        super().__init__()
+        self.chunks: list[bytes] = []
+        self.position = 0
+
+    def writable(self) -> bool:
+        """Buffer is writable."""
+        return True
+
+    def write(self, data: bytes) -> int:
+        """Keep written data."""
+        chunk = bytes(data)
+        self.chunks.append(chunk)
+        self.position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        """Return number of bytes written so far."""
+        return self.position
+
+    def pop(self) -> bytes:
+        """Return data written since previous pop."""
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def iter_ndjson(
+    rows: Rows,
+    chunk_size: int,
+) -> collections.abc.Iterator[bytes]:
+    """Render rows as JSON lines, yielding every `chunk_size` rows."""
+    renderer = ORJSONRenderer()
+    lines = []
+    for row in rows:
+        lines.append(renderer.render(row))
+        if len(lines) >= chunk_size:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+def iter_csv(
+    rows: Rows,
+    field_names: list[str],
+    chunk_size: int,
+) -> collections.abc.Iterator[bytes]:
+    """Render rows as CSV, yielding every `chunk_size` rows.
+
+    Nested serializers are flattened into columns named by dotted paths (see
+    `get_field_names`), other non-scalar values are written as JSON.
+
+    """
+    writer = csv.writer(Echo())
+    paths = [field_name.split(".") for field_name in field_names]
+    lines = [writer.writerow(field_names)]
+    for row in rows:
+        lines.append(
+            writer.writerow(
+                to_csv_value(get_value(row, path)) for path in paths
+            ),
+        )
+        if len(lines) >= chunk_size:
+            yield "".join(lines).encode()
+            lines = []
+    if lines:
+        yield "".join(lines).encode()
+
+
+def iter_xlsx(
+    rows: Rows,
+    field_names: list[str],
+) -> collections.abc.Iterator[bytes]:
+    """Render rows as XLSX workbook with columns same as for CSV.
+
+    Rows are appended to write-only workbook, which keeps them in temporary
+    files instead of memory. Workbook is saved to temporary file at the end
+    and yielded by `XLSX_READ_SIZE` bytes.
+
+    """
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    paths = [field_name.split(".") for field_name in field_names]
+    sheet.append(field_names)
+    for row in rows:
+        sheet.append([to_xlsx_value(get_value(row, path)) for path in paths])
+    with tempfile.TemporaryFile() as file:
+        workbook.save(file)
+        file.seek(0)
+        while chunk := file.read(XLSX_READ_SIZE):
+            yield chunk
+
+
+def iter_parquet(
+    rows: Rows,
+    schema: pyarrow.Schema,
+    chunk_size: int,
+) -> collections.abc.Iterator[bytes]:
+    """Render rows as Parquet file, yielding row group of `chunk_size` rows.
+
+    Columns are named same as for CSV, their types are taken from `schema`
+    (check `get_parquet_schema`).
+
+    """
+    paths = [field_name.split(".") for field_name in schema.names]
+    converters = [
+        to_parquet_value if pyarrow.types.is_string(field.type) else None
+        for field in schema
+    ]
+    rows = iter(rows)
+    buffer = ChunkBuffer()
+    with parquet.ParquetWriter(buffer, schema) as writer:
+        while batch := list(itertools.islice(rows, chunk_size)):
+            columns = [
+                [
+                    get_value(row, path)
+                    if converter is None
+                    else converter(get_value(row, path))
+                    for row in batch
+                ]
+                for path, converter in zip(paths, converters, strict=True)
+            ]
+            writer.write_batch(
+                pyarrow.record_batch(columns, schema=schema),
+            )
+            yield buffer.pop()
+    yield buffer.pop()
+
+
+def get_fields(
+    serializer: serializers.Serializer,
+    prefix: str = "",
+) -> list[tuple[str, serializers.Field]]:
+    """Get fields of exported columns, nested ones are flattened.
+
+    Columns are named by dotted paths of fields.
+
+    """
+    fields = []
+    for field in serializer.fields.values():
+        if field.write_only:
+            continue
+        field_name = f"{prefix}{field.field_name}"
+        if isinstance(field, serializers.Serializer):
+            fields.extend(get_fields(field, f"{field_name}."))
+        else:
+            fields.append((field_name, field))
+    return fields
+
+
+def get_field_names(serializer: serializers.Serializer) -> list[str]:
+    """Get names of CSV columns for serializer, nested ones are flattened."""
+    return [field_name for field_name, _ in get_fields(serializer)]
+
+
+def get_parquet_schema(serializer: serializers.Serializer) -> pyarrow.Schema:
+    """Get schema of Parquet file with columns same as for CSV."""
+    return pyarrow.schema(
+        [
+            (field_name, get_parquet_type(field))
+            for field_name, field in get_fields(serializer)
+        ],
+    )
+
+
+def get_parquet_type(field: serializers.Field) -> pyarrow.DataType:
+    """Get Parquet type of column by its serializer field."""
+    for field_class, parquet_type in PARQUET_TYPES:
+        if isinstance(field, field_class):
+            return parquet_type
+    return pyarrow.string()
+
+
+def get_value(row: dict, path: list[str]) -> typing.Any:
+    """Get value of nested field of row, `None` if parent object is empty."""
+    value: typing.Any = row
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def to_csv_value(value: typing.Any) -> typing.Any:
+    """Convert represented value to CSV cell."""
+    if isinstance(value, dict | list):
+        return orjson.dumps(value).decode()
+    return value
+
+
+def to_xlsx_value(value: typing.Any) -> typing.Any:
+    """Convert represented value to XLSX cell.
+
+    Control characters, which are not allowed in XLSX, are removed.
+
+    """
+    value = to_csv_value(value)
+    if isinstance(value, str):
+        return ILLEGAL_CHARACTERS_RE.sub("", value)
+    return value
+
+
+def to_parquet_value(value: typing.Any) -> str | None:
+    """Convert represented value to Parquet string column."""
+    if value is None:
+        return None
+    return str(to_csv_value(value))
@@ -1,9 +1,563 @@
+import base64
+import binascii
+import hashlib
+import json
+import typing
+
 from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet, FieldDoesNotExist
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import connections, models
+from django.utils.encoding import force_str
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination, LimitOffsetPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class CountMode(models.TextChoices):
+    """Ways of counting objects for limit offset pagination."""
+
+    EXACT = "exact", "Exact"
+    ESTIMATED = "estimated", "Estimated"
+    NONE = "none", "None"
+
+
+class Cursor(typing.NamedTuple):
+    """Position of keyset pagination page."""
+
+    # Values of ordering fields of the last (or first) object of page,
+    # empty for the edge of list (reverse cursor from the end of list)
+    position: list[typing.Any]
+    # Whether page is before the position (previous page)
+    reverse: bool
+
+
+class KeysetPagination(BasePagination):
+    """Paginator which fetches pages by values of ordering fields.
+
+    Next page is fetched with `WHERE (field, id) > (last values)` condition
+    instead of `OFFSET`, so deep pages are as fast as the first one and
+    total count is not calculated. `pk` is always added to ordering, so
+    objects with the same values of ordering fields are paginated stably.
+    Nulls are ordered last.
+
+    """
+
+    cursor_query_param = "cursor"
+    cursor_query_description = _("The pagination cursor value.")
+    limit_query_param = "limit"
+    limit_query_description = _("Number of results to return per page.")
+    default_limit = api_settings.PAGE_SIZE
+    max_limit = settings.MAX_PAGINATION_SIZE
+    default_ordering = ("-pk",)
+    invalid_cursor_message = _("Invalid cursor")
+    unsupported_ordering_message = _(
+        "Ordering is not supported by cursor pagination.",
+    )
+
+    def paginate_queryset(
+        self,
+        queryset: models.QuerySet,
+        request: Request,
+        view: typing.Any = None,
+    ) -> list:
+        """Get page of objects after (or before) cursor position."""
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.ordering = self.get_ordering(queryset)
+        cursor = self.decode_cursor(request)
+        reverse = cursor.reverse if cursor else False
+
+        if cursor and cursor.position:
+            try:
+                queryset = queryset.filter(
+                    self.get_position_filter(queryset.model, cursor),
+                )
+            except (DjangoValidationError, TypeError, ValueError) as error:
+                raise NotFound(self.invalid_cursor_message) from error
+        queryset = queryset.order_by(
+            *(
+                self._get_order_by(
+                    field,
+                    descending=descending != reverse,
+                    nulls_first=reverse,
+                    nullable=self._is_nullable(queryset.model, field),
+                )
+                for field, descending in self.ordering
+            ),
+        )
+        results = list(queryset[: self.limit + 1])
+        has_more = len(results) > self.limit
+        results = results[: self.limit]
+        if reverse:
+            results.reverse()
+
+        self.has_next = has_more if not reverse else bool(cursor.position)
+        self.has_previous = bool(cursor) if not reverse else has_more
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data: list) -> Response:
+        """Return page with links to next and previous pages."""
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            },
+        )
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        """Describe paginated response for openapi."""
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {
+                    "type": "string",
+                    "nullable": True,
+                    "format": "uri",
+                    "example": "http://api.example.org/accounts/"
+                    f"?{self.cursor_query_param}=eyJwIjogWzFdfQ",
+                },
+                "previous": {
+                    "type": "string",
+                    "nullable": True,
+                    "format": "uri",
+                    "example": "http://api.example.org/accounts/"
+                    f"?{self.cursor_query_param}=eyJwIjogWzJdfQ",
+                },
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view: typing.Any) -> list:
+        """Describe query params of pagination for openapi."""
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": force_str(self.cursor_query_description),
+                "schema": {
+                    "type": "string",
+                },
+            },
+            {
+                "name": self.limit_query_param,
+                "required": False,
+                "in": "query",
+                "description": force_str(self.limit_query_description),
+                "schema": {
+                    "type": "integer",
+                },
+            },
+        ]
+
+    def get_limit(self, request: Request) -> int:
+        """Get page size from query params."""
+        try:
+            limit = int(request.query_params[self.limit_query_param])
+        except (KeyError, ValueError):
+            return self.default_limit
+        if limit <= 0:
+            return self.default_limit
+        return min(limit, self.max_limit)
+
+    def get_next_link(self) -> str | None:
+        """Get link to page after the last object."""
+        if not self.has_next:
+            return None
+        if not self.page:
+            # Nothing found before reverse cursor, so next page is the first
+            return remove_query_param(
+                self.request.build_absolute_uri(),
+                self.cursor_query_param,
+            )
+        return self.encode_cursor(
+            Cursor(position=self._get_position(self.page[-1]), reverse=False),
+        )
+
+    def get_previous_link(self) -> str | None:
+        """Get link to page before the first object."""
+        if not self.has_previous:
+            return None
+        if not self.page:
+            # Nothing found after cursor, so previous page is the last page
+            return self.encode_cursor(Cursor(position=[], reverse=True))
+        return self.encode_cursor(
+            Cursor(position=self._get_position(self.page[0]), reverse=True),
+        )
+
+    def get_ordering(
+        self,
+        queryset: models.QuerySet,
+    ) -> list[tuple[str, bool]]:
+        """Get ordering of queryset as pairs of field and descending flag.
+
+        Ordering is taken from queryset (ordered by `OrderingFilter`) or from
+        `default_ordering`, `pk` is added as a tiebreaker.
+
+        """
+        ordering = []
+        for term in queryset.query.order_by or self.default_ordering:
+            if not isinstance(term, str):
+                raise ValidationError(self.unsupported_ordering_message)
+            field = term.removeprefix("-")
+            if field in ("pk", "id"):
+                continue
+            ordering.append((field, term.startswith("-")))
+        ordering.append(("pk", ordering[0][1] if ordering else True))
+        return ordering
 
-from rest_framework.pagination import LimitOffsetPagination
+    def get_position_filter(
+        self,
+        model: type[models.Model],
+        cursor: Cursor,
+    ) -> models.Q:
+        """Get filter of objects after (or before) position.
+
+        For ordering by `a, b` condition is
+        `a > a_value OR (a = a_value AND b > b_value)`, where `>` is `<`
+        for descending fields and for nullable fields nulls are placed last.
+
+        """
+        position_filter = models.Q(pk__in=[])
+        equal_filter = models.Q()
+        for (field, descending), value in zip(
+            self.ordering,
+            cursor.position,
+            strict=True,
+        ):
+            nulls_first = cursor.reverse
+            nullable = self._is_nullable(model, field)
+            if value is None:
+                after_filter = (
+                    models.Q(**{f"{field}__isnull": False})
+                    if nulls_first
+                    else models.Q(pk__in=[])
+                )
+                value_filter = models.Q(**{f"{field}__isnull": True})
+            else:
+                lookup = "lt" if descending != cursor.reverse else "gt"
+                after_filter = models.Q(**{f"{field}__{lookup}": value})
+                if nullable and not nulls_first:
+                    after_filter |= models.Q(**{f"{field}__isnull": True})
+                value_filter = models.Q(**{field: value})
+            position_filter |= equal_filter & after_filter
+            equal_filter &= value_filter
+        return position_filter
+
+    def decode_cursor(self, request: Request) -> Cursor | None:
+        """Get cursor from query params."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            data = json.loads(
+                base64.urlsafe_b64decode(encoded.encode("ascii")),
+            )
+            cursor = Cursor(position=data["p"], reverse=bool(data["r"]))
+        except (
+            binascii.Error,
+            KeyError,
+            TypeError,
+            UnicodeError,
+            ValueError,
+        ) as error:
+            raise NotFound(self.invalid_cursor_message) from error
+        if not isinstance(cursor.position, list):
+            raise NotFound(self.invalid_cursor_message)
+        # Empty position is allowed only for reverse cursor from the end
+        is_end = not cursor.position and cursor.reverse
+        if len(cursor.position) != len(self.ordering) and not is_end:
+            raise NotFound(self.invalid_cursor_message)
+        return cursor
+
+    def encode_cursor(self, cursor: Cursor) -> str:
+        """Get url with encoded cursor."""
+        data = json.dumps(
+            {"p": cursor.position, "r": cursor.reverse},
+            default=str,
+        )
+        encoded = base64.urlsafe_b64encode(data.encode()).decode("ascii")
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
+    def _get_position(
+        self,
+        obj: models.Model | dict,
+    ) -> list[typing.Any]:
+        """Get values of ordering fields of object (or row of `values()`)."""
+        if isinstance(obj, dict):
+            return [obj[field] for field, _descending in self.ordering]
+        position = []
+        for field, _descending in self.ordering:
+            value = obj
+            for attr in field.split("__"):
+                value = getattr(value, attr, None)
+            if isinstance(value, models.Model):
+                value = value.pk
+            position.append(value)
+        return position
+
+    def _get_order_by(
+        self,
+        field: str,
+        descending: bool,
+        nulls_first: bool,
+        nullable: bool,
+    ) -> models.OrderBy:
+        """Get order by expression with explicit placement of nulls.
+
+        Placement of nulls is set only for nullable fields, since default
+        placement for descending ordering allows backward index scan.
+
+        """
+        if not nullable:
+            return models.OrderBy(models.F(field), descending=descending)
+        return models.OrderBy(
+            models.F(field),
+            descending=descending,
+            nulls_first=nulls_first or None,
+            nulls_last=not nulls_first or None,
+        )
+
+    def _is_nullable(self, model: type[models.Model], field: str) -> bool:
+        """Check whether field (may be related or annotation) is nullable."""
+        if field == "pk":
+            return False
+        nullable = False
+        try:
+            for attr in field.split("__"):
+                model_field = model._meta.get_field(attr)
+                nullable = nullable or model_field.null
+                model = model_field.related_model
+        except (AttributeError, FieldDoesNotExist):
+            return True
+        return nullable
 
 
 class CustomLimitOffsetPagination(LimitOffsetPagination):
-    """Customized paginator class to limit max objects in list APIs."""
+    """Customized paginator class to limit max objects in list APIs.
+
+    Keyset pagination is used instead, if it's requested with
+    `?pagination=cursor`.
+
+    Exact count of objects can be replaced with a cheaper one with
+    `?count=`:
+        `estimated` - planner estimate of table size for not filtered
+            queryset and count cached for `COUNT_CACHE_TIMEOUT` for
+            filtered one.
+        `none` - count isn't calculated at all.
+    In these modes `next` link is based on fetching one extra object and
+    response's `count_is_exact` is false unless count was just calculated.
+
+    """
 
     max_limit = settings.MAX_PAGINATION_SIZE
+    pagination_query_param = "pagination"
+    pagination_query_description = _(
+        "Pagination style: `offset` (default) or `cursor`. Cursor "
+        "pagination doesn't return `count`, but deep pages are fast.",
+    )
+    count_query_param = "count"
+    count_query_description = _(
+        "How to count objects: `exact` (default), `estimated` (planner "
+        "estimate or recently cached count) or `none`.",
+    )
+    count_cache_timeout = settings.PAGINATION_COUNT_CACHE_TIMEOUT
+    cursor_pagination_class = KeysetPagination
+    cursor_paginator: KeysetPagination | None = None
+    count_is_exact = True
+    has_next = False
+    # Exact count of paginated queryset, if view has already calculated it
+    # (check `apps.core.api.mixins.ConditionalGetMixin`)
+    known_count: int | None = None
+
+    def paginate_queryset(
+        self,
+        queryset: models.QuerySet,
+        request: Request,
+        view: typing.Any = None,
+    ) -> list | None:
+        """Paginate with keyset pagination or count mode if requested."""
+        self.cursor_paginator = None
+        if request.query_params.get(self.pagination_query_param) == "cursor":
+            self.cursor_paginator = self.cursor_pagination_class()
+            return self.cursor_paginator.paginate_queryset(
+                queryset,
+                request,
+                view,
+            )
+        self.count_is_exact = True
+        count_mode = request.query_params.get(self.count_query_param)
+        if count_mode not in (CountMode.ESTIMATED, CountMode.NONE):
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+        self.offset = self.get_offset(request)
+        self.count, self.count_is_exact = (
+            self.get_estimated_count(queryset)
+            if count_mode == CountMode.ESTIMATED
+            else (None, False)
+        )
+        results = list(queryset[self.offset : self.offset + self.limit + 1])
+        self.has_next = len(results) > self.limit
+        return results[: self.limit]
+
+    def is_exact_count_requested(self, request: Request) -> bool:
+        """Check whether list is paginated with exact count of objects."""
+        return request.query_params.get(
+            self.pagination_query_param,
+        ) != "cursor" and request.query_params.get(
+            self.count_query_param,
+        ) not in (CountMode.ESTIMATED, CountMode.NONE)
+
+    def get_count(self, queryset: models.QuerySet) -> int:
+        """Count objects, unless count is already known."""
+        if self.known_count is not None:
+            return self.known_count
+        return super().get_count(queryset)
+
+    def get_paginated_response(self, data: list) -> Response:
+        """Return response of used paginator."""
+        if self.cursor_paginator:
+            return self.cursor_paginator.get_paginated_response(data)
+        return Response(
+            {
+                "count": self.count,
+                "count_is_exact": self.count_is_exact,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            },
+        )
+
+    def get_next_link(self) -> str | None:
+        """Get link to next page, use extra object if count isn't exact."""
+        if self.count_is_exact:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        return replace_query_param(
+            url,
+            self.offset_query_param,
+            self.offset + self.limit,
+        )
+
+    def get_estimated_count(
+        self,
+        queryset: models.QuerySet,
+    ) -> tuple[int, bool]:
+        """Get estimated count and whether it is exact.
+
+        For not filtered queryset planner estimate of table size is used, if
+        table was never analyzed yet, queryset is counted.
+
+        For filtered queryset count is cached by its SQL, which includes all
+        filters and search, so the same list is counted once in a while.
+
+        """
+        if not queryset.query.where and not queryset.query.distinct:
+            estimate = self.get_table_estimate(queryset)
+            if estimate is not None:
+                return estimate, False
+            return self.get_count(queryset), True
+
+        try:
+            sql, params = queryset.order_by().query.sql_with_params()
+        except EmptyResultSet:
+            return 0, True
+        cache_key = "pagination-count:" + (
+            hashlib.sha256(f"{sql}{params!r}".encode()).hexdigest()
+        )
+        count = cache.get(cache_key)
+        if count is not None:
+            return count, False
+        count = self.get_count(queryset)
+        cache.set(cache_key, count, timeout=self.count_cache_timeout)
+        return count, True
+
+    def get_table_estimate(self, queryset: models.QuerySet) -> int | None:
+        """Get planner estimate of number of rows in queryset's table."""
+        connection = connections[queryset.db]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                [connection.ops.quote_name(queryset.model._meta.db_table)],
+            )
+            row = cursor.fetchone()
+        # Table which was never vacuumed or analyzed has -1 estimate
+        if row is None or row[0] < 0:
+            return None
+        return int(row[0])
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        """Describe response of both limit offset and keyset pagination."""
+        paginated_schema = super().get_paginated_response_schema(schema)
+        paginated_schema["required"] = ["results"]
+        paginated_schema["properties"]["count"].update(
+            nullable=True,
+            description="Total number of objects. Not returned for cursor "
+            "pagination, null if counting is skipped with `count=none`.",
+        )
+        paginated_schema["properties"]["count_is_exact"] = {
+            "type": "boolean",
+            "description": "Whether `count` is exact, it is an estimate or "
+            "recently cached count otherwise. Not returned for cursor "
+            "pagination.",
+        }
+        return paginated_schema
+
+    def get_schema_operation_parameters(self, view: typing.Any) -> list:
+        """Describe query params of both paginations for openapi."""
+        parameters = super().get_schema_operation_parameters(view)
+        parameter_names = {parameter["name"] for parameter in parameters}
+        parameters.append(
+            {
+                "name": self.count_query_param,
+                "required": False,
+                "in": "query",
+                "description": force_str(self.count_query_description),
+                "schema": {
+                    "type": "string",
+                    "enum": CountMode.values,
+                },
+            },
+        )
+        parameters.append(
+            {
+                "name": self.pagination_query_param,
+                "required": False,
+                "in": "query",
+                "description": force_str(self.pagination_query_description),
+                "schema": {
+                    "type": "string",
+                    "enum": ["offset", "cursor"],
+                },
+            },
+        )
+        cursor_parameters = (
+            self.cursor_pagination_class().get_schema_operation_parameters(
+                view,
+            )
+        )
+        parameters.extend(
+            parameter
+            for parameter in cursor_parameters
+            if parameter["name"] not in parameter_names
+        )
+        return parameters
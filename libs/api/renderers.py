@@ -1,5 +1,78 @@
-from rest_framework import renderers
+import typing
+
+from django.conf import settings
+
+from rest_framework import parsers, renderers
+from rest_framework.exceptions import ParseError
 from rest_framework.request import override_method
+from rest_framework.utils import encoders
+
+import orjson
+
+
+class ORJSONRenderer(renderers.JSONRenderer):
+    """JSON renderer which uses orjson for encoding.
+
+    orjson natively encodes datetimes, UUIDs and subclasses of dict and list
+    (like `ReturnDict` and `ReturnList`), everything else (decimals, lazy
+    translation strings, querysets etc) is converted the same way as by
+    drf's encoder. Indentation is requested by browsable api and `indent`
+    media type param, but orjson supports only 2 spaces.
+
+    """
+
+    options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+    default_encoder = encoders.JSONEncoder()
+
+    def render(
+        self,
+        data: typing.Any,
+        accepted_media_type: str | None = None,
+        renderer_context: dict | None = None,
+    ) -> bytes:
+        """Render `data` into JSON."""
+        if data is None:
+            return b""
+        options = self.options
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            options |= orjson.OPT_INDENT_2
+        content = orjson.dumps(
+            data,
+            default=self.default_encoder.default,
+            option=options,
+        )
+        # Escape line and paragraph separators the same way as drf does, so
+        # JSON is a strict javascript subset
+        return content.replace(
+            "\u2028".encode(),
+            b"\\u2028",
+        ).replace(
+            "\u2029".encode(),
+            b"\\u2029",
+        )
+
+
+class ORJSONParser(parsers.JSONParser):
+    """JSON parser which uses orjson for decoding."""
+
+    def parse(
+        self,
+        stream: typing.IO[bytes],
+        media_type: str | None = None,
+        parser_context: dict | None = None,
+    ) -> typing.Any:
+        """Parse incoming bytestream as JSON and return resulting data."""
+        encoding = (parser_context or {}).get(
+            "encoding",
+            settings.DEFAULT_CHARSET,
+        )
+        try:
+            content = stream.read()
+            if encoding.lower().replace("-", "") != "utf8":
+                content = content.decode(encoding)
+            return orjson.loads(content)
+        except (orjson.JSONDecodeError, UnicodeDecodeError) as error:
+            raise ParseError(f"JSON parse error - {error}") from error
 
 
 class CustomBrowsableAPIRenderer(renderers.BrowsableAPIRenderer):
@@ -0,0 +1,83 @@
+import collections.abc
+import time
+
+from django.core.cache import cache
+from django.db import models, transaction
+
+GENERATION_KEY_PREFIX = "response-cache-generation"
+METRICS_KEY_PREFIX = "response-cache-metrics"
+
+
+def get_generation_key(model: type[models.Model]) -> str:
+    """Get cache key of generation of model."""
+    return f"{GENERATION_KEY_PREFIX}:{model._meta.label_lower}"
+
+
+def get_generations(
+    models_: collections.abc.Sequence[type[models.Model]],
+) -> list[int]:
+    """Get current generations of models with a single cache request.
+
+    Missing generation (never bumped or evicted) is initialized with current
+    time in nanoseconds, so it's greater than any generation it had before
+    and responses cached for old generations aren't used.
+
+    """
+    keys = [get_generation_key(model) for model in models_]
+    generations = cache.get_many(keys)
+    for key in keys:
+        if key not in generations:
+            cache.add(key, time.time_ns(), timeout=None)
+            generations[key] = cache.get(key)
+    return [generations[key] for key in keys]
+
+
+def bump_generation(model: type[models.Model]) -> None:
+    """Increment generation of model, which invalidates cached responses."""
+    key = get_generation_key(model)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), timeout=None)
+
+
+def invalidate_responses(model: type[models.Model]) -> None:
+    """Invalidate responses which depend on model.
+
+    Generation is bumped right away and once again after commit, since
+    concurrent requests may cache data read before the commit.
+
+    """
+    bump_generation(model)
+    transaction.on_commit(lambda: bump_generation(model))
+
+
+def record_lookup(name: str, hit: bool) -> None:
+    """Count hit or miss of cached responses of view."""
+    key = f"{METRICS_KEY_PREFIX}:{name}:{'hit' if hit else 'miss'}"
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def get_metrics(
+    names: collections.abc.Iterable[str],
+) -> dict[str, tuple[int, int]]:
+    """Get numbers of hits and misses of cached responses of views."""
+    names = list(names)
+    counts = cache.get_many(
+        [
+            f"{METRICS_KEY_PREFIX}:{name}:{result}"
+            for name in names
+            for result in ("hit", "miss")
+        ],
+    )
+    return {
+        name: (
+            counts.get(f"{METRICS_KEY_PREFIX}:{name}:hit", 0),
+            counts.get(f"{METRICS_KEY_PREFIX}:{name}:miss", 0),
+        )
+        for name in names
+    }
@@ -1,10 +1,12 @@
 import collections
 import logging
+import smtplib
 import typing
 import urllib.error
 
 from django.conf import settings
-from django.core.mail import EmailMultiAlternatives
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.core.mail.backends.base import BaseEmailBackend
 from django.template.loader import render_to_string
 
 import html_sanitizer
@@ -153,19 +155,16 @@ class EmailNotification:
             "files": files,
         }
 
-    def send(self) -> bool:
-        """Send email.
-
-        Returns
-            True: if it succeeded
-            False: if it failed
-
-        """
+    def build_message(
+        self,
+        connection: BaseEmailBackend | None = None,
+    ) -> EmailMultiAlternatives:
+        """Build email message with html alternative and attachments."""
         email_args = self.prepare_mail_args()
         html_message = email_args.pop("html_message")
         files = email_args.pop("files")
 
-        mail = EmailMultiAlternatives(**email_args)
+        mail = EmailMultiAlternatives(connection=connection, **email_args)
         mail.attach_alternative(html_message, "text/html")
 
         # Attach files
@@ -175,15 +174,29 @@ class EmailNotification:
                 content=file.content,
                 mimetype=file.mimetype,
             )
+        return mail
+
+    def send(self, connection: BaseEmailBackend | None = None) -> bool:
+        """Send email.
+
+        Returns
+            True: if it succeeded
+            False: if it failed
+
+        """
+        mail = self.build_message(connection=connection)
 
         # Send email
         try:
             mail.send()
             self.on_email_send_succeed()
             return True
-        except urllib.error.HTTPError as error:  # pragma: no cover
+        except (
+            urllib.error.HTTPError,
+            smtplib.SMTPException,
+        ) as error:  # pragma: no cover
             logger.exception(
-                f"Error while sending email to {email_args['to']}",
+                f"Error while sending email to {mail.to}",
             )
             self.on_email_send_failed(error)
             return False
@@ -191,7 +204,10 @@ class EmailNotification:
     def on_email_send_succeed(self) -> None:
         """Perform action, when email sending succeed."""
 
-    def on_email_send_failed(self, error: urllib.error.HTTPError) -> None:
+    def on_email_send_failed(
+        self,
+        error: urllib.error.HTTPError | smtplib.SMTPException,
+    ) -> None:
         """Perform action, when email sending failed."""
 
 
@@ -203,3 +219,35 @@ class DefaultEmailNotification(EmailNotification):
     def get_formatted_subject(self) -> str:
         """Add app label to subject."""
         return f"{settings.APP_LABEL} - {self.get_subject()}"
+
+
+def send_notifications(
+    notifications: typing.Iterable[EmailNotification],
+    connection: BaseEmailBackend | None = None,
+) -> list[EmailNotification]:
+    """Send notifications over a single connection to email backend.
+
+    Opening connection (SMTP handshake, TLS, auth) usually takes longer than
+    sending message, so it's done once for all notifications. Passed
+    connection is left open, so it can be reused for several batches.
+
+    Any error of notification (e.g. broken connection or template) is logged
+    and notification is counted as failed, so caller can retry it later.
+
+    Returns
+        Notifications which failed to be sent
+
+    """
+    if connection is None:
+        with get_connection() as opened_connection:
+            return send_notifications(notifications, opened_connection)
+    failed = []
+    for notification in notifications:
+        try:
+            is_sent = notification.send(connection=connection)
+        except Exception:
+            logger.exception(f"Error while sending {notification}")
+            is_sent = False
+        if not is_sent:
+            failed.append(notification)
+    return failed
@@ -1,6 +1,14 @@
+import re
+
+from django.conf import settings
+from django.contrib.postgres.expressions import ArraySubquery
+from django.contrib.postgres.search import SearchQuery, SearchRank
 from django.core.exceptions import FieldError
+from django.db.models import F, Q, QuerySet
+from django.db.models.constants import LOOKUP_SEP
 
 from rest_framework import filters
+from rest_framework.settings import api_settings
 
 from drf_spectacular import drainage
 
@@ -111,3 +119,129 @@ class SearchFilterBackend(filters.SearchFilter):
                 "`search_fields` contains non-existent or non-related fields."
                 f" {error}",
             )
+
+
+class FullTextSearchFilterBackend(SearchFilterBackend):
+    """Search backend which uses PostgreSQL full-text search.
+
+    Views opt in by setting `search_vector_field` to the name of stored
+    `tsvector` field (with GIN index), which should cover own fields of
+    model from `search_fields`. Each word of search is matched as a prefix,
+    so search works while user is typing. Fields of forward relations from
+    `search_fields` (like `assignee__email`) are matched with `icontains`
+    as by default search. If `?ordering` is not provided, results are
+    ordered by rank.
+
+    Views without `search_vector_field` are searched as usual.
+
+    """
+
+    rank_annotation = "search_rank"
+
+    def filter_queryset(self, request, queryset: QuerySet, view) -> QuerySet:
+        """Filter queryset by search vector and rank results."""
+        search_vector_field = getattr(view, "search_vector_field", None)
+        if not search_vector_field:
+            return super().filter_queryset(request, queryset, view)
+
+        search_query = self.get_search_query(request)
+        if search_query is None:
+            return queryset
+
+        queryset = queryset.filter(
+            *self.get_search_conditions(
+                request=request,
+                queryset=queryset,
+                view=view,
+            ),
+        ).annotate(
+            **{
+                self.rank_annotation: SearchRank(
+                    F(search_vector_field),
+                    search_query,
+                ),
+            },
+        )
+        if api_settings.ORDERING_PARAM in request.query_params:
+            return queryset
+        return queryset.order_by(f"-{self.rank_annotation}", "-pk")
+
+    def get_search_query(self, request) -> SearchQuery | None:
+        """Prepare query matching all words of search as prefixes.
+
+        Only word characters are taken from search terms, so raw query
+        can't contain `tsquery` operators.
+
+        """
+        return self.build_search_query(
+            [
+                word
+                for term in self.get_search_terms(request)
+                for word in re.findall(r"\w+", term)
+            ],
+        )
+
+    def get_search_conditions(
+        self,
+        request,
+        queryset: QuerySet,
+        view,
+    ) -> list[Q]:
+        """Prepare condition for each search term.
+
+        Term matches if all its words match search vector or if any related
+        field of `search_fields` contains it. Related fields are matched by
+        `fk = ANY(ARRAY(...))` of foreign key, so conditions are resolved by
+        indexes of searched table combined with `BitmapOr`.
+
+        """
+        related_fields = [
+            field
+            for field in self.get_search_fields(view, request) or ()
+            if LOOKUP_SEP in field
+        ]
+        conditions = []
+        for term in self.get_search_terms(request):
+            term_query = self.build_search_query(re.findall(r"\w+", term))
+            if term_query is None:
+                continue
+            condition = Q(**{view.search_vector_field: term_query})
+            for field in related_fields:
+                relation, related_field = field.split(LOOKUP_SEP, 1)
+                related_model = queryset.model._meta.get_field(
+                    relation,
+                ).related_model
+                related_pks = related_model._default_manager.filter(
+                    **{f"{related_field}__icontains": term},
+                ).values("pk")
+                condition |= Q(
+                    **{f"{relation}__pk__any": ArraySubquery(related_pks)},
+                )
+            conditions.append(condition)
+        return conditions
+
+    def build_search_query(self, words: list[str]) -> SearchQuery | None:
+        """Build query matching all words as prefixes."""
+        if not words:
+            return None
+        return SearchQuery(
+            " & ".join(f"{word}:*" for word in words),
+            search_type="raw",
+            config=settings.FULL_TEXT_SEARCH_CONFIG,
+        )
+
+    def get_schema_operation_parameters(self, view):
+        """Prepare parameters for openapi schema.
+
+        Mention full-text search in description of search parameter.
+
+        """
+        operation_parameters = super().get_schema_operation_parameters(
+            view=view,
+        )
+        if getattr(view, "search_vector_field", None):
+            operation_parameters[0]["description"] += (
+                "\n\nFull-text search, words are matched by prefix. "
+                "Results are ordered by relevance unless `ordering` is set."
+            )
+        return operation_parameters
@@ -0,0 +1,64 @@
+import typing
+
+from drf_spectacular.utils import OpenApiParameter
+from drf_standardized_errors.openapi import AutoSchema as BaseAutoSchema
+
+from apps.core.api.serializers import ModelBaseSerializer
+
+
+class AutoSchema(BaseAutoSchema):
+    """Schema which documents sparse fieldsets of `ModelBaseSerializer`."""
+
+    def get_override_parameters(self) -> list:
+        """Add `fields` and `expand` params to views which support them."""
+        parameters = super().get_override_parameters()
+        action = getattr(self.view, "action", None)
+        if action not in getattr(self.view, "sparse_fieldsets_actions", ()):
+            return parameters
+        serializer = self._get_serializer()
+        if not isinstance(serializer, ModelBaseSerializer):
+            return parameters
+
+        parameters.append(
+            OpenApiParameter(
+                name=serializer.fields_param,
+                description="Comma separated list of fields to include, "
+                "other fields are omitted. Nested fields are separated by "
+                "dot. Example: `id,title,assignee_data.email`.",
+                required=False,
+                type=str,
+            ),
+        )
+        expandable_fields = getattr(serializer.Meta, "expandable_fields", ())
+        if expandable_fields:
+            formatted_fields = ", ".join(
+                f"`{field}`" for field in expandable_fields
+            )
+            parameters.append(
+                OpenApiParameter(
+                    name=serializer.expand_param,
+                    description="Comma separated list of extra fields to "
+                    f"include. Supported: {formatted_fields}.",
+                    required=False,
+                    type=str,
+                ),
+            )
+        return parameters
+
+    def get_response_serializers(self) -> typing.Any:
+        """Document batch-get responses as objects keyed by id.
+
+        Serializer of objects is known only for concrete view, so schema of
+        `BatchRetrieveMixin.batch_get` is built here.
+
+        """
+        if getattr(self.view, "action", None) != "batch_get":
+            return super().get_response_serializers()
+        component = self.resolve_serializer(self._get_serializer(), "response")
+        return {
+            "200": {
+                "type": "object",
+                "additionalProperties": component.ref,
+                "description": "Found objects keyed by id.",
+            },
+        }